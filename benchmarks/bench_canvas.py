@@ -0,0 +1,123 @@
+"""
+Benchmark de latencia de redesenho do canvas da interface (MplCanvas).
+
+Mede, com Qt offscreen, o tempo de atualizar o grafico da GUI com N pontos
+(padrao: 1000) em tres caminhos:
+
+    antes    : ax.clear() + recriar todos os artistas + tight_layout + draw
+               (o que plotar_grafico fazia a cada clique)
+    completo : MplCanvas.mostrar() com eixos/textos novos (draw completo,
+               artistas persistentes atualizados no lugar)
+    blit     : MplCanvas.mostrar() com os mesmos eixos e textos (novo ajuste
+               ou novos dados na mesma faixa): fundo em cache + blit
+
+Sai com codigo 1 se a mediana do blit exceder o alvo (padrao: 16 ms, um
+quadro a 60 Hz), para uso em CI.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_canvas.py
+    python benchmarks/bench_canvas.py --pontos 5000 --repeticoes 50 --alvo 16
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6.QtWidgets import QApplication                           # noqa: E402
+
+from src.visualization.gui import MplCanvas                          # noqa: E402
+
+
+def redesenho_antigo(canvas, x, y, ex, ey, slope, intercept, titulo) -> None:
+    """Redesenho completo como antes dos artistas persistentes."""
+    ax = canvas.axes
+    ax.clear()
+    ax.errorbar(x, y, xerr=ex, yerr=ey, fmt='o', color='red', ecolor='darkred',
+                capsize=5, markersize=8, label='Dados experimentais', zorder=5)
+    x_fit = np.array([x.min(), x.max()])
+    ax.plot(x_fit, slope * x_fit + intercept, color='blue', linewidth=2,
+            label=f'y = {slope:.3f}x + {intercept:.3f}', zorder=3)
+    ax.set_xlabel('x', fontsize=12)
+    ax.set_ylabel('y', fontsize=12)
+    ax.set_title(titulo, fontsize=14, fontweight='bold')
+    ax.legend(loc='best', fontsize=10)
+    ax.grid(True, alpha=0.3, linestyle='--')
+    canvas.fig.tight_layout()
+    canvas.draw()
+
+
+def cronometrar(funcao, repeticoes: int) -> np.ndarray:
+    tempos = []
+    for i in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao(i)
+        tempos.append(1000 * (time.perf_counter() - inicio))
+    return np.array(tempos)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--pontos', type=int, default=1000)
+    parser.add_argument('--repeticoes', type=int, default=30)
+    parser.add_argument('--alvo', type=float, default=16.0,
+                        help='Latencia maxima do blit (ms, mediana)')
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    rng = np.random.default_rng(0)
+    x = np.linspace(0.0, 100.0, args.pontos)
+    ex, ey = 0.2, 1.0
+
+    def dados(i):
+        return 2.0 * x + 1.0 + rng.normal(0.0, 1.0, x.size), 2.0 + 1e-3 * i
+
+    antigo = MplCanvas(width=8, height=6)
+    antigo.show()
+    canvas = MplCanvas(width=8, height=6)
+    canvas.show()
+    app.processEvents()
+
+    def antes(i):
+        y, slope = dados(i)
+        redesenho_antigo(antigo, x, y, ex, ey, slope, 1.0, f'Par {i}')
+
+    def completo(i):
+        y, slope = dados(i)
+        canvas.mostrar(x, y, ex, ey, f'Par {i}', 'x', 'y', reta=(slope, 1.0, 0.99))
+        assert canvas.modo_redesenho == 'completo'
+
+    def blit(i):
+        y, slope = dados(i)
+        canvas.mostrar(x, y, ex, ey, 'Par', 'x', 'y', reta=(slope, 1.0, 0.99))
+
+    tempos = {'antes': cronometrar(antes, args.repeticoes),
+              'completo': cronometrar(completo, args.repeticoes)}
+    blit(0)                                     # primeiro: draw completo
+    tempos['blit'] = cronometrar(blit, args.repeticoes)
+    modo_blit = canvas.modo_redesenho
+
+    print(f"{args.pontos} pontos, {args.repeticoes} repeticoes")
+    print(f"{'caminho':<9} {'mediana (ms)':>13} {'p95 (ms)':>9}")
+    for nome, medidas in tempos.items():
+        print(f"{nome:<9} {np.median(medidas):>13.1f} {np.percentile(medidas, 95):>9.1f}")
+
+    falhas = []
+    if modo_blit != 'blit':
+        falhas.append(f"ultimo redesenho foi '{modo_blit}', esperado 'blit'")
+    if np.median(tempos['blit']) > args.alvo:
+        falhas.append(f"blit: {np.median(tempos['blit']):.1f} ms > alvo de {args.alvo:.0f} ms")
+    for falha in falhas:
+        print(f"FALHA  {falha}")
+    sys.exit(1 if falhas else 0)
+
+
+if __name__ == '__main__':
+    main()
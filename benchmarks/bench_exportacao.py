@@ -0,0 +1,72 @@
+"""
+Benchmark da exportacao de graficos: modelo de figura reutilizado vs figura
+nova por grafico.
+
+Exporta N graficos PNG com exportar_grafico() e mede o tempo por grafico e
+o crescimento de memoria residente (RSS) ao longo da serie, nos dois modos:
+
+    nova     : limpar_modelos() antes de cada grafico (figura, eixos e
+               legenda recriados a cada chamada, como antes)
+    modelo   : ModeloFigura em cache; so os dados dos artistas mudam
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_exportacao.py
+    python benchmarks/bench_exportacao.py --graficos 2000 --pontos 50
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from src.visualization.plots import exportar_grafico, limpar_modelos    # noqa: E402
+
+
+def rss_mb() -> float:
+    """Memoria residente atual do processo (Linux: /proc/self/statm)."""
+    with open('/proc/self/statm') as arquivo:
+        paginas = int(arquivo.read().split()[1])
+    return paginas * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--graficos', type=int, default=300)
+    parser.add_argument('--pontos', type=int, default=25)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    x = np.linspace(1.0, 20.0, args.pontos)
+
+    with tempfile.TemporaryDirectory() as pasta:
+        destino = os.path.join(pasta, 'grafico')
+        # Aquecimento: importacoes, fontes e cache de texto do matplotlib
+        exportar_grafico(x, 2 * x, 0.1, 0.1, 2.0, 0.0, destino)
+
+        print(f"{args.graficos} graficos PNG, {args.pontos} pontos cada")
+        print(f"{'modo':<8} {'ms/grafico':>11} {'RSS inicial':>12} {'RSS final':>10}")
+        for modo in ('nova', 'modelo'):
+            limpar_modelos()
+            inicio_rss = rss_mb()
+            inicio = time.perf_counter()
+            for i in range(args.graficos):
+                if modo == 'nova':
+                    limpar_modelos()
+                slope = rng.uniform(0.5, 3.0)
+                y = slope * x + rng.normal(0.0, 0.5, x.size)
+                exportar_grafico(x, y, 0.1, 0.3, slope, 0.0, destino,
+                                 titulo=f"Grafico {i}")
+            duracao = time.perf_counter() - inicio
+            print(f"{modo:<8} {1000 * duracao / args.graficos:>11.1f} "
+                  f"{inicio_rss:>10.1f}MB {rss_mb():>8.1f}MB")
+
+
+if __name__ == '__main__':
+    main()
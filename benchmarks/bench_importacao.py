@@ -0,0 +1,113 @@
+"""
+Benchmark de inicializacao do scalc.py (python -X importtime).
+
+Mede o tempo total de importacao de `scalc.py --help` e de uma execucao CLI
+sem grafico (`--cli --all-pairs`), e verifica que modulos pesados nao sao
+carregados onde nao sao necessarios:
+
+    --help           : sem pandas, numpy, matplotlib, PySide6
+    CLI sem grafico  : sem matplotlib, PySide6
+
+Sai com codigo 1 se algum orcamento (em ms) for excedido ou se um modulo
+proibido for importado, para uso em CI.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_importacao.py
+    python benchmarks/bench_importacao.py --orcamento-help 80 --orcamento-cli 1500
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+RAIZ = Path(__file__).resolve().parent.parent
+SCALC = str(RAIZ / 'scalc.py')
+
+_LINHA = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+PROIBIDOS = {
+    'help': ('pandas', 'numpy', 'matplotlib', 'PySide6'),
+    'cli':  ('matplotlib', 'PySide6'),
+}
+
+
+def medir(argumentos: list, ambiente: dict) -> tuple:
+    """
+    Roda scalc.py com -X importtime.
+
+    Returns:
+        (total_ms, modulos): soma do tempo cumulativo dos imports de nivel
+            mais alto e o conjunto de modulos importados.
+    """
+    saida = subprocess.run(
+        [sys.executable, '-X', 'importtime', SCALC] + argumentos,
+        capture_output=True, text=True, env=ambiente, cwd=str(RAIZ),
+    )
+    if saida.returncode != 0:
+        raise RuntimeError(f"scalc.py {' '.join(argumentos)} falhou:\n{saida.stderr[-2000:]}")
+
+    total_us = 0
+    modulos = set()
+    for linha in saida.stderr.splitlines():
+        casamento = _LINHA.match(linha)
+        if not casamento:
+            continue
+        _, cumulativo, recuo, nome = casamento.groups()
+        modulos.add(nome)
+        if len(recuo) == 1:             # import de nivel mais alto
+            total_us += int(cumulativo)
+    return total_us / 1000, modulos
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--orcamento-help', type=float, default=100.0,
+                        help='Orcamento de importacao de --help (ms)')
+    parser.add_argument('--orcamento-cli', type=float, default=2000.0,
+                        help='Orcamento de importacao da CLI sem grafico (ms)')
+    parser.add_argument('--repeticoes', type=int, default=3,
+                        help='Execucoes por caso (vale o menor tempo)')
+    args = parser.parse_args()
+
+    falhas = []
+    with tempfile.TemporaryDirectory() as pasta:
+        dados = os.path.join(pasta, 'dados.csv')
+        pd.DataFrame({
+            'Dados': ['a_1', 'a_2', 'a_3', 'b_1', 'b_2', 'b_3'],
+            'I_err': [0.1] * 6,
+            '1': [1.0, 2.0, 3.0, 2.1, 3.9, 6.2],
+        }).to_csv(dados, index=False)
+        ambiente = dict(os.environ, SCALC_CACHE_DIR=os.path.join(pasta, 'cache'))
+
+        casos = {
+            'help': (['--help'], args.orcamento_help),
+            'cli':  (['--cli', '-f', dados, '--all-pairs', '--no-cache'], args.orcamento_cli),
+        }
+        print(f"{'caso':<6} {'importacao (ms)':>16} {'orcamento':>10}  modulos pesados")
+        for nome, (argumentos, orcamento) in casos.items():
+            medicoes = [medir(argumentos, ambiente) for _ in range(args.repeticoes)]
+            total_ms = min(m[0] for m in medicoes)
+            modulos = medicoes[0][1]
+            pesados = [m for m in ('pandas', 'numpy', 'matplotlib', 'PySide6', 'scipy')
+                       if m in modulos]
+            print(f"{nome:<6} {total_ms:>16.1f} {orcamento:>10.0f}  {', '.join(pesados) or '-'}")
+
+            if total_ms > orcamento:
+                falhas.append(f"{nome}: {total_ms:.1f} ms > orcamento de {orcamento:.0f} ms")
+            for modulo in PROIBIDOS[nome]:
+                if modulo in modulos:
+                    falhas.append(f"{nome}: importou {modulo}")
+
+    for falha in falhas:
+        print(f"FALHA  {falha}")
+    sys.exit(1 if falhas else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark da leitura de Excel: pd.read_excel vs ler_excel (streaming).
+
+Gera uma planilha no formato SCalc com o tamanho pedido (em MB) e mede,
+para cada leitor, o tempo de parede e o pico de memoria residente (RSS).
+Cada leitura roda em um subprocesso proprio, de modo que o pico de RSS de
+um leitor nao contamina o do outro.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_leitura.py                 # planilha de ~50 MB
+    python benchmarks/bench_leitura.py --mb 5
+    python benchmarks/bench_leitura.py --arquivo grande.xlsx
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+# Executado em um subprocesso: le o arquivo e imprime tempo e pico de RSS
+_MEDIR = """
+import json, resource, sys, time
+sys.path.insert(0, {raiz!r})
+import pandas as pd
+from src.data.leitores import ler_excel
+inicio = time.perf_counter()
+tabela = {chamada}
+tempo = time.perf_counter() - inicio
+pico_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{'tempo': tempo, 'pico_mb': pico_kb / 1024, 'forma': tabela.shape}}))
+"""
+
+LEITORES = {
+    'importacoes':   "pd.DataFrame()",      # linha de base (sem leitura)
+    'pd.read_excel': "pd.read_excel({caminho!r})",
+    'ler_excel':     "ler_excel({caminho!r})",
+}
+
+
+def gerar_planilha(caminho: str, mb: float, colunas: int, seed: int = 0) -> None:
+    """Gera uma planilha SCalc de aproximadamente `mb` megabytes."""
+    import openpyxl
+
+    rng = np.random.default_rng(seed)
+
+    def escrever(linhas: int, destino: str) -> None:
+        livro = openpyxl.Workbook(write_only=True)
+        planilha = livro.create_sheet()
+        planilha.append(['Dados', 'I_err'] + [str(r + 1) for r in range(colunas)])
+        prefixos = 'abcd'
+        for i in range(linhas):
+            valores = rng.normal(10.0, 1.0, colunas).tolist()
+            planilha.append([f"{prefixos[i % 4]}_{i // 4 + 1}", 0.1] + valores)
+        livro.save(destino)
+
+    # Calibra bytes por linha com uma amostra e escala para o tamanho pedido
+    amostra = caminho + '.amostra.xlsx'
+    escrever(1000, amostra)
+    bytes_por_linha = os.path.getsize(amostra) / 1000
+    os.remove(amostra)
+    escrever(max(1, int(mb * 1024 * 1024 / bytes_por_linha)), caminho)
+
+
+def medir(nome: str, caminho: str) -> dict:
+    """Roda um leitor em um subprocesso e devolve tempo, pico de RSS e shape."""
+    codigo = _MEDIR.format(
+        raiz=str(RAIZ), chamada=LEITORES[nome].format(caminho=caminho)
+    )
+    saida = subprocess.run(
+        [sys.executable, '-c', codigo], capture_output=True, text=True, check=True
+    )
+    return json.loads(saida.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--mb', type=float, default=50.0,
+                        help='Tamanho aproximado da planilha gerada (MB)')
+    parser.add_argument('--colunas', type=int, default=60,
+                        help='Repeticoes (colunas numericas) por linha')
+    parser.add_argument('--arquivo', type=str, default=None,
+                        help='Usa uma planilha existente em vez de gerar')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = args.arquivo
+        if caminho is None:
+            caminho = os.path.join(pasta, 'bench_leitura.xlsx')
+            inicio = time.perf_counter()
+            gerar_planilha(caminho, args.mb, args.colunas)
+            print(f"Planilha gerada em {time.perf_counter() - inicio:.1f} s")
+
+        tamanho = os.path.getsize(caminho) / (1024 * 1024)
+        print(f"Arquivo: {caminho} ({tamanho:.1f} MB)")
+        print(f"{'leitor':<15} {'tempo (s)':>10} {'pico RSS (MB)':>14}  shape")
+        for nome in LEITORES:
+            r = medir(nome, caminho)
+            print(f"{nome:<15} {r['tempo']:>10.2f} {r['pico_mb']:>14.1f}  "
+                  f"{tuple(r['forma'])}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark do modo lote: vazao de processar_lote() por numero de workers.
+
+Gera N arquivos no formato SCalc e mede arquivos/s com 1, 2, 4, ... workers
+(ate o numero de CPUs), alem da referencia de um interpretador por arquivo
+(o custo de chamar `scalc.py --cli -f` em laco), medida em uma amostra.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_lote.py
+    python benchmarks/bench_lote.py --arquivos 1000 --formato xlsx
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from src.app.lote import processar_lote     # noqa: E402
+
+# Um interpretador novo por arquivo (importacoes pagas a cada arquivo)
+_POR_ARQUIVO = (
+    "import sys; sys.path.insert(0, {raiz!r}); "
+    "from src.app.lote import processar_arquivo; "
+    "processar_arquivo({caminho!r}, usar_cache=False)"
+)
+
+
+def gerar_arquivos(pasta: str, n: int, formato: str, seed: int = 0) -> list:
+    """Gera n tabelas SCalc (4 prefixos x 25 pontos x 10 repeticoes)."""
+    rng = np.random.default_rng(seed)
+    ids = [f"{p}_{i + 1}" for p in 'abcd' for i in range(25)]
+    caminhos = []
+    for k in range(n):
+        valores = rng.normal(10.0, 1.0, size=(len(ids), 10))
+        tabela = pd.DataFrame(valores, columns=[str(r + 1) for r in range(10)])
+        tabela.insert(0, 'I_err', 0.1)
+        tabela.insert(0, 'Dados', ids)
+        caminho = os.path.join(pasta, f"dados_{k:05d}.{formato}")
+        if formato == 'xlsx':
+            tabela.to_excel(caminho, index=False)
+        else:
+            tabela.to_csv(caminho, index=False)
+        caminhos.append(caminho)
+    return caminhos
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--arquivos', type=int, default=200)
+    parser.add_argument('--formato', choices=['csv', 'xlsx'], default='csv')
+    parser.add_argument('--amostra', type=int, default=5,
+                        help='Arquivos medidos na referencia de um processo por arquivo')
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    niveis = sorted({1, cpus} | {2 ** k for k in range(1, 8) if 2 ** k < cpus})
+
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivos = gerar_arquivos(pasta, args.arquivos, args.formato)
+        print(f"{len(arquivos)} arquivos .{args.formato}, {cpus} CPU(s)")
+
+        inicio = time.perf_counter()
+        for caminho in arquivos[:args.amostra]:
+            codigo = _POR_ARQUIVO.format(raiz=str(RAIZ), caminho=caminho)
+            subprocess.run([sys.executable, '-c', codigo], check=True)
+        por_arquivo = (time.perf_counter() - inicio) / args.amostra
+        print(f"{'1 processo/arquivo':<20} {1 / por_arquivo:>10.1f} arquivos/s")
+
+        base = None
+        for workers in niveis:
+            inicio = time.perf_counter()
+            resumo = processar_lote(arquivos, workers=workers, usar_cache=False)
+            duracao = time.perf_counter() - inicio
+            assert (resumo['status'] == 'ok').all()
+            vazao = len(arquivos) / duracao
+            base = base or vazao
+            print(f"{f'{workers} worker(s)':<20} {vazao:>10.1f} arquivos/s  "
+                  f"(x{vazao / base:.2f})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark de particionar() na escala de Config.Validacao.MAX_LINHAS.
+
+Compara o particionamento vetorizado (melt + str.extract + groupby) com a
+implementacao anterior, que visitava cada celula com tabela.at[idx, coluna].
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_particionar.py
+    python benchmarks/bench_particionar.py --linhas 2000 --repeticoes 10
+"""
+
+import argparse
+import logging
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from src.core.statistics import particionar          # noqa: E402
+from src.data.config import Config                    # noqa: E402
+from src.utils.parsers import extrair_prefixo          # noqa: E402
+
+
+def gerar_tabela(linhas: int, repeticoes: int, seed: int = 0) -> pd.DataFrame:
+    """Gera uma tabela no formato SCalc com 4 prefixos e NaN esparsos."""
+    rng = np.random.default_rng(seed)
+    prefixos = np.array(['a', 'b', 'c', 'd'])
+    ids = [f"{prefixos[i % 4]}_{i // 4 + 1}" for i in range(linhas)]
+    valores = rng.normal(10.0, 1.0, size=(linhas, repeticoes))
+    valores[rng.random(valores.shape) < 0.02] = np.nan
+    df = pd.DataFrame(valores, columns=[str(r + 1) for r in range(repeticoes)])
+    df.insert(0, 'I_err', 0.1)
+    df.insert(0, 'Dados', ids)
+    return df
+
+
+def particionar_por_celula(tabela: pd.DataFrame):
+    """Laco por celula equivalente a implementacao anterior (referencia)."""
+    coluna_ids = next(c for c in tabela.columns if 'dados' in str(c).lower())
+    lista_dados = tabela[coluna_ids].dropna().tolist()
+    dados_iteracoes: dict = defaultdict(list)
+    for coluna in tabela.columns:
+        nome = str(coluna).lower()
+        if 'dados' in nome or 'err' in nome:
+            continue
+        idx_limpo = 0
+        for idx in tabela.index:
+            val = tabela.at[idx, coluna]
+            if idx_limpo >= len(lista_dados):
+                break
+            if not pd.isna(val):
+                dados_iteracoes[lista_dados[idx_limpo]].append(float(val))
+            idx_limpo += 1
+    dados_brutos: dict = {}
+    for chave, valores in dados_iteracoes.items():
+        dados_brutos.setdefault(extrair_prefixo(chave), {})[chave] = valores
+    return dados_brutos
+
+
+def cronometrar(funcao, *args, repeticoes: int = 3) -> float:
+    """Retorna o menor tempo (s) entre as repeticoes."""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao(*args)
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--linhas', type=int, default=Config.Validacao.MAX_LINHAS)
+    parser.add_argument('--repeticoes', type=int, default=60)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    tabela = gerar_tabela(args.linhas, args.repeticoes)
+    print(f"Tabela: {args.linhas} linhas x {args.repeticoes} repeticoes")
+
+    t_vetorizado = cronometrar(particionar, tabela)
+    t_celula = cronometrar(particionar_por_celula, tabela, repeticoes=1)
+
+    print(f"  por celula (anterior) : {t_celula * 1e3:10.1f} ms")
+    print(f"  vetorizado            : {t_vetorizado * 1e3:10.1f} ms")
+    print(f"  speedup               : {t_celula / t_vetorizado:10.1f}x")
+
+
+if __name__ == '__main__':
+    main()
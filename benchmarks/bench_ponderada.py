@@ -0,0 +1,74 @@
+"""
+Benchmark de RegLinPonderada (WLS e York) em lote contra RegLin e curve_fit.
+
+Mesma varredura de bench_reglin.py, com incertezas em x e y por ponto: o
+ajuste ponderado recebe a pilha 2-D inteira de uma vez, como o caminho sem
+pesos, e York itera todas as series juntas. O laco com curve_fit
+(absolute_sigma) e estimado em uma amostra.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_ponderada.py
+    python benchmarks/bench_ponderada.py --series 50000 --pontos 12
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from scipy.optimize import curve_fit
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from src.core.regression import RegLin, RegLinPonderada    # noqa: E402
+
+
+def _reta(x, a, b):
+    return a * x + b
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--series', type=int, default=50_000)
+    parser.add_argument('--pontos', type=int, default=12)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    forma = (args.series, args.pontos)
+    erros_x = rng.uniform(0.01, 0.1, forma)
+    erros_y = rng.uniform(0.05, 0.3, forma)
+    x = np.tile(np.linspace(0.0, 10.0, args.pontos), (args.series, 1))
+    y = 2.0 * x + 1.0 + rng.normal(0.0, erros_y)
+    x = x + rng.normal(0.0, erros_x)
+    print(f"{args.series} regressoes de {args.pontos} pontos")
+
+    inicio = time.perf_counter()
+    RegLin(x, y)
+    t_reglin = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    slope_wls = RegLinPonderada(x, y, erros_y)[0]
+    t_wls = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    RegLinPonderada(x, y, erros_y, erros_x)
+    t_york = time.perf_counter() - inicio
+
+    amostra = min(args.series, 500)
+    inicio = time.perf_counter()
+    ref = [curve_fit(_reta, x[i], y[i], sigma=erros_y[i], absolute_sigma=True)[0][0]
+           for i in range(amostra)]
+    t_curve_fit = (time.perf_counter() - inicio) * args.series / amostra
+
+    assert np.allclose(slope_wls[:amostra], ref, rtol=1e-6)
+    print(f"  RegLin 2-D (sem pesos)      : {t_reglin * 1e3:10.1f} ms")
+    print(f"  RegLinPonderada WLS 2-D     : {t_wls * 1e3:10.1f} ms")
+    print(f"  RegLinPonderada York 2-D    : {t_york * 1e3:10.1f} ms")
+    print(f"  curve_fit (laco, est.)      : {t_curve_fit * 1e3:10.1f} ms")
+    print(f"  speedup WLS vs curve_fit    : {t_curve_fit / t_wls:10.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark de RegLin em lote contra scipy.stats.linregress.
+
+Simula uma varredura de parametros com muitas regressoes pequenas: o laco
+com linregress paga o overhead do scipy a cada chamada, enquanto RegLin
+recebe a pilha 2-D inteira de uma vez.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_reglin.py
+    python benchmarks/bench_reglin.py --series 50000 --pontos 12
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from scipy.stats import linregress
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from src.core.regression import RegLin    # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--series', type=int, default=50_000)
+    parser.add_argument('--pontos', type=int, default=12)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    x = np.tile(np.linspace(0.0, 10.0, args.pontos), (args.series, 1))
+    y = 2.0 * x + 1.0 + rng.normal(0.0, 0.1, size=x.shape)
+    print(f"{args.series} regressoes de {args.pontos} pontos")
+
+    inicio = time.perf_counter()
+    ref = np.array([linregress(xi, yi)[0] for xi, yi in zip(x, y)])
+    t_scipy = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for xi, yi in zip(x[:5000], y[:5000]):
+        RegLin(xi, yi)
+    t_laco = (time.perf_counter() - inicio) * args.series / min(args.series, 5000)
+
+    inicio = time.perf_counter()
+    slope, _, _ = RegLin(x, y)
+    t_lote = time.perf_counter() - inicio
+
+    assert np.allclose(slope, ref, rtol=1e-9)
+    print(f"  linregress (laco)      : {t_scipy * 1e3:10.1f} ms")
+    print(f"  RegLin 1-D (laco, est.): {t_laco * 1e3:10.1f} ms")
+    print(f"  RegLin 2-D (lote)      : {t_lote * 1e3:10.1f} ms")
+    print(f"  speedup lote vs scipy  : {t_scipy / t_lote:10.1f}x")
+
+
+if __name__ == '__main__':
+    main()
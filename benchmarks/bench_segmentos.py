@@ -0,0 +1,70 @@
+"""
+Benchmark da regressao por janelas e por partes (src.core.segmentos).
+
+Serie de tres regimes (quebras em x = 10 e 20). As janelas deslizantes por
+somas acumuladas sao comparadas a um laco de RegLin janela a janela
+(estimado em uma amostra); a regressao por partes mede a programacao
+dinamica na grade de candidatos mais o refinamento local das quebras.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_segmentos.py
+    python benchmarks/bench_segmentos.py --pontos 1000000 --janela 500
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from src.core.regression import IndiceRegressao, RegLin    # noqa: E402
+from src.core.segmentos import regressao_janela, regressao_segmentada    # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pontos', type=int, default=100_000)
+    parser.add_argument('--janela', type=int, default=100)
+    parser.add_argument('--candidatos', type=int, default=None)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    x = np.linspace(0.0, 30.0, args.pontos)
+    y = np.where(x < 10, x, np.where(x < 20, 10 - 2 * (x - 10), -10 + 0.5 * (x - 20)))
+    y = y + rng.normal(0.0, 0.1, args.pontos)
+    print(f"{args.pontos} pontos, janelas de {args.janela}")
+
+    inicio = time.perf_counter()
+    indice = IndiceRegressao(x, y)
+    t_indice = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    janelas = regressao_janela(indice, args.janela)
+    t_janelas = time.perf_counter() - inicio
+
+    amostra = min(len(janelas), 2000)
+    inicio = time.perf_counter()
+    ref = [RegLin(x[s:s + args.janela], y[s:s + args.janela])[0] for s in range(amostra)]
+    t_laco = (time.perf_counter() - inicio) * len(janelas) / amostra
+    assert np.allclose(janelas['slope'][:amostra], ref, rtol=1e-6)
+
+    inicio = time.perf_counter()
+    segmentos = regressao_segmentada(indice, max_candidatos=args.candidatos)
+    t_segmentos = time.perf_counter() - inicio
+
+    print(f"  IndiceRegressao          : {t_indice * 1e3:10.1f} ms")
+    print(f"  janelas (somas acum.)    : {t_janelas * 1e3:10.1f} ms  ({len(janelas)} janelas)")
+    print(f"  janelas (laco, est.)     : {t_laco * 1e3:10.1f} ms")
+    print(f"  speedup janelas          : {t_laco / t_janelas:10.1f}x")
+    print(f"  por partes (BIC, k <= 5) : {t_segmentos * 1e3:10.1f} ms  "
+          f"({len(segmentos)} segmentos)")
+    quebras = ', '.join(f"{v:.4f}" for v in segmentos['x_fim'][:-1])
+    print(f"  quebras (x_fim)          : {quebras}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark de renderizacao por escala dos dados (ticks adaptativos).
+
+Exporta o mesmo grafico (25 pontos, reta y = 2x + 1) com os dados em
+escalas de 1e-6 a 1e9 e mede o tempo de renderizacao PNG e o numero de
+ticks em cada eixo. Com o MaxNLocator o numero de ticks e limitado por
+Config.Plot.MAX_TICKS e o tempo nao depende da escala. A coluna
+'ticks antes' mostra quantos ticks a regra antiga (um por unidade inteira,
+np.arange(min, max + 1)) alocaria, sem executa-la.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_ticks.py
+    python benchmarks/bench_ticks.py --repeticoes 10
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from src.visualization.plots import exportar_grafico, obter_modelo    # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeticoes', type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    base = np.linspace(1.0, 10.0, 25)
+    ruido = rng.normal(0.0, 0.05, base.size)
+
+    with tempfile.TemporaryDirectory() as pasta:
+        destino = os.path.join(pasta, 'grafico')
+        exportar_grafico(base, 2 * base + 1, 0.1, 0.1, 2.0, 1.0, destino)   # aquecimento
+
+        print(f"{'escala':>8} {'ms/grafico':>11} {'ticks x':>8} {'ticks y':>8} {'ticks antes':>14}")
+        for expoente in range(-6, 10):
+            escala = 10.0 ** expoente
+            x = base * escala
+            y = (2 * base + 1 + ruido) * escala
+            erros = 0.02 * escala
+
+            tempos = []
+            for _ in range(args.repeticoes):
+                inicio = time.perf_counter()
+                exportar_grafico(x, y, erros, erros, 2.0, escala, destino)
+                tempos.append(time.perf_counter() - inicio)
+
+            ax = obter_modelo().ax
+            antes = int(x.max() - x.min()) + int(y.max() - y.min()) + 2
+            print(f"{escala:>8.0e} {1000 * min(tempos):>11.1f} "
+                  f"{len(ax.get_xticks()):>8} {len(ax.get_yticks()):>8} {antes:>14,}")
+
+
+if __name__ == '__main__':
+    main()
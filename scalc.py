@@ -5,6 +5,8 @@ Pode ser executado de duas formas:
   python scalc.py              # Modo GUI (padrao)
   python scalc.py --gui        # Modo GUI (explicito)
   python scalc.py --cli -f <arquivo.xlsx>  # Modo CLI
+  python scalc.py --batch <dir|glob>       # Modo lote (pool de processos)
+  python scalc.py --watch <dir>            # Monitora uma pasta de entrada
 
 Autor: Caio Aquilino Merino
 """
@@ -12,21 +14,19 @@ Autor: Caio Aquilino Merino
 import sys
 import argparse
 import logging
+import time
 from pathlib import Path
 
-import numpy as np
-import pandas as pd
-
 from src.data.config import Config, setup_logging
-from src.core import calcular_estatisticas, calcular_stats_prefixo, RegLin
-from src.core.statistics import particionar
 from src.core.exceptions import (
     DadosInvalidosException,
     ArquivoInvalidoException,
     RegressaoException,
 )
-from src.utils.validador import ValidadorDados   # importado direto para evitar circular import
-from src.visualization.plots import PlotarGrafico
+
+# Importacoes pesadas (pandas, matplotlib, PySide6) ficam dentro dos modos que
+# as usam: `--help` e execucoes sem grafico nao pagam por elas.
+# Ver benchmarks/bench_importacao.py.
 
 logger = logging.getLogger(__name__)
 
@@ -40,19 +40,53 @@ def modo_cli(
     ax_x: str = "x",
     ax_y: str = "y",
     titulo: str = "Grafico de Dispersao com Regressao Linear",
+    todos_pares: bool = False,
+    usar_cache: bool | None = None,
+    formato_saida: str | None = None,
+    destino: str | None = None,
+    plotar: bool = True,
+    formatos_exportacao: list | None = None,
+    pasta_exportacao: str | None = None,
+    workers: int | None = None,
+    janela: int | None = None,
+    segmentos: int | str | None = None,
+    ponderada: bool = False,
 ) -> None:
     """
     Executa o programa em modo linha de comando.
 
-    Carrega o arquivo Excel, executa o pipeline completo (particionar ->
-    calcular_stats_prefixo -> RegLin -> PlotarGrafico) e imprime os
-    resultados no terminal via logger.
+    Carrega o arquivo de dados, executa o pipeline completo via Analise
+    (particionar -> estatisticas -> RegLin) e PlotarGrafico, e imprime os
+    resultados no terminal via logger. Com `formato_saida`, a tabela de
+    estatisticas por ponto e os parametros da regressao tambem sao escritos
+    em JSON/CSV/NDJSON (src.data.saida), sem depender dos logs.
 
     Args:
-        path:   Caminho para o arquivo Excel.
+        path:   Caminho para o arquivo de dados (formato pela extensao).
         ax_x:   Rotulo do eixo X no grafico.
         ax_y:   Rotulo do eixo Y no grafico.
         titulo: Titulo do grafico.
+        todos_pares: Se True, regride todos os pares ordenados de prefixos
+            e imprime a tabela de resultados (sem grafico).
+        usar_cache: Se False, le o arquivo sem passar pelo cache em disco
+            (padrao: Config.Cache.HABILITADO).
+        formato_saida: 'json', 'csv' ou 'ndjson' para escrever os
+            resultados em formato legivel por maquina (padrao: nenhum).
+        destino: Arquivo de saida dos resultados (padrao: stdout).
+        plotar: Se False, nao abre o grafico (para uso sem display).
+        formatos_exportacao: Formatos (Config.Plot.FORMATOS_EXPORTACAO) em
+            que o grafico e salvo fora da tela, pelo backend Agg.
+        pasta_exportacao: Pasta das figuras (padrao:
+            Config.Plot.PASTA_EXPORTACAO).
+        workers: Processos usados para exportar as figuras de --all-pairs.
+        janela: Pontos das janelas deslizantes da regressao local do par
+            (src.core.segmentos.regressao_janela; padrao: nenhuma).
+        segmentos: Numero de segmentos da regressao por partes do par, ou
+            'auto' para escolher pelo BIC (padrao: nenhuma).
+        ponderada: Se True, a reta usa os erros totais (T_err) dos pontos
+            (Analise.regressao_ponderada: York com erros em X, senao WLS) e
+            os resultados incluem as incertezas dos parametros e o chi2
+            reduzido.
     """
     logger.info("=" * 60)
     logger.info("SCalc - Modo Linha de Comando")
@@ -62,26 +96,21 @@ def modo_cli(
         # ---------------------------------------------------------------- #
         #  Carregar e validar                                               #
         # ---------------------------------------------------------------- #
-        logger.info(f"Validando arquivo: {path}")
-        ValidadorDados.validar_arquivo_excel(path)
+        from src.core.analise import Analise
+        from src.data.entrada import carregar_tabela
 
         logger.info(f"Carregando arquivo: {path}")
-        dados_excel = pd.read_excel(path)
-
-        ValidadorDados.validar_dataframe(dados_excel, "Dados do Excel")
-        ValidadorDados.validar_tamanho_arquivo(dados_excel)
+        analise = Analise(carregar_tabela(path, usar_cache=usar_cache))
         logger.info(
-            f"Arquivo carregado: {len(dados_excel)} linhas, "
-            f"{len(dados_excel.columns)} colunas"
+            f"Arquivo carregado: {len(analise.tabela)} linhas, "
+            f"{len(analise.tabela.columns)} colunas"
         )
 
         # ---------------------------------------------------------------- #
-        #  Particionar                                                       #
+        #  Particionar (uma unica vez; etapas seguintes sao memoizadas)     #
         # ---------------------------------------------------------------- #
         logger.info("Particionando dados...")
-        dados_brutos, erros_instr, _ = particionar(dados_excel)
-
-        prefixos = sorted(dados_brutos.keys())
+        prefixos = analise.prefixos
         logger.info(f"Grupos encontrados: {prefixos}")
 
         if len(prefixos) < 2:
@@ -89,63 +118,105 @@ def modo_cli(
                 "Minimo de 2 grupos necessario para regressao linear"
             )
 
+        if todos_pares:
+            if janela or segmentos is not None or ponderada:
+                logger.warning(
+                    "--janela/--segmentos/--ponderada valem para um par; "
+                    "ignorados com --all-pairs"
+                )
+            _imprimir_todos_pares(analise)
+            if formato_saida:
+                _escrever_saida(analise, analise.todos_pares, formato_saida, destino, path)
+            if formatos_exportacao:
+                _exportar_todos_pares(analise, path, formatos_exportacao,
+                                      pasta_exportacao, workers, ax_x, ax_y)
+            return
+
         prefixo_x, prefixo_y = prefixos[0], prefixos[1]
         logger.info(
             f"Regressao: '{prefixo_x}' (X) vs '{prefixo_y}' (Y)"
         )
 
         # ---------------------------------------------------------------- #
-        #  Calcular medias e erros via helper centralizado                  #
+        #  Medias, erros e regressao linear                                  #
         # ---------------------------------------------------------------- #
-        x_vals, x_errs = calcular_stats_prefixo(
-            dados_brutos[prefixo_x], erros_instr[prefixo_x]
-        )
-        y_vals, y_errs = calcular_stats_prefixo(
-            dados_brutos[prefixo_y], erros_instr[prefixo_y]
-        )
-
-        if len(x_vals) < 2 or len(y_vals) < 2:
-            raise DadosInvalidosException(
-                "Dados insuficientes para regressao linear "
-                "(minimo 2 pontos por grupo)"
-            )
-        if len(x_vals) != len(y_vals):
-            raise DadosInvalidosException(
-                f"Grupos com tamanhos diferentes: "
-                f"{prefixo_x}={len(x_vals)}, {prefixo_y}={len(y_vals)}"
-            )
+        x, y, x_err, y_err = analise.dados_xy(prefixo_x, prefixo_y)
 
-        x = np.array(x_vals)
-        y = np.array(y_vals)
-        x_err = np.array(x_errs)
-        y_err = np.array(y_errs)
-
-        # ---------------------------------------------------------------- #
-        #  Regressao linear                                                 #
-        # ---------------------------------------------------------------- #
-        logger.info("Calculando regressao linear...")
-        try:
-            slope, intercept, r_squared = RegLin(x.tolist(), y.tolist())
-        except Exception as e:
-            raise RegressaoException(f"Erro na regressao linear: {e}") from e
+        if ponderada:
+            logger.info("Calculando regressao ponderada pelos erros (T_err)...")
+            (slope, intercept, r_squared, erro_slope, erro_intercept,
+             chi2_reduzido) = analise.regressao_ponderada(prefixo_x, prefixo_y)
+            metodo = 'york' if (x_err > 0.0).any() else 'wls'
+        else:
+            logger.info("Calculando regressao linear...")
+            slope, intercept, r_squared = analise.regressao(prefixo_x, prefixo_y)
 
         qualidade = Config.validar_r2(r_squared)
 
         logger.info("=" * 60)
-        logger.info("RESULTADOS DA REGRESSAO LINEAR")
+        if ponderada:
+            descricao = "York, erros em x e y" if metodo == 'york' else "WLS, erros em y"
+            logger.info(f"RESULTADOS DA REGRESSAO PONDERADA ({descricao})")
+        else:
+            logger.info("RESULTADOS DA REGRESSAO LINEAR")
         logger.info("=" * 60)
         logger.info(f"Grupo X : '{prefixo_x}' ({len(x)} pontos)")
         logger.info(f"Grupo Y : '{prefixo_y}' ({len(y)} pontos)")
         logger.info(f"Equacao : y = {slope:.6f}x + {intercept:.6f}")
-        logger.info(f"m (angular)  : {slope:.6f}")
-        logger.info(f"b (linear)   : {intercept:.6f}")
+        if ponderada:
+            logger.info(f"m (angular)  : {slope:.6f} +/- {erro_slope:.6f}")
+            logger.info(f"b (linear)   : {intercept:.6f} +/- {erro_intercept:.6f}")
+            logger.info(f"chi2 reduzido: {chi2_reduzido:.6f}")
+        else:
+            logger.info(f"m (angular)  : {slope:.6f}")
+            logger.info(f"b (linear)   : {intercept:.6f}")
         logger.info(f"R2           : {r_squared:.6f}")
         logger.info(f"Qualidade    : {qualidade}")
 
+        locais = {}
+        if janela:
+            locais['janelas'] = _imprimir_janelas(analise, prefixo_x, prefixo_y, janela)
+        if segmentos is not None:
+            locais['segmentos'] = _imprimir_segmentos(
+                analise, prefixo_x, prefixo_y, None if segmentos == 'auto' else segmentos
+            )
+
+        if formato_saida:
+            import pandas as pd
+
+            regressao = {
+                'X': prefixo_x, 'Y': prefixo_y, 'slope': slope,
+                'intercept': intercept, 'r_squared': r_squared, 'n': len(x),
+            }
+            if ponderada:
+                regressao.update(metodo=metodo, erro_slope=erro_slope,
+                                 erro_intercept=erro_intercept,
+                                 chi2_reduzido=chi2_reduzido)
+            regressoes = pd.DataFrame([regressao])
+            _escrever_saida(analise, regressoes, formato_saida, destino, path, **locais)
+
+        if formatos_exportacao:
+            from src.visualization.plots import exportar_par
+
+            arquivos = exportar_par(
+                analise, prefixo_x, prefixo_y, Path(path).stem,
+                pasta=pasta_exportacao or Config.Plot.PASTA_EXPORTACAO,
+                formatos=formatos_exportacao,
+                str_x=ax_x, str_y=ax_y, titulo=titulo, ponderada=ponderada,
+            )
+            for arquivo in arquivos:
+                logger.info(f"Grafico exportado: {arquivo}")
+
+        if not plotar:
+            logger.info("Processo concluido com sucesso (sem grafico)!")
+            return
+
         # ---------------------------------------------------------------- #
         #  Plotar                                                            #
         # ---------------------------------------------------------------- #
         logger.info("Plotando grafico...")
+        from src.visualization.plots import PlotarGrafico
+
         PlotarGrafico(
             set(zip(x.tolist(), y.tolist())),
             x_err.tolist(),
@@ -172,16 +243,206 @@ def modo_cli(
         sys.exit(1)
 
 
+def _imprimir_todos_pares(analise: 'Analise') -> None:
+    """Regride todos os pares ordenados de prefixos e imprime a tabela."""
+    logger.info("Calculando regressao de todos os pares...")
+    tabela = analise.todos_pares
+
+    logger.info("=" * 60)
+    logger.info(f"REGRESSAO DE TODOS OS PARES ({len(tabela)} ajustes)")
+    logger.info("=" * 60)
+    for linha in tabela.to_string(index=False, float_format='%.6f').splitlines():
+        logger.info(linha)
+
+
+def _imprimir_janelas(analise: 'Analise', prefixo_x: str, prefixo_y: str,
+                      janela: int) -> 'pd.DataFrame':
+    """Regressao em janelas deslizantes do par; resume a tabela no log."""
+    tabela = analise.janelas(prefixo_x, prefixo_y, janela)
+    logger.info("=" * 60)
+    logger.info(f"REGRESSAO EM JANELAS DE {janela} PONTOS ({len(tabela)} janelas)")
+    logger.info("=" * 60)
+    for coluna in ('slope', 'intercept', 'r_squared'):
+        valores = tabela[coluna]
+        logger.info(
+            f"{coluna:<10}: min {valores.min():.6f}  mediana {valores.median():.6f}  "
+            f"max {valores.max():.6f}"
+        )
+    return tabela
+
+
+def _imprimir_segmentos(analise: 'Analise', prefixo_x: str, prefixo_y: str,
+                        segmentos: int | None) -> 'pd.DataFrame':
+    """Regressao por partes do par e tabela de segmentos no log."""
+    tabela = analise.segmentos(prefixo_x, prefixo_y, segmentos)
+    origem = "BIC" if segmentos is None else "fixo"
+    logger.info("=" * 60)
+    logger.info(f"REGRESSAO POR PARTES ({len(tabela)} segmentos, {origem})")
+    logger.info("=" * 60)
+    for linha in tabela.to_string(index=False, float_format='%.6f').splitlines():
+        logger.info(linha)
+    return tabela
+
+
+def _exportar_todos_pares(analise: 'Analise', path: str, formatos: list,
+                         pasta: str | None, workers: int | None,
+                         ax_x: str, ax_y: str) -> None:
+    """Exporta um grafico por par ajustado, em um pool de processos."""
+    from src.visualization.plots import exportar_graficos
+
+    pasta = pasta or Config.Plot.PASTA_EXPORTACAO
+    tarefas = []
+    for par in analise.todos_pares.itertuples(index=False):
+        if par.slope != par.slope:          # NaN: X constante, sem reta
+            continue
+        x, y, x_err, y_err = analise.dados_xy(par.X, par.Y)
+        tarefas.append(dict(
+            x=x, y=y, erros_x=x_err, erros_y=y_err,
+            slope=par.slope, intercept=par.intercept,
+            destino=str(Path(pasta) / f"{Path(path).stem}_{par.X}_vs_{par.Y}"),
+            formatos=formatos,
+            str_x=f"{ax_x} ({par.X})", str_y=f"{ax_y} ({par.Y})",
+            titulo=f"{par.Y} vs {par.X}",
+        ))
+    logger.info(f"Exportando {len(tarefas)} grafico(s) para {pasta}...")
+    arquivos = exportar_graficos(tarefas, workers=workers)
+    logger.info(f"{sum(map(len, arquivos))} arquivo(s) gravados em {pasta}")
+
+
+def _escrever_saida(analise: 'Analise', regressoes, formato: str,
+                    destino: str | None, arquivo: str, **locais) -> None:
+    """
+    Escreve estatisticas e regressoes em `formato` (stdout ou arquivo);
+    `locais` sao as tabelas opcionais janelas/segmentos.
+    """
+    from src.data.saida import escrever_resultados
+
+    escrever_resultados(analise.estatisticas, regressoes, formato,
+                        destino=destino, arquivo=arquivo, **locais)
+    if destino and destino != '-':
+        logger.info(f"Resultados ({formato}) salvos em: {destino}")
+
+
+# --------------------------------------------------------------------------- #
+#  Modo lote                                                                   #
+# --------------------------------------------------------------------------- #
+
+def modo_lote(
+    alvo: str,
+    workers: int | None = None,
+    resumo: str | None = None,
+    usar_cache: bool | None = None,
+    formatos_exportacao: list | None = None,
+    pasta_exportacao: str | None = None,
+) -> None:
+    """
+    Executa o pipeline do modo CLI em muitos arquivos, em paralelo.
+
+    Cada arquivo e processado por lote.processar_arquivo em um pool de
+    processos; falhas ficam isoladas por arquivo. Os resultados vao para um
+    unico resumo CSV. Sai com codigo 1 se algum arquivo falhar.
+
+    Args:
+        alvo:       Diretorio ou padrao glob com os arquivos de entrada.
+        workers:    Numero de processos (padrao: Config.Lote.WORKERS).
+        resumo:     CSV de saida (padrao: Config.Lote.ARQUIVO_RESUMO).
+        usar_cache: Ver modo_cli().
+        formatos_exportacao, pasta_exportacao: Ver modo_cli(). Cada worker
+            renderiza as figuras dos arquivos que processa.
+    """
+    logger.info("=" * 60)
+    logger.info("SCalc - Modo Lote")
+    logger.info("=" * 60)
+
+    from src.app.lote import listar_arquivos, processar_lote
+
+    arquivos = listar_arquivos(alvo)
+    if not arquivos:
+        logger.error(f"Nenhum arquivo de entrada encontrado em: {alvo}")
+        sys.exit(1)
+    logger.info(f"{len(arquivos)} arquivo(s) encontrados em {alvo}")
+
+    exportar = None
+    if formatos_exportacao:
+        from functools import partial
+        from src.visualization.plots import exportar_par
+
+        exportar = partial(
+            exportar_par,
+            pasta=pasta_exportacao or Config.Plot.PASTA_EXPORTACAO,
+            formatos=formatos_exportacao,
+        )
+
+    inicio = time.perf_counter()
+    tabela = processar_lote(arquivos, workers=workers, usar_cache=usar_cache,
+                            exportar=exportar)
+    duracao = time.perf_counter() - inicio
+
+    resumo = resumo or Config.Lote.ARQUIVO_RESUMO
+    tabela.to_csv(resumo, index=False)
+
+    falhas = tabela[tabela['status'] != 'ok']
+    logger.info("=" * 60)
+    logger.info(
+        f"Lote concluido em {duracao:.1f} s: {len(tabela) - len(falhas)} ok, "
+        f"{len(falhas)} com erro ({len(tabela) / max(duracao, 1e-9):.1f} arquivos/s)"
+    )
+    for linha in falhas.itertuples():
+        logger.warning(f"  {linha.arquivo}: {linha.erro}")
+    logger.info(f"Resumo salvo em: {resumo}")
+    if len(falhas):
+        sys.exit(1)
+
+
+# --------------------------------------------------------------------------- #
+#  Modo monitor                                                                #
+# --------------------------------------------------------------------------- #
+
+def modo_monitor(
+    diretorio: str,
+    resultados: str | None = None,
+    intervalo: float | None = None,
+    usar_cache: bool | None = None,
+) -> None:
+    """
+    Monitora uma pasta e processa os arquivos novos ou alterados.
+
+    Roda ate Ctrl+C. Cada resultado e acrescentado ao CSV de resultados
+    assim que o arquivo e processado.
+
+    Args:
+        diretorio:  Pasta monitorada.
+        resultados: CSV de resultados (padrao: Config.Monitor.ARQUIVO_RESULTADOS).
+        intervalo:  Segundos entre verificacoes (padrao: Config.Monitor.INTERVALO_S).
+        usar_cache: Ver modo_cli().
+    """
+    if not Path(diretorio).is_dir():
+        logger.error(f"Pasta nao encontrada: {diretorio}")
+        sys.exit(1)
+
+    from src.app.monitor import MonitorPasta
+
+    monitor = MonitorPasta(diretorio, resultados=resultados, usar_cache=usar_cache)
+    logger.info("=" * 60)
+    logger.info(f"SCalc - Monitorando {diretorio} (Ctrl+C para encerrar)")
+    logger.info(f"Resultados em: {monitor.resultados}")
+    logger.info("=" * 60)
+    try:
+        monitor.executar(intervalo=intervalo)
+    except KeyboardInterrupt:
+        logger.info("Monitor encerrado.")
+
+
 # --------------------------------------------------------------------------- #
 #  Modo GUI                                                                    #
 # --------------------------------------------------------------------------- #
 
-def modo_gui() -> None:
+def modo_gui(usar_cache: bool | None = None) -> None:
     """Inicia a interface grafica."""
     logger.info("Iniciando interface grafica...")
     try:
         from src.visualization.gui import iniciar_interface
-        iniciar_interface()
+        iniciar_interface(usar_cache=usar_cache)
     except Exception as e:
         logger.exception(f"Erro ao iniciar interface grafica: {e}")
         sys.exit(1)
@@ -191,6 +452,33 @@ def modo_gui() -> None:
 #  Ponto de entrada                                                            #
 # --------------------------------------------------------------------------- #
 
+def _formatos_exportacao(valor: str) -> list:
+    """Tipo do argparse para --export: 'png,svg' -> ['png', 'svg']."""
+    formatos = [f.strip().lstrip('.').lower() for f in valor.split(',') if f.strip()]
+    invalidos = [f for f in formatos if f not in Config.Plot.FORMATOS_EXPORTACAO]
+    if invalidos or not formatos:
+        raise argparse.ArgumentTypeError(
+            f"formato(s) invalido(s): {valor!r} "
+            f"(suportados: {', '.join(Config.Plot.FORMATOS_EXPORTACAO)})"
+        )
+    return list(dict.fromkeys(formatos))
+
+
+def _numero_segmentos(valor: str) -> int | str:
+    """Tipo do argparse para --segmentos: inteiro >= 1 ou 'auto'."""
+    if valor.strip().lower() == 'auto':
+        return 'auto'
+    try:
+        numero = int(valor)
+    except ValueError:
+        numero = 0
+    if numero < 1:
+        raise argparse.ArgumentTypeError(
+            f"numero de segmentos invalido: {valor!r} (inteiro >= 1 ou 'auto')"
+        )
+    return numero
+
+
 def main() -> None:
     setup_logging(nivel='INFO')
 
@@ -207,6 +495,30 @@ Exemplos:
   # Linha de comando:
   python scalc.py --cli --arquivo dados.xlsx
   python scalc.py --cli -f dados.xlsx --x-label "Tempo (s)" --y-label "Distancia (m)"
+  python scalc.py --cli -f dados.xlsx --all-pairs
+  python scalc.py --cli -f medicoes.csv
+
+  # Sem grafico, resultados legiveis por maquina (stdout ou arquivo):
+  python scalc.py --cli -f dados.xlsx --output json --no-plot
+  python scalc.py --cli -f dados.xlsx --all-pairs --output csv --saida pares.csv
+
+  # Regressao local: janelas deslizantes e reta por partes (quebras pelo BIC):
+  python scalc.py --cli -f dados.xlsx --janela 50 --no-plot
+  python scalc.py --cli -f dados.xlsx --segmentos auto --output json --no-plot
+
+  # Ajuste ponderado pelos erros T_err (York com erros em X, senao WLS):
+  python scalc.py --cli -f dados.xlsx --ponderada
+
+  # Exportar o grafico fora da tela (backend Agg), tambem no modo lote:
+  python scalc.py --cli -f dados.xlsx --export png,svg --out figuras/ --no-plot
+  python scalc.py --batch dados/ --export png --out figuras/
+
+  # Lote (diretorio ou glob), em paralelo:
+  python scalc.py --batch dados/ --workers 8 --resumo resumo.csv
+  python scalc.py --batch "dados/**/*.xlsx"
+
+  # Monitoramento de pasta (processa arquivos novos/alterados):
+  python scalc.py --watch entrada/ --resumo resultados.csv
         """,
     )
 
@@ -215,7 +527,8 @@ Exemplos:
     parser.add_argument('--cli',  action='store_true',
                         help='Modo linha de comando')
     parser.add_argument('--arquivo', '-f', type=str,
-                        help='Caminho para o arquivo Excel (obrigatorio no modo CLI)')
+                        help='Arquivo de dados: .xlsx, .xls, .csv, .parquet, .feather ou .npz '
+                             '(obrigatorio no modo CLI)')
     parser.add_argument('--x-label', type=str, default='x',
                         help='Rotulo do eixo X (padrao: "x")')
     parser.add_argument('--y-label', type=str, default='y',
@@ -223,11 +536,62 @@ Exemplos:
     parser.add_argument('--titulo', type=str,
                         default='Grafico de Dispersao com Regressao Linear',
                         help='Titulo do grafico')
+    parser.add_argument('--all-pairs', action='store_true',
+                        help='Regride todos os pares ordenados de variaveis (CLI)')
+    parser.add_argument('--janela', type=int, default=None, metavar='N',
+                        help='Regressao em janelas deslizantes de N pontos do par (CLI)')
+    parser.add_argument('--segmentos', type=_numero_segmentos, default=None, metavar='K',
+                        help='Regressao por partes com K segmentos, ou "auto" para '
+                             'escolher pelo BIC (CLI)')
+    parser.add_argument('--ponderada', action='store_true',
+                        help='Pondera o ajuste pelos erros T_err (York com erros em X, '
+                             'senao WLS) e informa incertezas e chi2 reduzido (CLI)')
+    parser.add_argument('--output', choices=['json', 'csv', 'ndjson'], default=None,
+                        help='Escreve estatisticas e regressao em JSON, CSV ou NDJSON (CLI)')
+    parser.add_argument('--saida', type=str, default=None,
+                        help='Arquivo para --output (padrao: stdout; logs vao para stderr)')
+    parser.add_argument('--no-plot', action='store_true',
+                        help='Nao abre o grafico no modo CLI (uso sem display)')
+    parser.add_argument('--export', type=_formatos_exportacao, default=None,
+                        metavar='FORMATOS',
+                        help='Salva o grafico nos formatos dados, separados por virgula '
+                             f'({",".join(Config.Plot.FORMATOS_EXPORTACAO)}), sem abrir janela')
+    parser.add_argument('--out', type=str, default=None,
+                        help=f'Pasta das figuras do --export (padrao: {Config.Plot.PASTA_EXPORTACAO})')
+    parser.add_argument('--batch', type=str, metavar='ALVO',
+                        help='Processa todos os arquivos de um diretorio ou glob (modo lote)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Processos do modo lote e da exportacao de --all-pairs (padrao: numero de CPUs)')
+    parser.add_argument('--resumo', type=str, default=None,
+                        help=f'CSV consolidado do modo lote (padrao: {Config.Lote.ARQUIVO_RESUMO}) '
+                             f'ou de resultados do --watch (padrao: {Config.Monitor.ARQUIVO_RESULTADOS})')
+    parser.add_argument('--watch', type=str, metavar='PASTA',
+                        help='Monitora uma pasta e processa arquivos novos ou alterados')
+    parser.add_argument('--intervalo', type=float, default=None,
+                        help=f'Segundos entre verificacoes do --watch (padrao: {Config.Monitor.INTERVALO_S})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Le o arquivo sem usar o cache em disco de tabelas')
 
     args = parser.parse_args()
     logger.info(f"SCalc {Config.APP_VERSION} iniciado")
 
-    if args.cli:
+    if args.watch:
+        modo_monitor(
+            diretorio=args.watch,
+            resultados=args.resumo,
+            intervalo=args.intervalo,
+            usar_cache=False if args.no_cache else None,
+        )
+    elif args.batch:
+        modo_lote(
+            alvo=args.batch,
+            workers=args.workers,
+            resumo=args.resumo,
+            usar_cache=False if args.no_cache else None,
+            formatos_exportacao=args.export,
+            pasta_exportacao=args.out,
+        )
+    elif args.cli:
         if not args.arquivo:
             logger.error("Modo CLI requer --arquivo/-f")
             parser.print_help()
@@ -237,9 +601,20 @@ Exemplos:
             ax_x=args.x_label,
             ax_y=args.y_label,
             titulo=args.titulo,
+            todos_pares=args.all_pairs,
+            usar_cache=False if args.no_cache else None,
+            formato_saida=args.output,
+            destino=args.saida,
+            plotar=not args.no_plot,
+            formatos_exportacao=args.export,
+            pasta_exportacao=args.out,
+            workers=args.workers,
+            janela=args.janela,
+            segmentos=args.segmentos,
+            ponderada=args.ponderada,
         )
     else:
-        modo_gui()
+        modo_gui(usar_cache=False if args.no_cache else None)
 
 
 if __name__ == "__main__":
@@ -2,19 +2,26 @@
 SCalc - Sistema de Calculo e Analise de Regressao Linear
 
 Modulo principal do SCalc. Expoe as principais funcoes para facil acesso.
+
+As exportacoes sao carregadas sob demanda (PEP 562): `import src` nao
+importa pandas nem matplotlib; `src.PlotarGrafico` so importa o matplotlib
+quando acessado pela primeira vez.
 """
 
-from src.core import calcular_estatisticas, RegLin, particionar
-from src.visualization import PlotarGrafico
-from src.utils import eh_erro_instrumental
+from src.utils.lazy import exportar_preguicoso
 
 __version__ = '1.0.0'
 __author__ = 'Caio A. Merino'
 
-__all__ = [
-    'calcular_estatisticas',
-    'RegLin',
-    'particionar',
-    'PlotarGrafico',
-    'eh_erro_instrumental'
-]
+# nome exportado -> modulo que o define
+_EXPORTACOES = {
+    'calcular_estatisticas': 'src.core',
+    'RegLin': 'src.core',
+    'particionar': 'src.core',
+    'PlotarGrafico': 'src.visualization',
+    'eh_erro_instrumental': 'src.utils',
+}
+
+__all__ = list(_EXPORTACOES)
+
+__getattr__, __dir__ = exportar_preguicoso(__name__, _EXPORTACOES)
@@ -0,0 +1,10 @@
+"""
+Modulo de Aplicacao
+
+Contem os modos que orquestram arquivos inteiros: encontram e carregam os
+arquivos (src.data) e entregam as tabelas ja carregadas ao pipeline de
+src.core. O core nao depende deste pacote.
+
+Nao exporta nada: importe os submodulos diretamente (ex.:
+from src.app.lote import processar_lote).
+"""
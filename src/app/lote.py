@@ -0,0 +1,176 @@
+"""
+Modulo de Processamento em Lote
+
+Contem o processamento de muitos arquivos de entrada em um pool de
+processos: cada worker importa pandas/numpy uma unica vez e processa varios
+arquivos, e falhas ficam isoladas por arquivo (uma linha de 'erro' no
+resumo, sem interromper o lote).
+"""
+
+import glob
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from src.core.analise import Analise
+from src.core.exceptions import DadosInvalidosException
+from src.data import leitores
+from src.data.config import Config
+from src.data.entrada import carregar_tabela
+
+logger = logging.getLogger(__name__)
+
+COLUNAS_RESUMO = [
+    'arquivo', 'status', 'erro', 'prefixo_x', 'prefixo_y', 'n_pontos',
+    'slope', 'intercept', 'r_squared', 'qualidade', 'figuras', 'tempo_s',
+]
+
+# exportar(analise, prefixo_x, prefixo_y, nome) -> arquivos gravados
+Exportador = Callable[[Analise, str, str, str], List[str]]
+
+
+def listar_arquivos(alvo: str) -> List[str]:
+    """
+    Arquivos de entrada de um lote.
+
+    Args:
+        alvo (str): Diretorio (todos os arquivos com extensao registrada em
+            leitores, sem recursao) ou padrao glob ('dados/**/*.xlsx').
+
+    Returns:
+        List[str]: Caminhos em ordem alfabetica, sem repeticao.
+    """
+    extensoes = {ext for leitor in leitores.leitores_registrados()
+                 for ext in leitor.extensoes}
+    if os.path.isdir(alvo):
+        candidatos = [os.path.join(alvo, nome) for nome in os.listdir(alvo)]
+    else:
+        candidatos = glob.glob(alvo, recursive=True)
+    return sorted({
+        caminho for caminho in candidatos
+        if os.path.isfile(caminho)
+        and os.path.splitext(caminho)[1].lower() in extensoes
+    })
+
+
+def processar_arquivo(
+    caminho: str,
+    usar_cache: Optional[bool] = None,
+    exportar: Optional[Exportador] = None,
+) -> Dict[str, Any]:
+    """
+    Executa o pipeline do modo CLI em um arquivo e devolve uma linha do resumo.
+
+    Regride os dois primeiros prefixos (ordem alfabetica), como modo_cli.
+    Nunca levanta excecao: falhas viram status 'erro' com a mensagem.
+
+    Args:
+        caminho (str): Arquivo de entrada.
+        usar_cache (bool, optional): Ver entrada.carregar_tabela().
+        exportar (callable, optional): Chamado como
+            exportar(analise, prefixo_x, prefixo_y, nome_base) apos a
+            regressao; os arquivos devolvidos vao para a coluna 'figuras'
+            (separados por ';'). Deve ser serializavel por pickle (funcao de
+            modulo ou functools.partial), ex.: partial(plots.exportar_par, ...).
+
+    Returns:
+        Dict[str, Any]: Linha com as chaves de COLUNAS_RESUMO.
+    """
+    linha: Dict[str, Any] = dict.fromkeys(COLUNAS_RESUMO)
+    linha['arquivo'] = caminho
+    inicio = time.perf_counter()
+    try:
+        analise = Analise(carregar_tabela(caminho, usar_cache=usar_cache))
+        prefixos = analise.prefixos
+        if len(prefixos) < 2:
+            raise DadosInvalidosException(
+                "Minimo de 2 grupos necessario para regressao linear"
+            )
+        prefixo_x, prefixo_y = prefixos[0], prefixos[1]
+        slope, intercept, r_squared = analise.regressao(prefixo_x, prefixo_y)
+        linha.update(
+            status='ok',
+            prefixo_x=prefixo_x,
+            prefixo_y=prefixo_y,
+            n_pontos=len(analise.arrays_prefixo(prefixo_x)[0]),
+            slope=slope,
+            intercept=intercept,
+            r_squared=r_squared,
+            qualidade=Config.validar_r2(r_squared),
+        )
+        if exportar is not None:
+            nome = os.path.splitext(os.path.basename(caminho))[0]
+            linha['figuras'] = ';'.join(exportar(analise, prefixo_x, prefixo_y, nome))
+    except Exception as e:
+        linha.update(status='erro', erro=f"{type(e).__name__}: {e}")
+    linha['tempo_s'] = time.perf_counter() - inicio
+    return linha
+
+
+def _inicializar_worker(nivel_log: str) -> None:
+    """Reduz o log dos workers (um arquivo por vez geraria ruido demais)."""
+    logging.getLogger().setLevel(getattr(logging, nivel_log.upper()))
+
+
+def processar_lote(
+    arquivos: Iterable[str],
+    workers: Optional[int] = None,
+    usar_cache: Optional[bool] = None,
+    exportar: Optional[Exportador] = None,
+) -> pd.DataFrame:
+    """
+    Processa varios arquivos em um ProcessPoolExecutor.
+
+    Com `exportar`, cada figura e renderizada no mesmo worker que processou
+    o arquivo, de modo que a renderizacao (sequencial no matplotlib) tambem
+    e distribuida pelo pool.
+
+    Args:
+        arquivos (Iterable[str]): Arquivos de entrada.
+        workers (int, optional): Numero de processos (padrao:
+            Config.Lote.WORKERS ou os.cpu_count()). Com 1 worker, roda no
+            proprio processo, sem pool.
+        usar_cache (bool, optional): Ver entrada.carregar_tabela().
+        exportar (callable, optional): Ver processar_arquivo().
+
+    Returns:
+        pd.DataFrame: Resumo com uma linha por arquivo (colunas
+            COLUNAS_RESUMO), na ordem de entrada.
+    """
+    arquivos = list(arquivos)
+    if workers is None:
+        workers = Config.Lote.WORKERS or os.cpu_count() or 1
+    workers = max(1, min(workers, len(arquivos) or 1))
+
+    linhas: List[Optional[Dict[str, Any]]] = [None] * len(arquivos)
+    if workers == 1:
+        linhas = [processar_arquivo(caminho, usar_cache, exportar) for caminho in arquivos]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_inicializar_worker,
+            initargs=(Config.Lote.NIVEL_LOG_WORKER,),
+        ) as executor:
+            futuros = {
+                executor.submit(processar_arquivo, caminho, usar_cache, exportar): i
+                for i, caminho in enumerate(arquivos)
+            }
+            for concluidos, futuro in enumerate(as_completed(futuros), start=1):
+                i = futuros[futuro]
+                try:
+                    linhas[i] = futuro.result()
+                except Exception as e:
+                    # Ex: worker encerrado pelo sistema (BrokenProcessPool)
+                    linhas[i] = dict.fromkeys(COLUNAS_RESUMO)
+                    linhas[i].update(arquivo=arquivos[i], status='erro',
+                                     erro=f"{type(e).__name__}: {e}")
+                if concluidos % 100 == 0:
+                    logger.info(f"Lote: {concluidos}/{len(arquivos)} arquivos")
+
+    tabela = pd.DataFrame(linhas, columns=COLUNAS_RESUMO)
+    tabela['n_pontos'] = tabela['n_pontos'].astype('Int64')
+    return tabela
@@ -0,0 +1,216 @@
+"""
+Modulo de Monitoramento de Pasta
+
+Contem o MonitorPasta, usado pelo modo --watch: verifica periodicamente
+(polling, sem APIs especificas de sistema operacional) uma pasta de
+entrada e processa apenas os arquivos novos ou alterados.
+
+Um arquivo e candidato quando (mtime, tamanho) muda em relacao ao estado
+salvo; so entao seu conteudo e lido para o hash, e ele so e processado se
+o hash mudou (tocar um arquivo sem altera-lo nao gera reprocessamento). O
+estado fica em um arquivo JSON, de modo que reiniciar o monitor nao
+reprocessa o que ja foi processado.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from src.app.lote import COLUNAS_RESUMO, processar_arquivo
+from src.data import leitores
+from src.data.cache import hash_arquivo
+from src.data.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class MonitorPasta:
+    """
+    Processa incrementalmente os arquivos de uma pasta.
+
+    Args:
+        diretorio (str): Pasta monitorada (sem recursao).
+        resultados (str, optional): CSV onde cada resultado e acrescentado
+            (padrao: Config.Monitor.ARQUIVO_RESULTADOS).
+        arquivo_estado (str, optional): JSON de estado (padrao:
+            <diretorio>/Config.Monitor.ARQUIVO_ESTADO).
+        espera_estavel (float, optional): Idade minima, em segundos, do
+            mtime de um arquivo para processa-lo, evitando arquivos ainda
+            em escrita (padrao: Config.Monitor.ESPERA_ESTAVEL_S).
+        usar_cache (bool, optional): Ver entrada.carregar_tabela().
+
+    Examples:
+        >>> monitor = MonitorPasta('entrada/')
+        >>> monitor.executar()          # Ctrl+C para encerrar
+    """
+
+    def __init__(
+        self,
+        diretorio: str,
+        resultados: Optional[str] = None,
+        arquivo_estado: Optional[str] = None,
+        espera_estavel: Optional[float] = None,
+        usar_cache: Optional[bool] = None,
+    ):
+        self.diretorio = Path(diretorio)
+        self.resultados = Path(resultados or Config.Monitor.ARQUIVO_RESULTADOS)
+        self.arquivo_estado = Path(
+            arquivo_estado or self.diretorio / Config.Monitor.ARQUIVO_ESTADO
+        )
+        self.espera_estavel = (
+            Config.Monitor.ESPERA_ESTAVEL_S if espera_estavel is None else espera_estavel
+        )
+        self.usar_cache = usar_cache
+        self.extensoes = {ext for leitor in leitores.leitores_registrados()
+                          for ext in leitor.extensoes}
+        self.estado: Dict[str, Dict[str, Any]] = self._carregar_estado()
+
+    # ------------------------------------------------------------------ #
+    #  Estado                                                             #
+    # ------------------------------------------------------------------ #
+
+    def _carregar_estado(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.arquivo_estado, encoding='utf-8') as arquivo:
+                return json.load(arquivo).get('arquivos', {})
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Estado do monitor ilegivel ({self.arquivo_estado}): {e}")
+            return {}
+
+    def _salvar_estado(self) -> None:
+        """Grava o estado de forma atomica (arquivo temporario + os.replace)."""
+        self.arquivo_estado.parent.mkdir(parents=True, exist_ok=True)
+        descritor, temporario = tempfile.mkstemp(
+            dir=self.arquivo_estado.parent, suffix='.tmp'
+        )
+        with os.fdopen(descritor, 'w', encoding='utf-8') as arquivo:
+            json.dump({'versao': 1, 'arquivos': self.estado}, arquivo, indent=1)
+        os.replace(temporario, self.arquivo_estado)
+
+    # ------------------------------------------------------------------ #
+    #  Varredura                                                          #
+    # ------------------------------------------------------------------ #
+
+    def _ignorar(self, nome: str) -> bool:
+        return (
+            nome.startswith(('.', '~$'))    # ocultos e travas do Excel
+            or os.path.splitext(nome)[1].lower() not in self.extensoes
+        )
+
+    def candidatos(self) -> List[str]:
+        """
+        Arquivos cujo (mtime, tamanho) mudou desde o ultimo processamento.
+
+        Usa apenas os.scandir + stat; nenhum arquivo e aberto aqui. Arquivos
+        removidos da pasta saem do estado. O estado e indexado pelo nome do
+        arquivo, de modo que a pasta pode ser passada como caminho relativo
+        ou absoluto.
+
+        Returns:
+            List[str]: Nomes dos arquivos alterados, em ordem alfabetica.
+        """
+        agora = time.time()
+        ignorados = {self.resultados.resolve(), self.arquivo_estado.resolve()}
+        vistos = set()
+        alterados = []
+        with os.scandir(self.diretorio) as entradas:
+            for entrada in entradas:
+                if self._ignorar(entrada.name) or not entrada.is_file():
+                    continue
+                if Path(entrada.path).resolve() in ignorados:
+                    continue
+                vistos.add(entrada.name)
+                info = entrada.stat()
+                registro = self.estado.get(entrada.name)
+                if (registro is not None
+                        and registro['mtime_ns'] == info.st_mtime_ns
+                        and registro['tamanho'] == info.st_size):
+                    continue
+                if agora - info.st_mtime < self.espera_estavel:
+                    continue                # provavelmente ainda em escrita
+                alterados.append(entrada.name)
+
+        for removido in set(self.estado) - vistos:
+            del self.estado[removido]
+        return sorted(alterados)
+
+    def ciclo(self) -> List[Dict[str, Any]]:
+        """
+        Uma verificacao da pasta: processa o que mudou e salva o estado.
+
+        Returns:
+            List[Dict[str, Any]]: Linhas de resultado (COLUNAS_RESUMO) dos
+                arquivos processados neste ciclo.
+        """
+        novos = []
+        tamanho_estado = len(self.estado)
+        candidatos = self.candidatos()
+        for nome in candidatos:
+            caminho = str(self.diretorio / nome)
+            try:
+                info = os.stat(caminho)
+                resumo = hash_arquivo(caminho)
+            except OSError as e:
+                logger.warning(f"{nome}: arquivo inacessivel ({e}); nova tentativa no proximo ciclo")
+                continue
+            registro = self.estado.get(nome)
+            self.estado[nome] = {
+                'mtime_ns': info.st_mtime_ns,
+                'tamanho': info.st_size,
+                'hash': resumo,
+                'status': registro['status'] if registro else None,
+            }
+            if registro is not None and registro['hash'] == resumo:
+                continue                    # tocado, mas com o mesmo conteudo
+
+            linha = processar_arquivo(caminho, usar_cache=self.usar_cache)
+            self.estado[nome]['status'] = linha['status']
+            self._acrescentar_resultado(linha)
+            self._salvar_estado()           # um reinicio nao reprocessa este arquivo
+            novos.append(linha)
+            if linha['status'] == 'ok':
+                logger.info(
+                    f"{nome}: y = {linha['slope']:.6f}x + "
+                    f"{linha['intercept']:.6f} (R2 = {linha['r_squared']:.6f})"
+                )
+            else:
+                logger.warning(f"{nome}: {linha['erro']}")
+
+        if candidatos or len(self.estado) != tamanho_estado:
+            self._salvar_estado()
+        return novos
+
+    def _acrescentar_resultado(self, linha: Dict[str, Any]) -> None:
+        """Acrescenta uma linha ao CSV de resultados (cabecalho se novo)."""
+        novo = not self.resultados.exists()
+        self.resultados.parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame([linha], columns=COLUNAS_RESUMO).to_csv(
+            self.resultados, mode='a', header=novo, index=False
+        )
+
+    def executar(self, intervalo: Optional[float] = None,
+                 max_ciclos: Optional[int] = None) -> None:
+        """
+        Verifica a pasta a cada `intervalo` segundos ate ser interrompido.
+
+        Args:
+            intervalo (float, optional): Segundos entre verificacoes
+                (padrao: Config.Monitor.INTERVALO_S).
+            max_ciclos (int, optional): Para apos esse numero de ciclos.
+        """
+        if intervalo is None:
+            intervalo = Config.Monitor.INTERVALO_S
+        ciclos = 0
+        while max_ciclos is None or ciclos < max_ciclos:
+            inicio = time.monotonic()
+            self.ciclo()
+            ciclos += 1
+            time.sleep(max(0.0, intervalo - (time.monotonic() - inicio)))
@@ -1,13 +1,30 @@
 """
 Modulo core - Contem a logica principal de calculos estatisticos e regressao.
+
+As exportacoes sao carregadas sob demanda (PEP 562): importar um submodulo
+leve, como src.core.exceptions, nao importa pandas.
 """
 
-from .statistics import calcular_estatisticas, particionar, calcular_stats_prefixo
-from .regression import RegLin
+from src.utils.lazy import exportar_preguicoso
+
+# nome exportado -> submodulo que o define
+_EXPORTACOES = {
+    'calcular_estatisticas': '.statistics',
+    'calcular_estatisticas_medicoes': '.statistics',
+    'particionar': '.statistics',
+    'particionar_medicoes': '.statistics',
+    'calcular_stats_prefixo': '.statistics',
+    'calcular_stats_medicoes': '.statistics',
+    'TabelaMedicoes': '.medicoes',
+    'RegLin': '.regression',
+    'RegLinPonderada': '.regression',
+    'regressao_todos_pares': '.regression',
+    'IndiceRegressao': '.regression',
+    'regressao_janela': '.segmentos',
+    'regressao_segmentada': '.segmentos',
+    'Analise': '.analise',
+}
+
+__all__ = list(_EXPORTACOES)
 
-__all__ = [
-    'calcular_estatisticas',
-    'particionar',
-    'calcular_stats_prefixo',
-    'RegLin',
-]
+__getattr__, __dir__ = exportar_preguicoso(__name__, _EXPORTACOES)
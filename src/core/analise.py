@@ -0,0 +1,306 @@
+"""
+Modulo de Analise
+
+Contem a classe Analise, o pipeline memoizado compartilhado pelo modo CLI
+(scalc.py) e pela GUI: cada etapa e calculada sob demanda e no maximo uma
+vez por arquivo carregado.
+"""
+
+import logging
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.core.medicoes import TabelaMedicoes
+from src.core.regression import (
+    IndiceRegressao,
+    RegLin,
+    RegLinPonderada,
+    regressao_todos_pares,
+)
+from src.core.segmentos import regressao_janela, regressao_segmentada
+from src.core.statistics import (
+    calcular_estatisticas_medicoes,
+    particionar_medicoes,
+)
+from src.core.exceptions import DadosInvalidosException, RegressaoException
+from src.utils.progresso import Progresso, notificar, subfaixa
+from src.utils.validador import ValidadorDados
+
+logger = logging.getLogger(__name__)
+
+
+class Analise:
+    """
+    Pipeline de analise de um DataFrame no formato SCalc.
+
+    Etapas (todas preguicosas e memoizadas):
+        medicoes       -> particionar_medicoes()        (uma unica vez)
+        estatisticas   -> DataFrame Dados/Media/S_err/T_err
+        arrays_prefixo -> (medias, erros_totais) de um prefixo
+        arrays_por_prefixo -> os arrays de todos os prefixos
+        regressao      -> (slope, intercept, r_squared) de um par (X, Y)
+        regressao_ponderada -> ajuste ponderado pelos T_err (WLS ou York)
+        indice_regressao -> IndiceRegressao de um par (ajustes por faixa de x)
+        janelas        -> regressao em janelas deslizantes de um par
+        segmentos      -> regressao por partes de um par (pontos de quebra)
+        todos_pares    -> tabela com a regressao de todos os pares ordenados
+
+    Examples:
+        >>> analise = Analise(pd.read_excel('dados.xlsx'))
+        >>> analise.prefixos
+        ['a', 'b']
+        >>> slope, intercept, r2 = analise.regressao('a', 'b')
+    """
+
+    def __init__(self, tabela: pd.DataFrame):
+        ValidadorDados.validar_dataframe(tabela, "Tabela de analise")
+        self.tabela = tabela
+        self._medicoes: Optional[TabelaMedicoes] = None
+        self._estatisticas: Optional[pd.DataFrame] = None
+        self._arrays: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._regressoes: Dict[Tuple[str, str], Tuple[float, float, float]] = {}
+        self._ponderadas: Dict[Tuple[str, str], Tuple[float, ...]] = {}
+        self._indices: Dict[Tuple[str, str], IndiceRegressao] = {}
+
+    # ------------------------------------------------------------------ #
+    #  Etapas                                                             #
+    # ------------------------------------------------------------------ #
+
+    @property
+    def medicoes(self) -> TabelaMedicoes:
+        """Tabela particionada (particionar_medicoes), memoizada."""
+        if self._medicoes is None:
+            self._medicoes = particionar_medicoes(self.tabela)
+        return self._medicoes
+
+    @property
+    def estatisticas(self) -> pd.DataFrame:
+        """Estatisticas por ponto: colunas Dados, Media, S_err, T_err (memoizadas)."""
+        if self._estatisticas is None:
+            self._estatisticas = calcular_estatisticas_medicoes(self.medicoes)
+        return self._estatisticas
+
+    def calcular_etapas(self, progresso: Optional[Progresso] = None) -> tuple:
+        """
+        Particiona e calcula estatisticas e arrays por prefixo, sem memoizar.
+
+        Etapas ja memoizadas sao reaproveitadas, mas nada e escrito na
+        instancia: a GUI chama este metodo em uma thread do QThreadPool e
+        guarda o resultado com guardar_etapas() na thread principal.
+
+        Returns:
+            tuple: (medicoes, estatisticas, arrays), com arrays no formato
+                de arrays_por_prefixo().
+
+        Raises:
+            OperacaoCancelada: levantada pelo callback de progresso.
+        """
+        medicoes = self._medicoes
+        if medicoes is None:
+            medicoes = particionar_medicoes(
+                self.tabela, progresso=subfaixa(progresso, 0.0, 0.9)
+            )
+        notificar(progresso, 0.9, 'Calculando estatisticas')
+        estatisticas = self._estatisticas
+        if estatisticas is None:
+            estatisticas = calcular_estatisticas_medicoes(medicoes)
+        arrays = {
+            prefixo: self._arrays.get(prefixo)
+            or self._fatiar(estatisticas, medicoes.faixa_prefixo(prefixo))
+            for prefixo in medicoes.prefixos
+        }
+        notificar(progresso, 1.0, 'Calculando estatisticas')
+        return medicoes, estatisticas, arrays
+
+    def guardar_etapas(self, medicoes: TabelaMedicoes, estatisticas: pd.DataFrame,
+                       arrays: Dict[str, Tuple[np.ndarray, np.ndarray]]) -> None:
+        """
+        Memoiza o resultado de calcular_etapas(). Etapas ja memoizadas sao
+        mantidas, de modo que os arrays ja entregues continuam validos.
+        """
+        if self._medicoes is None:
+            self._medicoes = medicoes
+        if self._estatisticas is None:
+            self._estatisticas = estatisticas
+        for prefixo, par in arrays.items():
+            self._arrays.setdefault(prefixo, par)
+
+    def preparar(self, progresso: Optional[Progresso] = None) -> pd.DataFrame:
+        """
+        Particiona e calcula as estatisticas, reportando o progresso.
+
+        Equivale a acessar `estatisticas` e `arrays_por_prefixo()` (etapas
+        ja calculadas nao sao refeitas): calcular_etapas() seguido de
+        guardar_etapas().
+
+        Raises:
+            OperacaoCancelada: levantada pelo callback de progresso. Como a
+                memoizacao so ocorre no fim, nada fica memoizado nesse caso.
+        """
+        self.guardar_etapas(*self.calcular_etapas(progresso))
+        return self.estatisticas
+
+    @property
+    def prefixos(self) -> List[str]:
+        """Prefixos encontrados, em ordem alfabetica."""
+        return sorted(self.medicoes.prefixos)
+
+    def arrays_prefixo(self, prefixo: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Medias e erros totais de um prefixo, em ordem alfabetica de chaves.
+
+        Os arrays sao fatias somente leitura das colunas de `estatisticas`
+        (sem recalculo nem copia).
+
+        Raises:
+            KeyError: prefixo inexistente.
+        """
+        if prefixo not in self._arrays:
+            faixa = self.medicoes.faixa_prefixo(prefixo)
+            self._arrays[prefixo] = self._fatiar(self.estatisticas, faixa)
+        return self._arrays[prefixo]
+
+    def arrays_por_prefixo(self) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """
+        (medias, erros_totais) de todos os prefixos, em um unico passo.
+
+        Preenche o mesmo cache de arrays_prefixo(); a GUI guarda o
+        dicionario devolvido e troca de par X/Y apenas consultando-o.
+        """
+        if len(self._arrays) < len(self.medicoes.prefixos):
+            for prefixo in self.medicoes.prefixos:
+                if prefixo not in self._arrays:
+                    self._arrays[prefixo] = self._fatiar(
+                        self.estatisticas, self.medicoes.faixa_prefixo(prefixo)
+                    )
+        return dict(self._arrays)
+
+    @staticmethod
+    def _fatiar(estatisticas: pd.DataFrame, faixa: slice) -> Tuple[np.ndarray, np.ndarray]:
+        arrays = (
+            estatisticas['Media'].to_numpy()[faixa],
+            estatisticas['T_err'].to_numpy()[faixa],
+        )
+        for array in arrays:
+            array.flags.writeable = False   # compartilhados com quem consulta
+        return arrays
+
+    def dados_xy(self, prefixo_x: str, prefixo_y: str) -> tuple:
+        """
+        Arrays (x, y, x_err, y_err) validados para a regressao de um par.
+
+        Raises:
+            DadosInvalidosException: prefixo inexistente, menos de 2 pontos
+                ou grupos de tamanhos diferentes.
+        """
+        for prefixo in (prefixo_x, prefixo_y):
+            if prefixo not in self.medicoes.prefixos:
+                raise DadosInvalidosException(
+                    f"Grupo '{prefixo}' nao encontrado nos dados"
+                )
+
+        x, x_err = self.arrays_prefixo(prefixo_x)
+        y, y_err = self.arrays_prefixo(prefixo_y)
+
+        if len(x) < 2 or len(y) < 2:
+            raise DadosInvalidosException(
+                "Dados insuficientes para regressao linear "
+                "(minimo 2 pontos por grupo)"
+            )
+        if len(x) != len(y):
+            raise DadosInvalidosException(
+                f"Grupos com tamanhos diferentes: "
+                f"{prefixo_x}={len(x)}, {prefixo_y}={len(y)}"
+            )
+        return x, y, x_err, y_err
+
+    def regressao(self, prefixo_x: str, prefixo_y: str) -> Tuple[float, float, float]:
+        """
+        Regressao linear (RegLin) de Y contra X, memoizada por par.
+
+        Raises:
+            DadosInvalidosException: ver dados_xy().
+            RegressaoException: falha no calculo da regressao.
+        """
+        par = (prefixo_x, prefixo_y)
+        if par not in self._regressoes:
+            x, y, _, _ = self.dados_xy(prefixo_x, prefixo_y)
+            try:
+                self._regressoes[par] = RegLin(x, y)
+            except Exception as e:
+                raise RegressaoException(f"Erro na regressao linear: {e}") from e
+        return self._regressoes[par]
+
+    def regressao_ponderada(self, prefixo_x: str, prefixo_y: str) -> Tuple[float, ...]:
+        """
+        Regressao de Y contra X ponderada pelos erros totais (T_err),
+        memoizada por par: York quando algum erro de X e nao nulo, senao
+        minimos quadrados ponderados em y (RegLinPonderada).
+
+        Returns:
+            Tuple[float, ...]: (slope, intercept, r_squared, erro_slope,
+                erro_intercept, chi2_reduzido).
+
+        Raises:
+            DadosInvalidosException: ver dados_xy().
+            RegressaoException: erros de Y nao positivos ou falha no ajuste.
+        """
+        par = (prefixo_x, prefixo_y)
+        if par not in self._ponderadas:
+            x, y, x_err, y_err = self.dados_xy(prefixo_x, prefixo_y)
+            erros_x = x_err if np.any(x_err > 0.0) else None
+            try:
+                self._ponderadas[par] = RegLinPonderada(x, y, y_err, erros_x)
+            except Exception as e:
+                raise RegressaoException(f"Erro na regressao ponderada: {e}") from e
+        return self._ponderadas[par]
+
+    def indice_regressao(self, prefixo_x: str, prefixo_y: str) -> IndiceRegressao:
+        """
+        Indice de somas acumuladas do par, memoizado: regressoes sobre
+        qualquer faixa de x em O(log n) (IndiceRegressao.ajuste).
+
+        Raises:
+            DadosInvalidosException: ver dados_xy().
+        """
+        par = (prefixo_x, prefixo_y)
+        if par not in self._indices:
+            x, y, _, _ = self.dados_xy(prefixo_x, prefixo_y)
+            self._indices[par] = IndiceRegressao(x, y)
+        return self._indices[par]
+
+    def janelas(self, prefixo_x: str, prefixo_y: str, janela: int,
+                passo: int = 1) -> pd.DataFrame:
+        """
+        Regressao do par em janelas deslizantes (segmentos.regressao_janela),
+        sobre o indice memoizado.
+
+        Raises:
+            DadosInvalidosException: ver dados_xy().
+            RegressaoException: janela ou passo invalidos.
+        """
+        return regressao_janela(self.indice_regressao(prefixo_x, prefixo_y), janela, passo)
+
+    def segmentos(self, prefixo_x: str, prefixo_y: str,
+                  segmentos: Optional[int] = None, **opcoes) -> pd.DataFrame:
+        """
+        Regressao por partes do par (segmentos.regressao_segmentada), sobre
+        o indice memoizado. Sem `segmentos`, o numero e escolhido pelo BIC.
+
+        Raises:
+            DadosInvalidosException: ver dados_xy().
+            RegressaoException: pontos insuficientes para os segmentos.
+        """
+        return regressao_segmentada(
+            self.indice_regressao(prefixo_x, prefixo_y), segmentos, **opcoes
+        )
+
+    @cached_property
+    def todos_pares(self) -> pd.DataFrame:
+        """Regressao de todos os pares ordenados de prefixos (tabela tidy)."""
+        return regressao_todos_pares({
+            prefixo: self.arrays_prefixo(prefixo)[0] for prefixo in self.prefixos
+        })
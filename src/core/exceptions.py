@@ -39,4 +39,9 @@ class ArquivoInvalidoException(ScalcException):
 
 class ConfiguracaoException(ScalcException):
     """Excecao para problemas de configuracao"""
-    pass
\ No newline at end of file
+    pass
+
+
+class OperacaoCancelada(ScalcException):
+    """Excecao levantada quando uma operacao longa e cancelada pelo usuario"""
+    pass
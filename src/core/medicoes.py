@@ -0,0 +1,150 @@
+"""
+Modulo de Tabela de Medicoes
+
+Contem o container colunar TabelaMedicoes, produzido por
+particionar_medicoes() e consumido pelos calculos estatisticos, pela
+regressao e pela interface grafica.
+"""
+
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+
+class TabelaMedicoes:
+    """
+    Container colunar das medicoes particionadas (formato CSR).
+
+    Todas as repeticoes ficam em um unico array float64 contiguo. As
+    repeticoes do identificador i ocupam valores[offsets[i]:offsets[i + 1]],
+    de modo que qualquer grupo pode ser fatiado sem copia.
+
+    Os identificadores ficam agrupados por prefixo (na ordem de primeira
+    aparicao na planilha) e, dentro de cada prefixo, em ordem alfabetica -
+    a mesma ordem usada pelos calculos estatisticos. Assim cada prefixo
+    ocupa uma faixa contigua de identificadores.
+
+    Attributes:
+        valores (np.ndarray[float64]): todas as repeticoes, concatenadas.
+        offsets (np.ndarray[int64]): len = n_chaves + 1; inicio de cada
+            identificador em `valores`.
+        chaves (np.ndarray[object]): identificadores (ex: 'a_1').
+        codigos_prefixo (np.ndarray[int32]): indice em `prefixos` de cada
+            identificador.
+        prefixos (List[str]): nomes dos prefixos, indexados pelo codigo.
+        erros_instrumentais (np.ndarray[float64]): erro instrumental de
+            cada identificador (NaN quando ausente).
+        contagem_prefixos (Dict[str, int]): pontos por prefixo na coluna de
+            identificadores (o `dados_keys` de particionar()).
+    """
+
+    __slots__ = (
+        'valores', 'offsets', 'chaves', 'codigos_prefixo', 'prefixos',
+        'erros_instrumentais', 'contagem_prefixos', '_inicio_prefixo',
+    )
+
+    def __init__(
+        self,
+        valores: np.ndarray,
+        offsets: np.ndarray,
+        chaves: np.ndarray,
+        codigos_prefixo: np.ndarray,
+        prefixos: List[str],
+        erros_instrumentais: np.ndarray,
+        contagem_prefixos: Dict[str, int] | None = None,
+    ):
+        self.valores = np.ascontiguousarray(valores, dtype=np.float64)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.chaves = np.asarray(chaves, dtype=object)
+        self.codigos_prefixo = np.asarray(codigos_prefixo, dtype=np.int32)
+        self.prefixos = list(prefixos)
+        self.erros_instrumentais = np.asarray(
+            erros_instrumentais, dtype=np.float64
+        )
+        self.contagem_prefixos = dict(contagem_prefixos or {})
+
+        n = len(self.chaves)
+        if len(self.offsets) != n + 1 or self.offsets[-1] != len(self.valores):
+            raise ValueError("offsets inconsistentes com chaves/valores")
+        if len(self.codigos_prefixo) != n or len(self.erros_instrumentais) != n:
+            raise ValueError("arrays por chave com tamanhos diferentes")
+
+        # Inicio da faixa de cada prefixo (identificadores sao contiguos)
+        self._inicio_prefixo = np.searchsorted(
+            self.codigos_prefixo, np.arange(len(self.prefixos) + 1)
+        )
+
+    # ------------------------------------------------------------------ #
+    #  Tamanhos                                                           #
+    # ------------------------------------------------------------------ #
+
+    def __len__(self) -> int:
+        return len(self.chaves)
+
+    @property
+    def n_medicoes(self) -> int:
+        """Numero total de repeticoes armazenadas."""
+        return len(self.valores)
+
+    @property
+    def contagens(self) -> np.ndarray:
+        """Numero de repeticoes de cada identificador."""
+        return np.diff(self.offsets)
+
+    @property
+    def nbytes(self) -> int:
+        """Memoria ocupada pelos arrays numericos (bytes)."""
+        return (
+            self.valores.nbytes + self.offsets.nbytes
+            + self.codigos_prefixo.nbytes + self.erros_instrumentais.nbytes
+        )
+
+    # ------------------------------------------------------------------ #
+    #  Fatiamento (sem copia)                                             #
+    # ------------------------------------------------------------------ #
+
+    def faixa_prefixo(self, prefixo: str) -> slice:
+        """
+        Faixa de identificadores pertencentes a um prefixo.
+
+        Raises:
+            KeyError: prefixo inexistente.
+        """
+        try:
+            codigo = self.prefixos.index(prefixo)
+        except ValueError:
+            raise KeyError(prefixo) from None
+        return slice(
+            int(self._inicio_prefixo[codigo]),
+            int(self._inicio_prefixo[codigo + 1]),
+        )
+
+    def valores_chave(self, indice: int) -> np.ndarray:
+        """Repeticoes do identificador `indice` (view de `valores`)."""
+        return self.valores[self.offsets[indice]:self.offsets[indice + 1]]
+
+    def iterar_prefixo(self, prefixo: str) -> Iterator[Tuple[str, np.ndarray, float]]:
+        """Itera (chave, valores, erro_instrumental) de um prefixo, sem copia."""
+        for i in range(*self.faixa_prefixo(prefixo).indices(len(self))):
+            yield self.chaves[i], self.valores_chave(i), self.erros_instrumentais[i]
+
+    # ------------------------------------------------------------------ #
+    #  Compatibilidade                                                    #
+    # ------------------------------------------------------------------ #
+
+    def para_dicionarios(self) -> tuple:
+        """
+        Converte para o formato de dicionarios retornado por particionar().
+
+        Returns:
+            tuple: (dados_brutos, erros_instrumentais, dados_keys)
+        """
+        dados_brutos: dict = {}
+        erros_instrumentais: dict = {}
+        for prefixo in self.prefixos:
+            grupo_dados = dados_brutos.setdefault(prefixo, {})
+            grupo_erros = erros_instrumentais.setdefault(prefixo, {})
+            for chave, valores, erro in self.iterar_prefixo(prefixo):
+                grupo_dados[chave] = valores.tolist()
+                grupo_erros[chave] = float(erro)
+        return dados_brutos, erros_instrumentais, dict(self.contagem_prefixos)
@@ -5,46 +5,435 @@ Contem funcoes para realizar analise de regressao linear
 e calcular parametros estatisticos da reta.
 """
 
-from scipy.stats import linregress
-from typing import Tuple, List, Any
+from typing import Dict, Tuple, List, Union
 import numpy as np
+import pandas as pd
 
+from src.core.exceptions import RegressaoException
 
-def RegLin(x: List[float], y: List[float]) -> Tuple[float, float, float]:
+# Tolerancia relativa do cancelamento nas diferencas de somas acumuladas
+_TOLERANCIA_SOMAS = 64 * np.finfo(float).eps
+
+# Iteracoes maximas e tolerancia relativa do coeficiente angular de York
+_ITERACOES_YORK = 50
+_TOLERANCIA_YORK = 1e-12
+
+
+def RegLin(
+    x: Union[List[float], np.ndarray],
+    y: Union[List[float], np.ndarray],
+) -> Tuple[float, float, float]:
     """
-    Realiza a regressao linear dos dados usando scipy.stats.linregress.
-    
-    Calcula o coeficiente angular, linear e o coeficiente de determinacao (R2).
-    
+    Realiza a regressao linear dos dados por minimos quadrados (forma fechada).
+
+    Calcula o coeficiente angular, linear e o coeficiente de determinacao (R2)
+    a partir das somas centradas Sxx, Syy e Sxy, sem passar por
+    scipy.stats.linregress. Arrays float64 sao usados sem copia.
+
+    Aceita tambem pilhas 2-D de series de mesmo tamanho (uma serie por
+    linha): todas as regressoes sao calculadas em uma unica chamada
+    vetorizada.
+
     Args:
-        x (List[float]): Lista de valores independentes
-        y (List[float]): Lista de valores dependentes
-        
+        x (List[float] | np.ndarray): Valores independentes, shape (n,) ou
+            (m, n)
+        y (List[float] | np.ndarray): Valores dependentes, mesmo shape de x
+
     Returns:
-        Tuple[float, float, float]: 
+        Tuple[float, float, float]:
             - slope: coeficiente angular (m)
             - intercept: coeficiente linear (b)
             - r_squared: coeficiente de determinacao (R2)
+        Para entradas 2-D, cada item e um np.ndarray de shape (m,).
+
+    Raises:
+        RegressaoException: shapes incompativeis, menos de 2 pontos, ou
+            (entrada 1-D) todos os valores de x identicos. Em pilhas 2-D,
+            series com x constante resultam em NaN.
+
     Notes:
         A equacao da reta e: y = slope * x + intercept
         R2 indica o quao bem a reta se ajusta aos dados (0 a 1)
+        Com y constante, R2 = 0 (mesma convencao de linregress).
     """
-    
-    # Converter listas para arrays numpy (melhora performance e compatibilidade)
-    x_array: Any = np.array(x, dtype=float)
-    y_array: Any = np.array(y, dtype=float)
-    
-    # Realizar regressao linear
-    # linregress retorna uma tupla: (slope, intercept, rvalue, pvalue, stderr)
-    reg_result: Any = linregress(x_array, y_array)
-    
-    # Extrair valores usando indexacao (mais robusto para Pylance)
-    slope: float = float(reg_result[0])      # Coeficiente angular
-    intercept: float = float(reg_result[1])  # Coeficiente linear
-    r_value: float = float(reg_result[2])    # Coeficiente de correlacao
-    
-    # Calcular R2 (coeficiente de determinacao)
-    r_squared: float = r_value * r_value
-    
-    # Retornar slope, intercept e R2
-    return slope, intercept, r_squared
+
+    # Sem copia quando a entrada ja e um ndarray float64
+    x_array = np.asarray(x, dtype=float)
+    y_array = np.asarray(y, dtype=float)
+
+    if x_array.shape != y_array.shape or x_array.ndim not in (1, 2):
+        raise RegressaoException(
+            f"x e y devem ter o mesmo shape 1-D ou 2-D "
+            f"(x={x_array.shape}, y={y_array.shape})"
+        )
+    if x_array.shape[-1] < 2:
+        raise RegressaoException("Regressao linear requer ao menos 2 pontos")
+
+    # Somas centradas (mais estaveis que as somas brutas de x, x2, xy)
+    x_media = x_array.mean(axis=-1, keepdims=True)
+    y_media = y_array.mean(axis=-1, keepdims=True)
+    dx = x_array - x_media
+    dy = y_array - y_media
+    sxx = np.einsum('...i,...i->...', dx, dx)
+    syy = np.einsum('...i,...i->...', dy, dy)
+    sxy = np.einsum('...i,...i->...', dx, dy)
+    x_media = x_media[..., 0]
+    y_media = y_media[..., 0]
+
+    if x_array.ndim == 1 and sxx == 0.0:
+        raise RegressaoException(
+            "Nao e possivel calcular a regressao: todos os valores de x "
+            "sao identicos"
+        )
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = sxy / sxx
+        intercept = y_media - slope * x_media
+        r_value = np.where(
+            (sxx == 0.0) | (syy == 0.0), 0.0, sxy / np.sqrt(sxx * syy)
+        )
+    r_value = np.clip(r_value, -1.0, 1.0)
+    r_squared = r_value * r_value
+
+    if x_array.ndim == 1:
+        return float(slope), float(intercept), float(r_squared)
+    return slope, intercept, np.where(sxx == 0.0, np.nan, r_squared)
+
+
+def RegLinPonderada(
+    x: Union[List[float], np.ndarray],
+    y: Union[List[float], np.ndarray],
+    erros_y: Union[float, List[float], np.ndarray],
+    erros_x: Union[float, List[float], np.ndarray, None] = None,
+    iteracoes: int = _ITERACOES_YORK,
+) -> Tuple:
+    """
+    Regressao linear ponderada pelas incertezas dos pontos.
+
+    Sem `erros_x`, minimos quadrados ponderados (WLS) em y, com pesos
+    1 / erros_y^2, em forma fechada. Com `erros_x`, ajuste de York (2004)
+    para erros em x e y nao correlacionados (regressao de distancia
+    ortogonal ponderada): o coeficiente angular e iterado a partir do WLS,
+    com pesos W = 1 / (erros_y^2 + slope^2 * erros_x^2), ate convergir ou
+    por no maximo `iteracoes` passos. Com erros_x nulos, York se reduz
+    exatamente ao WLS.
+
+    Como RegLin, aceita pilhas 2-D de series de mesmo tamanho: cada passo
+    da iteracao atualiza todas as series de uma vez. Os erros podem ser
+    escalares ou arrays que se propagam (broadcast) para o shape de x.
+
+    Args:
+        x (List[float] | np.ndarray): Valores independentes, shape (n,) ou
+            (m, n)
+        y (List[float] | np.ndarray): Valores dependentes, mesmo shape de x
+        erros_y: Incertezas de y (ex: T_err), positivas.
+        erros_x (optional): Incertezas de x, nao negativas.
+        iteracoes (int): Limite de iteracoes de York.
+
+    Returns:
+        Tuple: (slope, intercept, r_squared, erro_slope, erro_intercept,
+            chi2_reduzido). As incertezas dos parametros sao absolutas
+            (derivadas dos erros informados, sem reescala por chi2);
+            r_squared e ponderado pelos pesos finais; chi2_reduzido e
+            chi2 / (n - 2), NaN com 2 pontos. Para entradas 2-D, cada item
+            e um np.ndarray de shape (m,).
+
+    Raises:
+        RegressaoException: shapes incompativeis, menos de 2 pontos, ou
+            (entrada 1-D) erros invalidos (erros_y <= 0, erros_x < 0, nao
+            finitos) ou x constante. Em pilhas 2-D, essas series resultam
+            em NaN.
+    """
+    x_array = np.asarray(x, dtype=float)
+    y_array = np.asarray(y, dtype=float)
+
+    if x_array.shape != y_array.shape or x_array.ndim not in (1, 2):
+        raise RegressaoException(
+            f"x e y devem ter o mesmo shape 1-D ou 2-D "
+            f"(x={x_array.shape}, y={y_array.shape})"
+        )
+    n = x_array.shape[-1]
+    if n < 2:
+        raise RegressaoException("Regressao linear requer ao menos 2 pontos")
+
+    try:
+        erro_y = np.broadcast_to(np.asarray(erros_y, dtype=float), x_array.shape)
+        erro_x = (np.zeros_like(x_array) if erros_x is None else
+                  np.broadcast_to(np.asarray(erros_x, dtype=float), x_array.shape))
+    except ValueError as e:
+        raise RegressaoException(f"Erros incompativeis com o shape de x: {e}") from e
+
+    # Comparacoes com NaN sao falsas: erros nao finitos tambem invalidam
+    invalido = ~np.all((erro_y > 0.0) & (erro_y < np.inf)
+                       & (erro_x >= 0.0) & (erro_x < np.inf), axis=-1)
+    if x_array.ndim == 1 and invalido:
+        raise RegressaoException(
+            "Erros invalidos: as incertezas devem ser finitas e as de y positivas"
+        )
+    var_y = erro_y * erro_y
+    var_x = None if erros_x is None else erro_x * erro_x
+
+    def _centrar(pesos):
+        # Medias ponderadas e desvios u = x - x_media, v = y - y_media
+        with np.errstate(divide='ignore', invalid='ignore'):
+            soma = pesos.sum(axis=-1)
+            x_media = np.einsum('...i,...i->...', pesos, x_array) / soma
+            y_media = np.einsum('...i,...i->...', pesos, y_array) / soma
+        return soma, x_media, y_media, x_array - x_media[..., None], y_array - y_media[..., None]
+
+    def _somas(pesos, u, v):
+        # Somas centradas ponderadas Sum(w u u), Sum(w u v), Sum(w v v)
+        wu = pesos * u
+        return (np.einsum('...i,...i->...', wu, u),
+                np.einsum('...i,...i->...', wu, v),
+                np.einsum('...i,...i->...', pesos * v, v))
+
+    # Minimos quadrados ponderados: forma fechada, ponto de partida de York
+    with np.errstate(divide='ignore'):
+        pesos = 1.0 / var_y
+    soma, x_media, y_media, u, v = _centrar(pesos)
+    suu, suv, svv = _somas(pesos, u, v)
+    sxx = suu
+    if x_array.ndim == 1 and sxx == 0.0:
+        raise RegressaoException(
+            "Nao e possivel calcular a regressao: todos os valores de x "
+            "sao identicos"
+        )
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = suv / suu
+        var_slope = 1.0 / suu
+        x_barra = x_media
+
+    if var_x is not None:
+        # York: pesos W = 1 / (var_y + slope^2 var_x) e
+        # beta = W (u var_y + slope v var_x); slope = Sum(W beta v) / Sum(W beta u)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for _ in range(iteracoes):
+                pesos = 1.0 / (var_y + slope[..., None] ** 2 * var_x)
+                _, _, _, u, v = _centrar(pesos)
+                wbeta = pesos * pesos * (u * var_y + slope[..., None] * v * var_x)
+                novo = (np.einsum('...i,...i->...', wbeta, v)
+                        / np.einsum('...i,...i->...', wbeta, u))
+                convergiu = ~(np.abs(novo - slope) > _TOLERANCIA_YORK * np.abs(novo))
+                slope = novo
+                if np.all(convergiu):
+                    break
+
+            # Parametros e incertezas com os pesos do slope final; x_ajustado
+            # sao os pontos projetados na reta
+            pesos = 1.0 / (var_y + slope[..., None] ** 2 * var_x)
+            soma, x_media, y_media, u, v = _centrar(pesos)
+            suu, suv, svv = _somas(pesos, u, v)
+            x_ajustado = x_media[..., None] + pesos * (u * var_y + slope[..., None] * v * var_x)
+            x_barra = np.einsum('...i,...i->...', pesos, x_ajustado) / soma
+            u_ajustado = x_ajustado - x_barra[..., None]
+            var_slope = 1.0 / np.einsum('...i,...i->...', pesos * u_ajustado, u_ajustado)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        intercept = y_media - slope * x_media
+        erro_slope = np.sqrt(var_slope)
+        erro_intercept = np.sqrt(1.0 / soma + x_barra ** 2 * var_slope)
+        # A reta passa pelas medias ponderadas: residuo_i = v_i - slope * u_i
+        chi2 = np.maximum(svv - 2.0 * slope * suv + slope * slope * suu, 0.0)
+        chi2_reduzido = chi2 / (n - 2) if n > 2 else np.full_like(chi2, np.nan)
+        r_value = np.where(svv == 0.0, 0.0, suv / np.sqrt(suu * svv))
+    r_squared = np.clip(r_value, -1.0, 1.0) ** 2
+
+    resultado = (slope, intercept, r_squared, erro_slope, erro_intercept, chi2_reduzido)
+    if x_array.ndim == 1:
+        return tuple(float(v) for v in resultado)
+    invalido = invalido | (sxx == 0.0)
+    return tuple(np.where(invalido, np.nan, v) for v in resultado)
+
+
+def regressao_todos_pares(medias: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """
+    Regressao linear de todos os pares ordenados (X, Y) de prefixos.
+
+    Em vez de chamar RegLin par a par, empilha as medias de cada prefixo em
+    uma matriz M (p x n), centraliza as linhas e obtem as somas Sxy de todos
+    os pares com um unico produto C @ C.T. Para p prefixos sao p * (p - 1)
+    ajustes. Prefixos com numeros de pontos diferentes nao sao pareados
+    (cada tamanho forma um bloco independente).
+
+    Args:
+        medias (Dict[str, np.ndarray]): prefixo -> medias por ponto, em
+            ordem alfabetica de chaves (ex: Analise.arrays_prefixo()[0]).
+
+    Returns:
+        pd.DataFrame: uma linha por par ordenado, com as colunas
+            'X', 'Y', 'slope', 'intercept', 'r_squared', 'n'. Pares com X
+            constante tem slope/intercept/r_squared NaN.
+    """
+    colunas = ['X', 'Y', 'slope', 'intercept', 'r_squared', 'n']
+    blocos: List[pd.DataFrame] = []
+
+    por_tamanho: Dict[int, List[str]] = {}
+    for prefixo in sorted(medias):
+        por_tamanho.setdefault(len(medias[prefixo]), []).append(prefixo)
+
+    for n, prefixos in por_tamanho.items():
+        p = len(prefixos)
+        if p < 2 or n < 2:
+            continue
+
+        matriz = np.vstack([np.asarray(medias[pr], dtype=float) for pr in prefixos])
+        media = matriz.mean(axis=1)
+        centrada = matriz - media[:, None]
+        s = centrada @ centrada.T          # s[i, j] = Sum(dx_i * dx_j)
+        var = np.diag(s)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Par (X = i, Y = j): slope = Sxy / Sxx
+            slope = s / var[:, None]
+            intercept = media[None, :] - slope * media[:, None]
+            r2 = np.clip(s * s / np.outer(var, var), 0.0, 1.0)
+        r2 = np.where(var[None, :] == 0.0, 0.0, r2)
+        r2 = np.where(var[:, None] == 0.0, np.nan, r2)
+
+        i, j = np.nonzero(~np.eye(p, dtype=bool))
+        nomes = np.array(prefixos, dtype=object)
+        blocos.append(pd.DataFrame({
+            'X': nomes[i],
+            'Y': nomes[j],
+            'slope': slope[i, j],
+            'intercept': intercept[i, j],
+            'r_squared': r2[i, j],
+            'n': n,
+        }))
+
+    if not blocos:
+        return pd.DataFrame(columns=colunas)
+    return pd.concat(blocos, ignore_index=True).sort_values(
+        ['X', 'Y'], ignore_index=True
+    )
+
+
+class IndiceRegressao:
+    """
+    Somas acumuladas de um par (x, y) para regressoes em faixas de x.
+
+    Os pontos (finitos) sao ordenados por x e deslocados pelas medias
+    globais; as somas acumuladas de x, y, x2, y2 e xy (com 0 inicial) dao
+    as somas centradas Sxx, Syy e Sxy de qualquer faixa contigua [i, j) por
+    diferenca. Assim, o RegLin de uma faixa de indices custa O(1) e o de
+    uma faixa de valores de x, localizada por busca binaria, O(log n) -
+    contra O(n) de RegLin(x[mascara], y[mascara]). Construido uma vez por
+    par (Analise.indice_regressao), em O(n log n).
+
+    O deslocamento pelas medias reduz a perda de precisao das somas brutas.
+    Faixas cuja variancia de x se perde no arredondamento das somas (x
+    praticamente constante na faixa) sao tratadas como x constante.
+
+    Examples:
+        >>> indice = IndiceRegressao(x, y)
+        >>> slope, intercept, r2 = indice.ajuste(2.0, 8.0)    # 2 <= x <= 8
+        >>> indice.ajuste_indices(np.arange(0, 90), np.arange(10, 100))
+    """
+
+    def __init__(
+        self,
+        x: Union[List[float], np.ndarray],
+        y: Union[List[float], np.ndarray],
+    ):
+        x_array = np.asarray(x, dtype=float)
+        y_array = np.asarray(y, dtype=float)
+        if x_array.shape != y_array.shape or x_array.ndim != 1:
+            raise RegressaoException(
+                f"x e y devem ter o mesmo shape 1-D "
+                f"(x={x_array.shape}, y={y_array.shape})"
+            )
+
+        finitos = np.isfinite(x_array) & np.isfinite(y_array)
+        ordem = np.argsort(x_array[finitos], kind='stable')
+        self.x = x_array[finitos][ordem]
+        self.y = y_array[finitos][ordem]
+        if len(self.x) < 2:
+            raise RegressaoException("Regressao linear requer ao menos 2 pontos")
+
+        self._x0 = self.x.mean()
+        self._y0 = self.y.mean()
+        dx = self.x - self._x0
+        dy = self.y - self._y0
+        self._sx, self._sy, self._sxx, self._syy, self._sxy = (
+            np.concatenate(([0.0], np.cumsum(v)))
+            for v in (dx, dy, dx * dx, dy * dy, dx * dy)
+        )
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def faixa(self, x_min: float = -np.inf, x_max: float = np.inf) -> Tuple[int, int]:
+        """Indices [i, j) dos pontos com x_min <= x <= x_max (busca binaria)."""
+        return (int(np.searchsorted(self.x, x_min, side='left')),
+                int(np.searchsorted(self.x, x_max, side='right')))
+
+    def somas(self, i, j) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (n, Sxx, Syy, Sxy) das faixas [i, j), por diferenca de somas acumuladas.
+
+        Somas centradas na media de cada faixa; valores desprezados pelo
+        arredondamento sao zerados (ver classe). Aceita escalares ou arrays.
+        """
+        i = np.asarray(i, dtype=np.intp)
+        j = np.asarray(j, dtype=np.intp)
+        n = (j - i).astype(float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sx = self._sx[j] - self._sx[i]
+            sy = self._sy[j] - self._sy[i]
+            sxx = (self._sxx[j] - self._sxx[i]) - sx * sx / n
+            syy = (self._syy[j] - self._syy[i]) - sy * sy / n
+            sxy = (self._sxy[j] - self._sxy[i]) - sx * sy / n
+        sxx = np.where(sxx > _TOLERANCIA_SOMAS * self._sxx[j], sxx, 0.0)
+        syy = np.where(syy > _TOLERANCIA_SOMAS * self._syy[j], syy, 0.0)
+        return n, sxx, syy, sxy
+
+    def ajuste_indices(self, i, j) -> Tuple:
+        """
+        RegLin dos pontos [i, j) (na ordem crescente de x), em O(1).
+
+        Aceita arrays de inicios e fins de mesmo shape: todas as faixas sao
+        ajustadas em uma unica operacao vetorizada.
+
+        Returns:
+            Tuple: (slope, intercept, r_squared), como RegLin. Para arrays,
+                cada item e um np.ndarray, com NaN nas faixas de menos de 2
+                pontos ou com x constante.
+
+        Raises:
+            RegressaoException: (faixa escalar) menos de 2 pontos ou todos
+                os valores de x identicos.
+        """
+        n, sxx, syy, sxy = self.somas(i, j)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sx = self._sx[j] - self._sx[i]
+            sy = self._sy[j] - self._sy[i]
+            slope = sxy / sxx
+            # Reta nos dados deslocados, levada de volta a x e y originais
+            intercept = (sy - slope * sx) / n + self._y0 - slope * self._x0
+            r_value = np.where(syy == 0.0, 0.0, sxy / np.sqrt(sxx * syy))
+        r_squared = np.clip(r_value, -1.0, 1.0) ** 2
+
+        if np.ndim(n) == 0:
+            if n < 2:
+                raise RegressaoException("Regressao linear requer ao menos 2 pontos")
+            if sxx == 0.0:
+                raise RegressaoException(
+                    "Nao e possivel calcular a regressao: todos os valores de x "
+                    "sao identicos"
+                )
+            return float(slope), float(intercept), float(r_squared)
+
+        invalido = (n < 2) | (sxx == 0.0)
+        return (np.where(invalido, np.nan, slope),
+                np.where(invalido, np.nan, intercept),
+                np.where(invalido, np.nan, r_squared))
+
+    def ajuste(self, x_min: float = -np.inf, x_max: float = np.inf) -> Tuple[float, float, float]:
+        """
+        RegLin dos pontos com x_min <= x <= x_max, em O(log n).
+
+        Raises:
+            RegressaoException: menos de 2 pontos na faixa ou x constante.
+        """
+        return self.ajuste_indices(*self.faixa(x_min, x_max))
@@ -0,0 +1,265 @@
+"""
+Modulo de Regressao por Janelas e Segmentos
+
+Ajustes lineares locais sobre o indice de somas acumuladas de um par
+(IndiceRegressao), para series com mudancas de regime:
+
+    regressao_janela     : RegLin de cada janela deslizante de `janela`
+                           pontos consecutivos (em ordem de x), em O(n) no
+                           total - cada janela custa O(1) por diferenca de
+                           somas acumuladas, sem recalcular a janela inteira.
+    regressao_segmentada : reta por partes com k segmentos independentes e
+                           soma dos quadrados dos residuos (SSE) minima, por
+                           programacao dinamica sobre a tabela de custos
+                           SSE(i, j) obtida das mesmas somas acumuladas. Sem
+                           k, o numero de segmentos e escolhido pelo BIC.
+
+Examples:
+    >>> indice = IndiceRegressao(x, y)
+    >>> regressao_janela(indice, 50)              # uma linha por janela
+    >>> regressao_segmentada(indice, segmentos=3)  # uma linha por segmento
+"""
+
+import logging
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from src.core.exceptions import RegressaoException
+from src.core.regression import IndiceRegressao
+from src.data.colunas import COLUNAS_JANELA, COLUNAS_SEGMENTO
+from src.data.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Varreduras maximas do refinamento local dos pontos de quebra
+_MAX_VARREDURAS = 20
+
+
+def regressao_janela(indice: IndiceRegressao, janela: int, passo: int = 1) -> pd.DataFrame:
+    """
+    Regressao linear em janelas deslizantes de `janela` pontos.
+
+    As janelas cobrem os pontos [s, s + janela) na ordem crescente de x do
+    indice, para s = 0, passo, 2 * passo, ... Todas sao ajustadas em uma
+    unica chamada vetorizada de IndiceRegressao.ajuste_indices.
+
+    Args:
+        indice (IndiceRegressao): Somas acumuladas do par.
+        janela (int): Pontos por janela (>= 2).
+        passo (int): Deslocamento entre janelas consecutivas (>= 1).
+
+    Returns:
+        pd.DataFrame: Colunas COLUNAS_JANELA, uma linha por janela; x_inicio
+            e x_fim sao o menor e o maior x da janela. Janelas com x
+            constante tem slope/intercept/r_squared NaN.
+
+    Raises:
+        RegressaoException: janela menor que 2 ou maior que o numero de
+            pontos, ou passo menor que 1.
+    """
+    n = len(indice)
+    if not 2 <= janela <= n:
+        raise RegressaoException(
+            f"Janela deve ter entre 2 e {n} pontos (recebido: {janela})"
+        )
+    if passo < 1:
+        raise RegressaoException(f"Passo deve ser ao menos 1 (recebido: {passo})")
+
+    inicios = np.arange(0, n - janela + 1, passo)
+    fins = inicios + janela
+    slope, intercept, r_squared = indice.ajuste_indices(inicios, fins)
+    return pd.DataFrame({
+        'x_inicio': indice.x[inicios],
+        'x_fim': indice.x[fins - 1],
+        'slope': slope,
+        'intercept': intercept,
+        'r_squared': r_squared,
+        'n': janela,
+    }, columns=COLUNAS_JANELA)
+
+
+def _custo(indice: IndiceRegressao, i, j) -> np.ndarray:
+    """SSE da reta de minimos quadrados nos pontos [i, j) (vetorizado)."""
+    _, sxx, syy, sxy = indice.somas(i, j)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sse = np.where(sxx > 0.0, syy - sxy * sxy / sxx, syy)
+    return np.maximum(sse, 0.0)
+
+
+def _candidatos(indice: IndiceRegressao, max_candidatos: int) -> np.ndarray:
+    """
+    Posicoes de fronteira entre segmentos: 0, n e os indices t em que x
+    muda (x[t - 1] < x[t]), para nao separar pontos de mesmo x. Acima de
+    max_candidatos, uma grade uniforme dessas posicoes.
+    """
+    n = len(indice)
+    internas = np.flatnonzero(np.diff(indice.x) > 0.0) + 1
+    if len(internas) > max_candidatos:
+        internas = internas[np.linspace(0, len(internas) - 1, max_candidatos).astype(np.intp)]
+    return np.unique(np.concatenate(([0], internas, [n])))
+
+
+def _programacao_dinamica(indice: IndiceRegressao, posicoes: np.ndarray,
+                          max_segmentos: int, min_pontos: int):
+    """
+    Particao otima de posicoes[0]..posicoes[-1] em 1..max_segmentos partes.
+
+    custo[a, b] = SSE do segmento [posicoes[a], posicoes[b]) (inf abaixo de
+    min_pontos); melhor[k][b] = min_a melhor[k - 1][a] + custo[a, b], com a
+    minimizacao de cada k vetorizada sobre a tabela inteira.
+
+    Returns:
+        (sse_total, quebras): sse_total[k - 1] e o SSE otimo com k
+            segmentos (inf se inviavel); quebras[k - 1] sao os indices de
+            fronteira (inicio de cada segmento e n).
+    """
+    m = len(posicoes)
+    a, b = np.triu_indices(m, k=1)
+    custo = np.full((m, m), np.inf)
+    valido = posicoes[b] - posicoes[a] >= min_pontos
+    custo[a[valido], b[valido]] = _custo(indice, posicoes[a[valido]], posicoes[b[valido]])
+
+    melhor = custo[0].copy()
+    origens = []
+    sse_total = [melhor[-1]]
+    for _ in range(1, max_segmentos):
+        total = melhor[:, None] + custo
+        origem = np.argmin(total, axis=0)
+        melhor = total[origem, np.arange(m)]
+        origens.append(origem)
+        sse_total.append(melhor[-1])
+
+    quebras = []
+    for k in range(1, max_segmentos + 1):
+        fronteiras = [m - 1]
+        for origem in reversed(origens[:k - 1]):
+            fronteiras.append(origem[fronteiras[-1]])
+        fronteiras.append(0)
+        quebras.append(posicoes[fronteiras[::-1]])
+    return np.array(sse_total), quebras
+
+
+def _refinar(indice: IndiceRegressao, fronteiras: np.ndarray,
+             permitidas: np.ndarray, min_pontos: int) -> np.ndarray:
+    """
+    Desloca cada fronteira interna para a posicao permitida de menor SSE
+    entre as fronteiras vizinhas, ate nao haver melhora (a SSE total nunca
+    aumenta). Recupera a precisao perdida pela grade de candidatos.
+    """
+    fronteiras = fronteiras.copy()
+    for _ in range(_MAX_VARREDURAS):
+        mudou = False
+        for s in range(1, len(fronteiras) - 1):
+            inicio, fim = fronteiras[s - 1], fronteiras[s + 1]
+            t = permitidas[(permitidas >= inicio + min_pontos)
+                           & (permitidas <= fim - min_pontos)]
+            if len(t) == 0:
+                continue
+            sse = _custo(indice, inicio, t) + _custo(indice, t, fim)
+            atual = _custo(indice, inicio, fronteiras[s]) + _custo(indice, fronteiras[s], fim)
+            k = int(np.argmin(sse))
+            if sse[k] < atual and t[k] != fronteiras[s]:
+                fronteiras[s] = t[k]
+                mudou = True
+        if not mudou:
+            break
+    return fronteiras
+
+
+def _bic(sse: np.ndarray, n: int) -> np.ndarray:
+    """BIC de cada k (2 parametros por reta e k - 1 quebras: 3k - 1)."""
+    k = np.arange(1, len(sse) + 1)
+    piso = np.finfo(float).tiny
+    return n * np.log(np.maximum(sse, piso) / n) + (3 * k - 1) * np.log(n)
+
+
+def regressao_segmentada(
+    indice: IndiceRegressao,
+    segmentos: Optional[int] = None,
+    max_segmentos: Optional[int] = None,
+    min_pontos: Optional[int] = None,
+    max_candidatos: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Regressao linear por partes com pontos de quebra otimos.
+
+    Divide os pontos, em ordem de x, em segmentos contiguos com uma reta
+    independente cada, minimizando a soma dos SSE dos segmentos. A tabela
+    de custos SSE(i, j) vem das somas acumuladas do indice (O(1) por
+    entrada) e a particao otima, da programacao dinamica sobre ela.
+
+    Para ate max_candidatos posicoes de quebra a solucao e exata. Acima
+    disso, a programacao dinamica roda sobre uma grade uniforme de
+    max_candidatos posicoes e cada quebra e refinada, ponto a ponto, entre
+    as quebras vizinhas: o resultado e otimo na grade e localmente otimo
+    nos pontos, em O(n + k * max_candidatos^2) em vez de O(k * n^2).
+
+    Args:
+        indice (IndiceRegressao): Somas acumuladas do par.
+        segmentos (int, optional): Numero de segmentos. None escolhe, entre
+            1 e max_segmentos, o de menor BIC.
+        max_segmentos (int, optional): Limite da escolha automatica
+            (padrao: Config.Segmentos.MAX_SEGMENTOS).
+        min_pontos (int, optional): Pontos minimos por segmento (padrao:
+            Config.Segmentos.MIN_PONTOS; ao menos 2).
+        max_candidatos (int, optional): Tamanho da grade de quebras
+            (padrao: Config.Segmentos.MAX_CANDIDATOS).
+
+    Returns:
+        pd.DataFrame: Colunas COLUNAS_SEGMENTO, uma linha por segmento em
+            ordem de x; 'sse' e a soma dos quadrados dos residuos do
+            segmento. Segmentos com x constante tem slope/intercept/
+            r_squared NaN (a reta e a media de y).
+
+    Raises:
+        RegressaoException: parametros invalidos, ou pontos insuficientes
+            para `segmentos` segmentos de min_pontos pontos.
+    """
+    max_segmentos = max_segmentos or Config.Segmentos.MAX_SEGMENTOS
+    min_pontos = max(2, min_pontos or Config.Segmentos.MIN_PONTOS)
+    max_candidatos = max_candidatos or Config.Segmentos.MAX_CANDIDATOS
+    if segmentos is not None:
+        if segmentos < 1:
+            raise RegressaoException(
+                f"Numero de segmentos deve ser ao menos 1 (recebido: {segmentos})"
+            )
+        max_segmentos = segmentos
+
+    n = len(indice)
+    permitidas = _candidatos(indice, n)
+    posicoes = _candidatos(indice, max_candidatos)
+    sse_total, quebras = _programacao_dinamica(indice, posicoes, max_segmentos, min_pontos)
+
+    if segmentos is None:
+        viaveis = np.isfinite(sse_total)
+        if not viaveis.any():
+            raise RegressaoException(
+                f"Pontos insuficientes para segmentos de {min_pontos} pontos (n={n})"
+            )
+        bic = np.where(viaveis, _bic(sse_total, n), np.inf)
+        segmentos = int(np.argmin(bic)) + 1
+        logger.debug(f"Segmentos escolhidos pelo BIC: {segmentos} (BIC={bic.tolist()})")
+    elif not np.isfinite(sse_total[segmentos - 1]):
+        raise RegressaoException(
+            f"Pontos insuficientes para {segmentos} segmentos de "
+            f"{min_pontos} pontos (n={n})"
+        )
+
+    fronteiras = quebras[segmentos - 1]
+    if len(posicoes) < len(permitidas):
+        fronteiras = _refinar(indice, fronteiras, permitidas, min_pontos)
+
+    inicios, fins = fronteiras[:-1], fronteiras[1:]
+    slope, intercept, r_squared = indice.ajuste_indices(inicios, fins)
+    return pd.DataFrame({
+        'segmento': np.arange(1, segmentos + 1),
+        'x_inicio': indice.x[inicios],
+        'x_fim': indice.x[fins - 1],
+        'slope': slope,
+        'intercept': intercept,
+        'r_squared': r_squared,
+        'n': fins - inicios,
+        'sse': _custo(indice, inicios, fins),
+    }, columns=COLUNAS_SEGMENTO)
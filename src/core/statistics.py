@@ -6,13 +6,15 @@ e erro total a partir de dados em DataFrame.
 """
 
 import logging
-import math
+from typing import Optional
+
+import numpy as np
 import pandas as pd
-import pandas as _pd  # alias usado internamente em particionar()
-from collections import defaultdict
 
-from src.utils.parsers import eh_erro_instrumental, extrair_prefixo
+from src.utils.parsers import eh_erro_instrumental
+from src.utils.progresso import Progresso, notificar
 from src.utils.validador import ValidadorDados
+from src.core.medicoes import TabelaMedicoes
 from src.core.exceptions import (
     DadosInvalidosException,
     DadosInsuficientesException,
@@ -22,11 +24,67 @@ from src.core.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Mesmo padrao de extrair_prefixo(), aplicado de uma vez a uma pd.Series
+_REGEX_PREFIXO = r'^([a-zA-Z]+)'
+
 
 # --------------------------------------------------------------------------- #
-#  Helper interno (exportado para evitar duplicacao em scalc.py)              #
+#  Helpers de calculo por grupo (exportados para evitar duplicacao)           #
 # --------------------------------------------------------------------------- #
 
+def _estatisticas_segmentadas(
+    valores: np.ndarray,
+    offsets: np.ndarray,
+    erros_instrumentais: np.ndarray,
+) -> tuple:
+    """
+    Media, erro estatistico e erro total de todas as chaves em uma passada.
+
+    Kernel vetorizado comum a calcular_estatisticas(), calcular_stats_prefixo()
+    e calcular_stats_medicoes(). As repeticoes de cada chave sao segmentos
+    contiguos de `valores` (formato CSR) e as somas por segmento sao feitas
+    com np.add.reduceat, sem lacos Python por chave.
+
+    Args:
+        valores (np.ndarray): repeticoes concatenadas (float64).
+        offsets (np.ndarray): len = n_chaves + 1; segmentos nao vazios.
+        erros_instrumentais (np.ndarray): erro instrumental por chave;
+            NaN e tratado como 0.0.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: (medias, s_err, t_err)
+
+    Notes:
+        Erro estatistico  = desvio_padrao_amostral / sqrt(n)  (n > 1)
+                          = 0.0                               (n == 1)
+        Erro total        = sqrt(erro_estatistico^2 + erro_instrumental^2)
+    """
+    inicios = offsets[:-1]
+    n = np.diff(offsets)
+    if len(n) == 0:
+        vazio = np.empty(0)
+        return vazio, vazio.copy(), vazio.copy()
+
+    medias = np.add.reduceat(valores, inicios) / n
+
+    # Variancia em duas passagens (desvios em relacao a media do segmento)
+    desvios = valores - np.repeat(medias, n)
+    soma_quadrados = np.add.reduceat(desvios * desvios, inicios)
+
+    s_err = np.zeros(len(n))
+    multiplas = n > 1
+    s_err[multiplas] = (
+        np.sqrt(soma_quadrados[multiplas] / (n[multiplas] - 1))
+        / np.sqrt(n[multiplas])
+    )
+
+    i_err = np.nan_to_num(
+        np.asarray(erros_instrumentais, dtype=float), nan=0.0
+    )
+    t_err = np.sqrt(s_err ** 2 + i_err ** 2)
+    return medias, s_err, t_err
+
+
 def calcular_stats_prefixo(
     dados_por_chave: dict,
     erros_por_chave: dict,
@@ -34,8 +92,8 @@ def calcular_stats_prefixo(
     """
     Calcula medias e erros totais para um unico grupo (prefixo).
 
-    Centraliza a logica de calculo usada por calcular_estatisticas() e pelo
-    modo CLI em scalc.py, evitando duplicacao de codigo.
+    Versao em dicionarios de calcular_stats_medicoes(), mantida para o
+    formato retornado por particionar().
 
     Args:
         dados_por_chave (dict[str, list[float]]): mapeamento chave -> repeticoes.
@@ -52,37 +110,61 @@ def calcular_stats_prefixo(
                           = 0.0                               (n == 1)
         Erro total        = sqrt(erro_estatistico^2 + erro_instrumental^2)
     """
-    medias: list = []
-    erros_totais: list = []
+    chaves = [
+        chave for chave in sorted(dados_por_chave.keys())
+        if len(dados_por_chave[chave]) > 0
+    ]
+    if not chaves:
+        return [], []
+
+    contagens = [len(dados_por_chave[chave]) for chave in chaves]
+    offsets = np.zeros(len(chaves) + 1, dtype=np.int64)
+    np.cumsum(contagens, out=offsets[1:])
+
+    medias, _, erros_totais = _estatisticas_segmentadas(
+        np.concatenate([
+            np.asarray(dados_por_chave[chave], dtype=float) for chave in chaves
+        ]),
+        offsets,
+        np.array(
+            [erros_por_chave.get(chave, 0.0) for chave in chaves], dtype=float
+        ),
+    )
+    return medias.tolist(), erros_totais.tolist()
 
-    for chave in sorted(dados_por_chave.keys()):
-        valores = dados_por_chave[chave]
-        if not valores:
-            continue
 
-        n = len(valores)
-        media = sum(valores) / n
+def calcular_stats_medicoes(medicoes: TabelaMedicoes, prefixo: str) -> tuple:
+    """
+    Calcula medias e erros totais de um prefixo direto da TabelaMedicoes.
 
-        if n > 1:
-            variancia = sum((v - media) ** 2 for v in valores) / (n - 1)
-            erro_est = math.sqrt(variancia) / math.sqrt(n)
-        else:
-            erro_est = 0.0
+    Centraliza a logica usada pelo modo CLI em scalc.py e pela GUI. O
+    prefixo e uma faixa contigua da tabela, processada sem copia pelo
+    kernel vetorizado.
 
-        i_err = erros_por_chave.get(chave, 0.0)
-        if isinstance(i_err, float) and math.isnan(i_err):
-            i_err = 0.0
+    Args:
+        medicoes (TabelaMedicoes): resultado de particionar_medicoes().
+        prefixo (str): grupo desejado (ex: 'a').
 
-        t_err = math.sqrt(erro_est ** 2 + i_err ** 2)
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (medias, erros_totais) em ordem
+            alfabetica de chaves.
 
-        medias.append(media)
-        erros_totais.append(t_err)
+    Raises:
+        KeyError: prefixo inexistente.
+    """
+    faixa = medicoes.faixa_prefixo(prefixo)
+    offsets = medicoes.offsets[faixa.start:faixa.stop + 1]
 
+    medias, _, erros_totais = _estatisticas_segmentadas(
+        medicoes.valores[offsets[0]:offsets[-1]],
+        offsets - offsets[0],
+        medicoes.erros_instrumentais[faixa],
+    )
     return medias, erros_totais
 
 
 # --------------------------------------------------------------------------- #
-#  particionar                                                                 #
+#  particionar / particionar_medicoes                                          #
 # --------------------------------------------------------------------------- #
 
 def particionar(tabela: pd.DataFrame):
@@ -90,14 +172,10 @@ def particionar(tabela: pd.DataFrame):
     Particiona a tabela em dicionarios especificos para auxilio nas operacoes
     de estatistica.
 
-    A funcao realiza duas passagens sobre as colunas:
-    - Passagem 1: localiza a coluna de identificadores (nome contem 'dados')
-      e popula lista_dados e dados_keys.
-    - Passagem 2: processa colunas de erro instrumental e colunas numericas,
-      usando lista_dados ja preenchida.
-
-    Isso garante que a ordem das colunas no arquivo Excel nao afete o
-    resultado (I_err pode vir antes ou depois de Dados).
+    Interface de compatibilidade sobre particionar_medicoes(): o
+    particionamento e feito em arrays e convertido para dicionarios de
+    listas. Codigo novo deve preferir particionar_medicoes(), que evita a
+    conversao.
 
     Args:
         tabela (pd.DataFrame): DataFrame com os dados completos.
@@ -138,6 +216,48 @@ def particionar(tabela: pd.DataFrame):
         >>> keys
         {'a': 2, 'b': 2}
     """
+    return particionar_medicoes(tabela).para_dicionarios()
+
+
+def particionar_medicoes(
+    tabela: pd.DataFrame,
+    progresso: Optional[Progresso] = None,
+) -> TabelaMedicoes:
+    """
+    Particiona a tabela em uma TabelaMedicoes (arrays contiguos, formato CSR).
+
+    O particionamento e vetorizado e feito em duas passagens sobre as colunas:
+    - Passagem 1: localiza a coluna de identificadores (nome contem 'dados')
+      e extrai todos os prefixos com um unico str.extract.
+    - Passagem 2: converte as colunas de repeticao em um bloco numerico,
+      faz o "melt" para o formato longo (identificador, valor) e agrupa por
+      identificador; os erros instrumentais sao mapeados da mesma forma.
+
+    Nenhuma celula e visitada individualmente em Python: o custo
+    interpretado passa a ser proporcional ao numero de identificadores, e nao
+    ao numero de celulas (linhas x colunas).
+
+    A ordem das colunas no arquivo Excel nao afeta o resultado (I_err pode
+    vir antes ou depois de Dados).
+
+    Args:
+        tabela (pd.DataFrame): DataFrame com os dados completos.
+        progresso (Progresso, optional): Chamado a cada coluna convertida e
+            entre as passagens (src.utils.progresso).
+
+    Returns:
+        TabelaMedicoes: repeticoes agrupadas por prefixo e, dentro de cada
+            prefixo, por chave em ordem alfabetica.
+
+    Raises:
+        DadosInvalidosException: DataFrame invalido, so NaN, ou sem dados
+            numericos validos apos o particionamento.
+        ColunasInvalidasException: Todas as colunas foram classificadas como
+            erro instrumental (nenhuma coluna de dados restante).
+        OperacaoCancelada: levantada pelo callback de progresso.
+    """
+    etapa = 'Particionando'
+    notificar(progresso, 0.0, etapa)
     # ------------------------------------------------------------------ #
     #  Validacao e limpeza inicial                                         #
     # ------------------------------------------------------------------ #
@@ -162,32 +282,49 @@ def particionar(tabela: pd.DataFrame):
     )
 
     # ------------------------------------------------------------------ #
-    #  Passagem 1: popular lista_dados e dados_keys                        #
+    #  Passagem 1: identificadores e dados_keys                            #
     # ------------------------------------------------------------------ #
-    lista_dados: list = []   # lista posicional dos identificadores (ex: 'a_1')
-    dados_keys:  dict = {}   # contagem de pontos por prefixo
-
-    for coluna in tabela.columns:
-        if not eh_erro_instrumental(str(coluna)) and 'dados' in str(coluna).lower():
-            lista_dados = tabela[coluna].dropna().tolist()
-            for valor in lista_dados:
-                prefixo = extrair_prefixo(str(valor))
-                if prefixo:
-                    dados_keys[prefixo] = dados_keys.get(prefixo, 0) + 1
-                else:
-                    logger.warning(
-                        f"Valor '{valor}' na coluna '{coluna}' "
-                        f"nao possui prefixo valido, ignorando"
-                    )
-            break  # apenas uma coluna de identificadores e esperada
+    # Apenas uma coluna de identificadores e esperada (a primeira que
+    # contem 'dados' no nome e nao e coluna de erro).
+    coluna_ids = next(
+        (c for c in colunas_dados if 'dados' in str(c).lower()), None
+    )
+
+    if coluna_ids is not None:
+        identificadores = tabela[coluna_ids].dropna()
+    else:
+        identificadores = pd.Series([], dtype=object)
+
+    # lista posicional dos identificadores (ex: 'a_1') e prefixo de cada um
+    lista_dados = identificadores.to_numpy(dtype=object)
+    prefixos = (
+        identificadores.astype(str).str.strip()
+        .str.extract(_REGEX_PREFIXO, expand=False)
+    )
+
+    for valor in identificadores[prefixos.isna()]:
+        logger.warning(
+            f"Valor '{valor}' na coluna '{coluna_ids}' "
+            f"nao possui prefixo valido, ignorando"
+        )
+
+    prefixos_validos = prefixos.dropna()
+    dados_keys: dict = {
+        str(prefixo): int(contagem)
+        for prefixo, contagem in
+        prefixos_validos.groupby(prefixos_validos, sort=False).size().items()
+    }
 
     # ------------------------------------------------------------------ #
-    #  Passagem 2: processar erros e colunas numericas                    #
+    #  Passagem 2: erros instrumentais e colunas numericas                 #
     # ------------------------------------------------------------------ #
-    erros_instrumentais_iteracoes: dict = defaultdict(list)
-    dados_iteracoes:               dict = defaultdict(list)
+    n_ids = len(lista_dados)
+    series_erro:     list = []
+    colunas_validas: dict = {}
 
-    for coluna in tabela.columns:
+    n_colunas = len(tabela.columns)
+    for i, coluna in enumerate(tabela.columns):
+        notificar(progresso, 0.1 + 0.6 * i / n_colunas, etapa)
         coluna_str = str(coluna)
 
         if eh_erro_instrumental(coluna_str):
@@ -195,61 +332,102 @@ def particionar(tabela: pd.DataFrame):
                 serie = ValidadorDados.validar_dados_numericos(
                     tabela[coluna], coluna_str
                 )
-                valores_erro = serie.dropna().tolist()
-                for i, v in enumerate(valores_erro):
-                    if i < len(lista_dados):
-                        erros_instrumentais_iteracoes[lista_dados[i]].append(v)
+                # Mapeamento posicional: i-esimo erro valido -> i-esimo id
+                valores_erro = serie.dropna().to_numpy(dtype=float)[:n_ids]
+                series_erro.append(pd.Series(
+                    valores_erro, index=lista_dados[:len(valores_erro)]
+                ))
             except DadosNaoNumericosException as e:
                 logger.warning(f"Ignorando coluna de erro: {e}")
 
         elif 'dados' not in coluna_str.lower():
             # Coluna numerica de repeticoes
             try:
-                serie = ValidadorDados.validar_dados_numericos(
+                colunas_validas[coluna] = ValidadorDados.validar_dados_numericos(
                     tabela[coluna], coluna_str
                 )
-                valores_col = tabela[coluna].dropna()
-                # Itera pelos indices originais para manter o mapeamento
-                # com lista_dados mesmo quando ha NaN intercalados
-                idx_limpo = 0
-                for idx in tabela.index:
-                    val = tabela.at[idx, coluna]
-                    if idx_limpo >= len(lista_dados):
-                        break
-                    if not _pd.isna(val):
-                        dados_iteracoes[lista_dados[idx_limpo]].append(float(val))
-                    idx_limpo += 1
             except DadosNaoNumericosException as e:
                 logger.warning(f"Ignorando coluna de dados: {e}")
 
-    # ------------------------------------------------------------------ #
-    #  Montar estruturas de saida                                          #
-    # ------------------------------------------------------------------ #
-    dados_brutos:      dict = {}
-    erros_instrumentais: dict = {}
+    # Primeiro erro encontrado para cada identificador (ordem das colunas)
+    if series_erro:
+        erro_por_chave = (
+            pd.concat(series_erro).groupby(level=0, sort=False).first()
+        )
+    else:
+        erro_por_chave = pd.Series([], dtype=float)
+
+    notificar(progresso, 0.7, etapa)
+
+    # Bloco (linhas x repeticoes) alinhado posicionalmente com lista_dados.
+    # O melt percorre coluna a coluna, preservando a ordem das repeticoes.
+    bloco = pd.DataFrame(colunas_validas).iloc[:n_ids]
+    bloco.columns = range(bloco.shape[1])
+    bloco['_chave'] = lista_dados[:len(bloco)]
+    longo = (
+        bloco.melt(id_vars='_chave', value_name='_valor')
+        .dropna(subset=['_valor'])
+    )
 
-    for chave, valores in dados_iteracoes.items():
-        prefixo = extrair_prefixo(str(chave))
-        if prefixo not in dados_keys:
-            continue
+    # Agrupamento por identificador: codigos na ordem de primeira aparicao
+    codigos, chaves = pd.factorize(longo['_chave'].to_numpy(dtype=object))
+    valores_longos = longo['_valor'].to_numpy(dtype=float)
 
-        dados_brutos.setdefault(prefixo, {})[chave] = valores
-        erros_instrumentais.setdefault(prefixo, {})
+    prefixo_por_chave = pd.Series(
+        prefixos.to_numpy(dtype=object), index=lista_dados
+    )
+    prefixo_por_chave = prefixo_por_chave[
+        ~prefixo_por_chave.index.duplicated()
+    ].reindex(chaves)
 
-        lista_err = erros_instrumentais_iteracoes.get(chave, [])
-        erros_instrumentais[prefixo][chave] = (
-            lista_err[0] if lista_err else float('nan')
-        )
+    notificar(progresso, 0.85, etapa)
+
+    # Apenas chaves com prefixo valido entram na tabela
+    validas = prefixo_por_chave.notna().to_numpy()
+    codigos_prefixo, nomes_prefixos = pd.factorize(
+        prefixo_por_chave.to_numpy(dtype=object)[validas]
+    )
 
-    if not dados_brutos:
+    if not validas.any():
         raise DadosInvalidosException(
             "Nenhuma coluna contem dados numericos validos"
         )
 
+    # Ordem canonica: prefixo (primeira aparicao), depois chave alfabetica
+    chaves_validas = chaves[validas]
+    ordem_chaves = np.lexsort((chaves_validas.astype(str), codigos_prefixo))
+    posicao = np.full(len(chaves), -1, dtype=np.int64)
+    posicao[np.flatnonzero(validas)[ordem_chaves]] = np.arange(len(ordem_chaves))
+
+    # Um unico sort estavel leva cada repeticao para o bloco da sua chave,
+    # preservando a ordem das colunas dentro do bloco.
+    destino = posicao[codigos]
+    mantidos = destino >= 0
+    destino = destino[mantidos]
+    ordem_valores = np.argsort(destino, kind='stable')
+    offsets = np.zeros(len(ordem_chaves) + 1, dtype=np.int64)
+    np.cumsum(
+        np.bincount(destino, minlength=len(ordem_chaves)), out=offsets[1:]
+    )
+
+    medicoes = TabelaMedicoes(
+        valores=valores_longos[mantidos][ordem_valores],
+        offsets=offsets,
+        chaves=chaves_validas[ordem_chaves],
+        codigos_prefixo=codigos_prefixo[ordem_chaves],
+        prefixos=[str(p) for p in nomes_prefixos],
+        erros_instrumentais=erro_por_chave.reindex(
+            chaves_validas[ordem_chaves]
+        ).to_numpy(dtype=float),
+        contagem_prefixos=dados_keys,
+    )
+
+    notificar(progresso, 1.0, etapa)
     logger.info(
-        f"Particionamento concluido: {len(dados_brutos)} variaveis extraidas"
+        f"Particionamento concluido: {len(medicoes.prefixos)} variaveis "
+        f"extraidas ({medicoes.n_medicoes} medicoes)"
     )
-    return dados_brutos, erros_instrumentais, dados_keys
+    return medicoes
 
 
 # --------------------------------------------------------------------------- #
@@ -260,8 +438,8 @@ def calcular_estatisticas(tabela: pd.DataFrame) -> pd.DataFrame:
     """
     Calcula media, erro estatistico e erro total para cada ponto da tabela.
 
-    Internamente chama particionar() e depois calcular_stats_prefixo() para
-    cada grupo encontrado.
+    Internamente chama particionar_medicoes() e calcula todas as chaves de
+    uma vez com o kernel vetorizado _estatisticas_segmentadas().
 
     Args:
         tabela (pd.DataFrame): DataFrame no formato esperado pelo SCalc.
@@ -280,61 +458,41 @@ def calcular_estatisticas(tabela: pd.DataFrame) -> pd.DataFrame:
     """
     ValidadorDados.validar_dataframe(tabela, "Tabela de estatisticas")
 
-    dados_brutos, erros_instr, dados_keys = particionar(tabela)
+    return calcular_estatisticas_medicoes(particionar_medicoes(tabela))
 
-    if not dados_brutos or all(not v for v in dados_brutos.values()):
-        raise DadosInvalidosException(
-            "Nenhuma coluna contem dados numericos validos"
-        )
 
-    total_medicoes = sum(
-        sum(len(vals) for vals in grupo.values())
-        for grupo in dados_brutos.values()
-    )
+def calcular_estatisticas_medicoes(medicoes: TabelaMedicoes) -> pd.DataFrame:
+    """
+    Versao de calcular_estatisticas() para uma TabelaMedicoes ja particionada.
+
+    Permite reutilizar o particionamento (ex: Analise) sem reprocessar o
+    DataFrame original.
+
+    Args:
+        medicoes (TabelaMedicoes): resultado de particionar_medicoes().
+
+    Returns:
+        pd.DataFrame: colunas 'Dados', 'Media', 'S_err', 'T_err', na ordem
+            das chaves da tabela.
+
+    Raises:
+        DadosInsuficientesException: Nenhuma medicao disponivel.
+    """
+    total_medicoes = medicoes.n_medicoes
     if total_medicoes == 0:
         raise DadosInsuficientesException("Nenhuma medicao disponivel")
 
     logger.info(
-        f"Calculando estatisticas para {len(dados_keys)} grupos "
+        f"Calculando estatisticas para {len(medicoes.contagem_prefixos)} grupos "
         f"({total_medicoes} medicoes)"
     )
 
-    nomes:      list = []
-    medias:     list = []
-    erros_est:  list = []
-    erros_tot:  list = []
-
-    for prefixo, prefixo_dados in dados_brutos.items():
-        # calcular_stats_prefixo retorna apenas (medias, erros_totais).
-        # Para o DataFrame precisamos tambem dos S_err individuais;
-        # calculamos em loop para preservar cada valor separadamente.
-        for chave in sorted(prefixo_dados.keys()):
-            valores = prefixo_dados[chave]
-            if not valores:
-                continue
-
-            n = len(valores)
-            media = sum(valores) / n
-
-            if n > 1:
-                variancia = sum((v - media) ** 2 for v in valores) / (n - 1)
-                s_err = math.sqrt(variancia) / math.sqrt(n)
-            else:
-                s_err = 0.0
-
-            i_err = erros_instr[prefixo].get(chave, 0.0)
-            if isinstance(i_err, float) and math.isnan(i_err):
-                i_err = 0.0
-
-            t_err = math.sqrt(s_err ** 2 + i_err ** 2)
-
-            nomes.append(chave)
-            medias.append(media)
-            erros_est.append(s_err)
-            erros_tot.append(t_err)
+    medias, erros_est, erros_tot = _estatisticas_segmentadas(
+        medicoes.valores, medicoes.offsets, medicoes.erros_instrumentais
+    )
 
     resultado = pd.DataFrame({
-        'Dados': nomes,
+        'Dados': medicoes.chaves.tolist(),
         'Media': medias,
         'S_err': erros_est,
         'T_err': erros_tot,
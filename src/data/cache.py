@@ -0,0 +1,288 @@
+"""
+Modulo de Cache
+
+Contem o cache em disco de tabelas ja lidas, enderecado pelo conteudo do
+arquivo: a chave e o SHA-256 dos bytes do arquivo mais o formato e a versao
+dos leitores (leitores.VERSAO). Reabrir o mesmo arquivo (mesmo que copiado
+ou renomeado) carrega a tabela do cache sem passar de novo pelo leitor.
+
+Cada tabela e gravada como um .npz colunar (sem pickle): colunas numericas
+como arrays nativos, colunas de texto como array unicode + mascara de
+ausentes e colunas mistas como texto + numero + codigo de tipo por celula.
+Os nomes e tipos das colunas ficam em um cabecalho JSON dentro do proprio
+.npz. Quando o tamanho total passa de Config.Cache.MAX_TAMANHO_MB, os
+arquivos menos usados recentemente (mtime) sao removidos.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.data import leitores
+from src.data.config import Config
+from src.utils.progresso import Progresso, notificar
+
+logger = logging.getLogger(__name__)
+
+# Codigos de tipo por celula das colunas mistas (object)
+_AUSENTE, _NUMERO, _INTEIRO, _TEXTO, _BOOLEANO = range(5)
+
+
+def hash_arquivo(caminho: str, tamanho_bloco: int = 1 << 20) -> str:
+    """SHA-256 hexadecimal do conteudo do arquivo, lido em blocos."""
+    resumo = hashlib.sha256()
+    with open(caminho, 'rb') as arquivo:
+        for bloco in iter(lambda: arquivo.read(tamanho_bloco), b''):
+            resumo.update(bloco)
+    return resumo.hexdigest()
+
+
+# --------------------------------------------------------------------------- #
+#  Serializacao colunar                                                        #
+# --------------------------------------------------------------------------- #
+
+def _serializar(tabela: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Converte a tabela em arrays nomeados para np.savez (sem pickle).
+
+    Raises:
+        ValueError: coluna com tipo de celula nao suportado (ex: datas);
+            a tabela nao deve ser gravada no cache.
+    """
+    arrays: Dict[str, np.ndarray] = {}
+    colunas: List[Dict[str, Any]] = []
+    for i, nome in enumerate(tabela.columns):
+        if not isinstance(nome, (str, int, float)) or isinstance(nome, bool):
+            raise ValueError(f"Nome de coluna nao suportado: {nome!r}")
+        serie = tabela.iloc[:, i]
+        ausentes = serie.isna().to_numpy()
+
+        if serie.dtype.kind in 'fiub':
+            tipo = 'numerico'
+            arrays[f'c{i}'] = serie.to_numpy()
+        elif pd.api.types.is_string_dtype(serie.dtype) and serie.dtype != object:
+            tipo = 'texto'
+            arrays[f'c{i}'] = serie.fillna('').to_numpy(dtype=str)
+            arrays[f'm{i}'] = ausentes
+        else:
+            tipo = 'misto'
+            valores = serie.to_numpy(dtype=object)
+            codigos = np.full(len(valores), _AUSENTE, dtype=np.int8)
+            numeros = np.zeros(len(valores), dtype=np.float64)
+            textos = np.full(len(valores), '', dtype=object)
+            for j, valor in enumerate(valores):
+                if ausentes[j]:
+                    continue
+                if isinstance(valor, (bool, np.bool_)):
+                    codigos[j], numeros[j] = _BOOLEANO, float(valor)
+                elif isinstance(valor, (int, np.integer)):
+                    codigos[j], numeros[j] = _INTEIRO, float(valor)
+                elif isinstance(valor, (float, np.floating)):
+                    codigos[j], numeros[j] = _NUMERO, float(valor)
+                elif isinstance(valor, str):
+                    codigos[j], textos[j] = _TEXTO, valor
+                else:
+                    raise ValueError(
+                        f"Coluna {nome!r}: tipo {type(valor).__name__} nao suportado"
+                    )
+            arrays[f'c{i}'] = textos.astype(str)
+            arrays[f'n{i}'] = numeros
+            arrays[f't{i}'] = codigos
+        colunas.append({'nome': nome, 'tipo': tipo})
+
+    arrays['__cabecalho__'] = np.array(json.dumps({'colunas': colunas}))
+    return arrays
+
+
+def _desserializar(arquivo: Any) -> pd.DataFrame:
+    """Reconstroi a tabela gravada por _serializar()."""
+    cabecalho = json.loads(str(arquivo['__cabecalho__']))
+    dados: Dict[int, Any] = {}
+    nomes = []
+    for i, coluna in enumerate(cabecalho['colunas']):
+        nomes.append(coluna['nome'])
+        if coluna['tipo'] == 'numerico':
+            dados[i] = arquivo[f'c{i}']
+        elif coluna['tipo'] == 'texto':
+            valores = arquivo[f'c{i}'].astype(object)
+            valores[arquivo[f'm{i}']] = np.nan
+            dados[i] = pd.array(valores, dtype='str')
+        else:
+            codigos = arquivo[f't{i}']
+            numeros = arquivo[f'n{i}']
+            valores = np.full(len(codigos), np.nan, dtype=object)
+            for j, (codigo, texto) in enumerate(zip(codigos, arquivo[f'c{i}'])):
+                if codigo == _NUMERO:
+                    valores[j] = float(numeros[j])
+                elif codigo == _INTEIRO:
+                    valores[j] = int(numeros[j])
+                elif codigo == _BOOLEANO:
+                    valores[j] = bool(numeros[j])
+                elif codigo == _TEXTO:
+                    valores[j] = str(texto)
+            dados[i] = valores
+    tabela = pd.DataFrame(dados)
+    tabela.columns = nomes
+    return tabela
+
+
+# --------------------------------------------------------------------------- #
+#  Cache                                                                       #
+# --------------------------------------------------------------------------- #
+
+class CacheTabelas:
+    """
+    Cache em disco de tabelas lidas, enderecado pelo conteudo do arquivo.
+
+    Args:
+        diretorio (str | Path, optional): Pasta do cache (padrao:
+            Config.Cache.diretorio()).
+        max_tamanho_mb (float, optional): Tamanho total maximo (padrao:
+            Config.Cache.MAX_TAMANHO_MB).
+
+    Examples:
+        >>> cache = CacheTabelas()
+        >>> tabela = cache.ler('dados.xlsx')    # le e grava no cache
+        >>> tabela = cache.ler('dados.xlsx')    # acerto: sem reler o Excel
+    """
+
+    SUFIXO = '.npz'
+
+    def __init__(self, diretorio=None, max_tamanho_mb: Optional[float] = None):
+        self.diretorio = Path(diretorio) if diretorio else Config.Cache.diretorio()
+        self.max_tamanho_mb = (
+            Config.Cache.MAX_TAMANHO_MB if max_tamanho_mb is None else max_tamanho_mb
+        )
+
+    def chave(self, caminho: str) -> str:
+        """Chave do arquivo: hash do conteudo + formato + versao dos leitores."""
+        formato = leitores.leitor_para(caminho).formato
+        return f"{hash_arquivo(caminho)}-{formato}-v{leitores.VERSAO}"
+
+    def _caminho(self, chave: str) -> Path:
+        return self.diretorio / f"{chave}{self.SUFIXO}"
+
+    def obter(self, chave: str) -> Optional[pd.DataFrame]:
+        """Tabela gravada com a chave, ou None (ausente ou ilegivel)."""
+        destino = self._caminho(chave)
+        try:
+            with np.load(destino, allow_pickle=False) as arquivo:
+                tabela = _desserializar(arquivo)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Entrada de cache invalida removida ({destino.name}): {e}")
+            destino.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(destino)   # marca como usada recentemente (LRU)
+        except OSError as e:
+            # Ex.: removida por outro processo (--batch) apos a leitura
+            logger.debug(f"mtime da entrada de cache nao atualizado ({destino.name}): {e}")
+        return tabela
+
+    def guardar(self, chave: str, tabela: pd.DataFrame) -> bool:
+        """
+        Grava a tabela no cache (escrita atomica) e aplica o limite de tamanho.
+
+        Returns:
+            bool: False se a tabela nao e serializavel sem pickle.
+        """
+        try:
+            arrays = _serializar(tabela)
+        except ValueError as e:
+            logger.info(f"Tabela nao gravada no cache: {e}")
+            return False
+
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+        descritor, temporario = tempfile.mkstemp(
+            dir=self.diretorio, suffix='.tmp' + self.SUFIXO
+        )
+        try:
+            with os.fdopen(descritor, 'wb') as arquivo:
+                np.savez(arquivo, **arrays)
+            os.replace(temporario, self._caminho(chave))
+        except BaseException:
+            Path(temporario).unlink(missing_ok=True)
+            raise
+        self.remover_excedente()
+        return True
+
+    def ler(self, caminho: str, progresso: Optional[Progresso] = None) -> pd.DataFrame:
+        """Le o arquivo pelo cache; em caso de falta, usa leitores.ler_tabela."""
+        chave = self.chave(caminho)
+        tabela = self.obter(chave)
+        if tabela is not None:
+            logger.info(f"Tabela de '{caminho}' carregada do cache ({chave[:12]})")
+            notificar(progresso, 1.0, 'Lendo do cache')
+            return tabela
+
+        tabela = leitores.ler_tabela(caminho, progresso=progresso)
+        try:
+            self.guardar(chave, tabela)
+        except OSError as e:
+            logger.warning(f"Falha ao gravar cache em {self.diretorio}: {e}")
+        return tabela
+
+    def entradas(self) -> List[Path]:
+        """Arquivos do cache, do menos para o mais recentemente usado."""
+        if not self.diretorio.is_dir():
+            return []
+        arquivos = [
+            p for p in self.diretorio.glob(f"*{self.SUFIXO}")
+            if not p.name.endswith('.tmp' + self.SUFIXO)
+        ]
+        return sorted(arquivos, key=lambda p: p.stat().st_mtime)
+
+    def tamanho_mb(self) -> float:
+        """Tamanho total das entradas do cache, em MB."""
+        return sum(p.stat().st_size for p in self.entradas()) / (1024 * 1024)
+
+    def remover_excedente(self) -> int:
+        """Remove as entradas menos usadas ate caber no limite. Retorna quantas."""
+        entradas = self.entradas()
+        limite = self.max_tamanho_mb * 1024 * 1024
+        total = sum(p.stat().st_size for p in entradas)
+        removidas = 0
+        for entrada in entradas:
+            if total <= limite:
+                break
+            total -= entrada.stat().st_size
+            entrada.unlink(missing_ok=True)
+            removidas += 1
+        if removidas:
+            logger.info(f"Cache: {removidas} entrada(s) antiga(s) removida(s)")
+        return removidas
+
+    def limpar(self) -> None:
+        """Remove todas as entradas do cache."""
+        for entrada in self.entradas():
+            entrada.unlink(missing_ok=True)
+
+
+def ler_tabela(
+    caminho: str,
+    usar_cache: Optional[bool] = None,
+    progresso: Optional[Progresso] = None,
+) -> pd.DataFrame:
+    """
+    Le um arquivo de entrada, passando pelo cache quando habilitado.
+
+    Args:
+        caminho (str): Arquivo de entrada (qualquer formato de leitores).
+        usar_cache (bool, optional): Forca o uso (ou nao) do cache
+            (padrao: Config.Cache.HABILITADO).
+        progresso (Progresso, optional): Ver leitores.ler_tabela().
+    """
+    if usar_cache is None:
+        usar_cache = Config.Cache.HABILITADO
+    if not usar_cache:
+        return leitores.ler_tabela(caminho, progresso=progresso)
+    return CacheTabelas().ler(caminho, progresso=progresso)
@@ -0,0 +1,15 @@
+"""
+Modulo de Colunas
+
+Contem os nomes de colunas das tabelas de ajustes locais, compartilhados
+pelo motor (src.core.segmentos), que as produz, e pela saida
+(src.data.saida), que as serializa. Sem dependencias: importa-lo nao traz
+numpy nem o core para a camada de dados.
+"""
+
+# regressao_janela: uma linha por janela deslizante
+COLUNAS_JANELA = ['x_inicio', 'x_fim', 'slope', 'intercept', 'r_squared', 'n']
+
+# regressao_segmentada: uma linha por segmento
+COLUNAS_SEGMENTO = ['segmento', 'x_inicio', 'x_fim', 'slope', 'intercept',
+                    'r_squared', 'n', 'sse']
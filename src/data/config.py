@@ -5,6 +5,7 @@ Contem configuracoes globais e caminhos do projeto.
 """
 
 import os
+import sys
 from pathlib import Path
 from typing import Dict, Any
 
@@ -52,6 +53,17 @@ class Config:
         
         # Formatos de exportacao suportados
         FORMATOS_EXPORTACAO = ['png', 'pdf', 'svg', 'jpg', 'eps']
+        
+        # Pasta padrao das figuras exportadas (--export sem --out)
+        PASTA_EXPORTACAO = 'figuras'
+        
+        # Eixos: numero maximo de ticks por eixo e margem relativa a faixa
+        MAX_TICKS = 10
+        MARGEM_EIXOS = 0.05
+        
+        # Nivel de detalhe: ate esse numero de pontos visiveis (ou 2 por
+        # pixel de largura), as barras de erro sao desenhadas sem decimacao
+        LOD_LIMIAR = 5000
     
     # ============ CONFIGURACOES DE ESTATISTICA ============
     class Estatistica:
@@ -70,6 +82,19 @@ class Config:
         # Precisao de arredondamento para resultados
         PRECISAO_DECIMAL = 6
     
+    # ============ CONFIGURACOES DE SEGMENTOS ============
+    class Segmentos:
+        """Configuracoes da regressao por partes (src.core.segmentos)"""
+        # Limite de segmentos na escolha automatica (BIC)
+        MAX_SEGMENTOS = 5
+        
+        # Pontos minimos por segmento
+        MIN_PONTOS = 3
+        
+        # Posicoes de quebra da programacao dinamica exata; acima disso,
+        # grade uniforme com refinamento local
+        MAX_CANDIDATOS = 1000
+    
     # ============ CONFIGURACOES DE VALIDACAO ============
     class Validacao:
         """Configuracoes de validacao de dados"""
@@ -85,6 +110,97 @@ class Config:
         # Permitir valores faltantes?
         PERMITIR_VALORES_FALTANTES = True
     
+    # ============ CONFIGURACOES DE LEITURA ============
+    class Leitura:
+        """Configuracoes de leitura de arquivos"""
+        # Linhas do Excel convertidas em arrays por vez (leitura por streaming)
+        TAMANHO_BLOCO = 4096
+
+        # Linhas do CSV por bloco quando a leitura reporta progresso (GUI)
+        TAMANHO_BLOCO_CSV = 65536
+        
+        # Limites por formato de entrada (chave: Leitor.formato)
+        # Tamanho maximo do arquivo (em MB)
+        MAX_TAMANHO_MB = {
+            'excel': 50,
+            'csv': 200,
+            'parquet': 500,
+            'feather': 500,
+            'npz': 500,
+        }
+        
+        # Numero maximo de linhas da tabela lida
+        MAX_LINHAS = {
+            'excel': 10000,
+            'csv': 1_000_000,
+            'parquet': 1_000_000,
+            'feather': 1_000_000,
+            'npz': 1_000_000,
+        }
+    
+    # ============ CONFIGURACOES DE CACHE ============
+    class Cache:
+        """Configuracoes do cache em disco de tabelas lidas"""
+        # Usar o cache por padrao? (--no-cache desativa por execucao)
+        HABILITADO = True
+        
+        # Variavel de ambiente que sobrescreve o diretorio padrao
+        VARIAVEL_DIRETORIO = 'SCALC_CACHE_DIR'
+        
+        # Tamanho total maximo (em MB); acima disso, remove os menos usados
+        MAX_TAMANHO_MB = 512
+        
+        @staticmethod
+        def diretorio() -> Path:
+            """
+            Diretorio do cache: $SCALC_CACHE_DIR ou o cache do usuario.
+
+            Fora da arvore do pacote, que e somente leitura em instalacoes e
+            builds congelados: %LOCALAPPDATA%\\scalc\\cache (Windows),
+            ~/Library/Caches/scalc (macOS) ou $XDG_CACHE_HOME/scalc, com
+            ~/.cache/scalc como padrao (Linux e demais).
+            """
+            personalizado = os.environ.get(Config.Cache.VARIAVEL_DIRETORIO)
+            if personalizado:
+                return Path(personalizado)
+            nome = Config.APP_NAME.lower()
+            if sys.platform == 'win32':
+                base = os.environ.get('LOCALAPPDATA')
+                if base:
+                    return Path(base) / nome / 'cache'
+                return Path.home() / 'AppData' / 'Local' / nome / 'cache'
+            if sys.platform == 'darwin':
+                return Path.home() / 'Library' / 'Caches' / nome
+            base = os.environ.get('XDG_CACHE_HOME')
+            return (Path(base) if base else Path.home() / '.cache') / nome
+    
+    # ============ CONFIGURACOES DE LOTE ============
+    class Lote:
+        """Configuracoes do processamento em lote (--batch)"""
+        # Numero de processos (None: os.cpu_count())
+        WORKERS = None
+        
+        # Arquivo de resumo consolidado padrao
+        ARQUIVO_RESUMO = 'resumo_lote.csv'
+        
+        # Nivel de log dentro dos workers
+        NIVEL_LOG_WORKER = 'WARNING'
+    
+    # ============ CONFIGURACOES DE MONITORAMENTO ============
+    class Monitor:
+        """Configuracoes do monitoramento de pasta (--watch)"""
+        # Segundos entre verificacoes da pasta
+        INTERVALO_S = 2.0
+        
+        # Idade minima do mtime para processar (arquivo ainda em escrita)
+        ESPERA_ESTAVEL_S = 1.0
+        
+        # Arquivo de estado (dentro da pasta monitorada)
+        ARQUIVO_ESTADO = '.scalc_monitor.json'
+        
+        # CSV onde cada resultado e acrescentado
+        ARQUIVO_RESULTADOS = 'resultados_monitor.csv'
+    
     # ============ CONFIGURACOES DE INTERFACE ============
     class UI:
         """Configuracoes de interface grafica"""
@@ -98,6 +214,15 @@ class Config:
         FONT_TITULO_SIZE = 14
         FONT_LABEL_SIZE = 10
         FONT_TEXTO_SIZE = 9
+
+        # Linhas consultadas, alem das visiveis, para ajustar a largura das
+        # colunas da aba Dados (o Qt usa 1000 por padrao; -1 = todas)
+        LINHAS_AJUSTE_COLUNAS = 0
+
+        # Modo ao vivo: regressao e grafico refeitos em segundo plano ao
+        # trocar X/Y, depois de ATRASO_RECALCULO_MS sem novas trocas
+        RECALCULO_AUTOMATICO = True
+        ATRASO_RECALCULO_MS = 200
         
         # Temas disponiveis
         TEMAS_DISPONIVEIS = ['claro', 'escuro', 'sistema']
@@ -0,0 +1,61 @@
+"""
+Modulo de Entrada
+
+Contem carregar_tabela, o ponto de entrada unico para ler um arquivo de
+medicoes (CLI, GUI e modo lote): valida o arquivo, resolve o leitor pela
+extensao, passa pelo cache em disco e aplica os limites do formato. A
+tabela devolvida alimenta Analise, que so trabalha com dados ja carregados.
+
+Examples:
+    >>> analise = Analise(carregar_tabela('dados.xlsx'))
+"""
+
+import logging
+from typing import Optional
+
+import pandas as pd
+
+from src.data import cache, leitores
+from src.data.config import Config
+from src.utils.progresso import Progresso
+from src.utils.validador import ValidadorDados
+
+logger = logging.getLogger(__name__)
+
+
+def carregar_tabela(
+    caminho: str,
+    usar_cache: Optional[bool] = None,
+    progresso: Optional[Progresso] = None,
+) -> pd.DataFrame:
+    """
+    Valida e carrega um arquivo de entrada, retornando a tabela pronta.
+
+    O leitor e escolhido pela extensao (leitores.ler_tabela): Excel
+    (por streaming), CSV, Parquet, Feather ou .npz. Os limites de
+    tamanho e de linhas sao os do formato (Config.Leitura).
+
+    Args:
+        caminho: Arquivo de entrada.
+        usar_cache: Le pelo cache em disco enderecado por conteudo
+            (padrao: Config.Cache.HABILITADO).
+        progresso: Callback de progresso da leitura (src.utils.progresso).
+
+    Returns:
+        pd.DataFrame: Tabela validada, pronta para Analise(tabela).
+
+    Raises:
+        ArquivoInvalidoException: arquivo inexistente, formato nao
+            suportado ou acima do tamanho maximo do formato.
+        DadosInvalidosException: tabela vazia ou acima dos limites.
+        OperacaoCancelada: levantada pelo callback de progresso.
+    """
+    ValidadorDados.validar_arquivo_entrada(caminho)
+    formato = leitores.leitor_para(caminho).formato
+    tabela = cache.ler_tabela(caminho, usar_cache=usar_cache, progresso=progresso)
+    ValidadorDados.validar_dataframe(tabela, f"Dados do arquivo {formato}")
+    ValidadorDados.validar_tamanho_arquivo(
+        tabela, max_linhas=Config.Leitura.MAX_LINHAS.get(formato)
+    )
+    logger.debug(f"Tabela carregada de {caminho}: {len(tabela)} linhas ({formato})")
+    return tabela
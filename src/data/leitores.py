@@ -0,0 +1,418 @@
+"""
+Modulo de Leitores
+
+Contem o registro de leitores de arquivos de entrada, despachado pela
+extensao do arquivo (Excel, CSV, Parquet, Feather e NumPy .npz). Todos os
+leitores produzem um DataFrame no layout esperado por particionar()
+('Dados', 'I_err', colunas de repeticao).
+
+O leitor de Excel e por streaming: em vez de passar as linhas como objetos
+Python por todo o caminho de pd.read_excel, as linhas do openpyxl
+(read_only=True) sao lidas em blocos e cada bloco e convertido
+imediatamente em arrays por coluna (float64 sempre que possivel), de modo
+que a memoria transitoria fica limitada ao tamanho do bloco.
+
+Os leitores de Excel e CSV aceitam um callback de progresso
+(src.utils.progresso), chamado a cada bloco lido; ele pode interromper a
+leitura levantando OperacaoCancelada.
+"""
+
+import importlib.util
+import logging
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.core.exceptions import ArquivoInvalidoException
+from src.data.config import Config
+from src.utils.progresso import Progresso, notificar
+
+logger = logging.getLogger(__name__)
+
+# Versao da saida dos leitores; incrementar quando algum leitor passar a
+# produzir um DataFrame diferente para o mesmo arquivo (invalida o cache)
+VERSAO = 1
+
+_TIPOS_NUMERICOS = {int, float, type(None)}
+
+
+def _nomes_colunas(cabecalho: List[Any]) -> List[Any]:
+    """Nomes de colunas com as mesmas regras de pd.read_excel."""
+    nomes: List[Any] = []
+    vistos: Dict[Any, int] = {}
+    for i, nome in enumerate(cabecalho):
+        if nome is None or (isinstance(nome, str) and not nome.strip()):
+            nome = f"Unnamed: {i}"
+        if nome in vistos:
+            # Duplicatas: 'a', 'a.1', 'a.2', ...
+            base = nome
+            while nome in vistos:
+                vistos[base] += 1
+                nome = f"{base}.{vistos[base]}"
+        vistos[nome] = 0
+        nomes.append(nome)
+    return nomes
+
+
+def _converter_bloco(celulas: tuple, tipos: set) -> np.ndarray:
+    """Converte as celulas de uma coluna em float64 ou, se preciso, object."""
+    if tipos <= _TIPOS_NUMERICOS:
+        return np.array(celulas, dtype=np.float64)   # None -> NaN
+    bloco = np.array(celulas, dtype=object)
+    bloco[np.equal(bloco, None)] = np.nan
+    return bloco
+
+
+def _inteira(coluna: np.ndarray) -> bool:
+    """True se a coluna float64 nao tem NaN e so tem valores inteiros."""
+    return (
+        coluna.dtype == np.float64
+        and len(coluna) > 0
+        and not np.isnan(coluna).any()
+        and bool(np.all(np.mod(coluna, 1.0) == 0.0))
+    )
+
+
+def ler_excel(
+    caminho: str,
+    tamanho_bloco: Optional[int] = None,
+    progresso: Optional[Progresso] = None,
+) -> pd.DataFrame:
+    """
+    Le a primeira planilha de um arquivo .xlsx por streaming.
+
+    Produz o mesmo DataFrame que pd.read_excel(caminho) para as tabelas do
+    SCalc: primeira linha como cabecalho, linhas vazias intermediarias
+    preservadas e linhas/colunas vazias no final descartadas. Linhas mais
+    largas que o cabecalho (planilhas sem a dimensao declarada) criam
+    colunas 'Unnamed: i', como no pandas. Colunas numericas sem celulas vazias e so com valores inteiros viram int64;
+    as demais viram float64. Arquivos .xls (nao suportados pelo
+    openpyxl) sao delegados a pd.read_excel.
+
+    Args:
+        caminho (str): Caminho do arquivo Excel.
+        tamanho_bloco (int, optional): Linhas convertidas por vez
+            (padrao: Config.Leitura.TAMANHO_BLOCO).
+        progresso (Progresso, optional): Chamado a cada bloco, com a fracao
+            das linhas declaradas na planilha.
+
+    Returns:
+        pd.DataFrame: Tabela lida.
+
+    Raises:
+        OperacaoCancelada: levantada pelo callback de progresso.
+    """
+    if str(caminho).lower().endswith('.xls'):
+        notificar(progresso, 0.0, 'Lendo Excel')
+        tabela = pd.read_excel(caminho)
+        notificar(progresso, 1.0, 'Lendo Excel')
+        return tabela
+
+    import openpyxl
+
+    if tamanho_bloco is None:
+        tamanho_bloco = Config.Leitura.TAMANHO_BLOCO
+
+    notificar(progresso, 0.0, 'Lendo Excel')
+    livro = openpyxl.load_workbook(caminho, read_only=True, data_only=True)
+    try:
+        planilha = livro.worksheets[0]
+        total = planilha.max_row or 0      # da dimensao declarada; pode faltar
+        linhas = planilha.iter_rows(values_only=True)
+        cabecalho = list(next(linhas, ()))
+        n_colunas = len(cabecalho)
+
+        blocos: List[List[np.ndarray]] = [[] for _ in range(n_colunas)]
+        tamanhos: List[int] = []    # linhas de cada bloco ja convertido
+        n_linhas = 0
+        ultima_linha = 0        # ultima linha com alguma celula preenchida
+        largura = 0             # ultima coluna com alguma celula preenchida
+        for i, nome in enumerate(cabecalho):
+            if nome is not None:
+                largura = i + 1
+
+        bloco: List[tuple] = []
+
+        def descarregar() -> None:
+            nonlocal n_linhas, ultima_linha, largura
+            # Colunas que surgem so agora: NaN nos blocos anteriores
+            while len(blocos) < n_colunas:
+                blocos.append([np.full(t, np.nan) for t in tamanhos])
+            for k, linha in enumerate(bloco):
+                if len(linha) < n_colunas:
+                    bloco[k] = linha + (None,) * (n_colunas - len(linha))
+            colunas = list(zip(*bloco))
+            for j, celulas in enumerate(colunas):
+                tipos = set(map(type, celulas))
+                if tipos != {type(None)}:
+                    largura = max(largura, j + 1)
+                blocos[j].append(_converter_bloco(celulas, tipos))
+            for k in range(len(bloco) - 1, -1, -1):
+                if any(celula is not None for celula in bloco[k]):
+                    ultima_linha = n_linhas + k + 1
+                    break
+            n_linhas += len(bloco)
+            tamanhos.append(len(bloco))
+            bloco.clear()
+            if total:
+                notificar(progresso, (n_linhas + 1) / total, 'Lendo Excel')
+
+        for linha in linhas:
+            n_colunas = max(n_colunas, len(linha))
+            bloco.append(linha)
+            if len(bloco) >= tamanho_bloco:
+                descarregar()
+        if bloco:
+            descarregar()
+    finally:
+        livro.close()
+
+    nomes = _nomes_colunas((cabecalho + [None] * largura)[:largura])
+    dados: Dict[Any, np.ndarray] = {}
+    for j, nome in enumerate(nomes):
+        partes = blocos[j]
+        if not partes:
+            coluna = np.empty(0, dtype=np.float64)
+        elif all(p.dtype == np.float64 for p in partes):
+            coluna = np.concatenate(partes)[:ultima_linha]
+        else:
+            coluna = np.concatenate([p.astype(object) for p in partes])[:ultima_linha]
+        if _inteira(coluna):
+            coluna = coluna.astype(np.int64)
+        dados[nome] = coluna
+        blocos[j] = []          # libera os blocos ja concatenados
+
+    tabela = pd.DataFrame(dados, columns=nomes)
+    notificar(progresso, 1.0, 'Lendo Excel')
+    logger.info(
+        f"Arquivo '{caminho}' lido por streaming: "
+        f"{len(tabela)} linhas, {len(tabela.columns)} colunas"
+    )
+    return tabela
+
+
+def ler_csv(caminho: str, progresso: Optional[Progresso] = None) -> pd.DataFrame:
+    """
+    Le um arquivo CSV (engine pyarrow quando disponivel, senao o engine C).
+
+    Com callback de progresso, le com o engine C em blocos de
+    Config.Leitura.TAMANHO_BLOCO_CSV linhas (o engine pyarrow nao le em
+    blocos), reportando a fracao dos bytes do arquivo ja consumida.
+
+    Args:
+        caminho (str): Caminho do arquivo .csv.
+        progresso (Progresso, optional): Chamado a cada bloco.
+
+    Returns:
+        pd.DataFrame: Tabela lida.
+
+    Raises:
+        OperacaoCancelada: levantada pelo callback de progresso.
+    """
+    if progresso is None:
+        engine = 'pyarrow' if _disponivel('pyarrow') else 'c'
+        return pd.read_csv(caminho, engine=engine)
+
+    notificar(progresso, 0.0, 'Lendo CSV')
+    tamanho = max(os.path.getsize(caminho), 1)
+    with open(caminho, 'rb') as arquivo:
+        with pd.read_csv(arquivo, chunksize=Config.Leitura.TAMANHO_BLOCO_CSV) as blocos:
+            partes = []
+            for parte in blocos:
+                partes.append(parte)
+                notificar(progresso, arquivo.tell() / tamanho, 'Lendo CSV')
+    tabela = pd.concat(partes, ignore_index=True) if len(partes) > 1 else partes[0]
+    notificar(progresso, 1.0, 'Lendo CSV')
+    return tabela
+
+
+def ler_parquet(caminho: str) -> pd.DataFrame:
+    """Le um arquivo Parquet (requer pyarrow ou fastparquet)."""
+    return pd.read_parquet(caminho)
+
+
+def ler_feather(caminho: str) -> pd.DataFrame:
+    """Le um arquivo Feather (requer pyarrow)."""
+    return pd.read_feather(caminho)
+
+
+def ler_npz(caminho: str) -> pd.DataFrame:
+    """
+    Le um arquivo NumPy .npz (sem pickle) como tabela SCalc.
+
+    Cada array 1-D vira uma coluna com o nome da chave (ex: 'Dados' como
+    array de strings, 'I_err' como float). Um array 2-D (n, r) de chave
+    'valores' vira as colunas de repeticao '1' ... 'r'; outros arrays 2-D
+    viram as colunas '<chave>_1' ... '<chave>_r'.
+
+    Args:
+        caminho (str): Caminho do arquivo .npz.
+
+    Returns:
+        pd.DataFrame: Tabela lida, com as colunas na ordem do arquivo.
+
+    Raises:
+        ArquivoInvalidoException: arrays com mais de 2 dimensoes ou com
+            numeros de linhas diferentes.
+    """
+    colunas: Dict[str, np.ndarray] = {}
+    with np.load(caminho, allow_pickle=False) as arquivo:
+        for chave in arquivo.files:
+            array = arquivo[chave]
+            if array.ndim == 1:
+                colunas[chave] = array
+            elif array.ndim == 2:
+                for j in range(array.shape[1]):
+                    nome = str(j + 1) if chave == 'valores' else f"{chave}_{j + 1}"
+                    colunas[nome] = array[:, j]
+            else:
+                raise ArquivoInvalidoException(
+                    f"Array '{chave}' de {caminho} tem {array.ndim} dimensoes "
+                    f"(esperado 1 ou 2)"
+                )
+
+    tamanhos = {len(coluna) for coluna in colunas.values()}
+    if len(tamanhos) > 1:
+        raise ArquivoInvalidoException(
+            f"Arrays de {caminho} tem numeros de linhas diferentes: {sorted(tamanhos)}"
+        )
+    return pd.DataFrame(colunas)
+
+
+# --------------------------------------------------------------------------- #
+#  Registro de leitores                                                       #
+# --------------------------------------------------------------------------- #
+
+class Leitor:
+    """
+    Leitor registrado para um formato de entrada.
+
+    Attributes:
+        formato (str): Nome do formato; chave de Config.Leitura.MAX_TAMANHO_MB
+            e Config.Leitura.MAX_LINHAS.
+        extensoes (Tuple[str, ...]): Extensoes aceitas, com ponto ('.csv').
+        funcao (Callable[[str], pd.DataFrame]): Funcao de leitura.
+        descricao (str): Descricao curta (usada no filtro da GUI).
+        dependencias (Tuple[str, ...]): Modulos opcionais; basta um deles
+            estar instalado. Vazio se nao ha dependencia opcional.
+        com_progresso (bool): funcao aceita o argumento `progresso`
+            (callback chamado durante a leitura).
+    """
+
+    __slots__ = ('formato', 'extensoes', 'funcao', 'descricao', 'dependencias',
+                 'com_progresso')
+
+    def __init__(
+        self,
+        formato: str,
+        extensoes: Tuple[str, ...],
+        funcao: Callable[[str], pd.DataFrame],
+        descricao: str,
+        dependencias: Tuple[str, ...] = (),
+        com_progresso: bool = False,
+    ):
+        self.formato = formato
+        self.extensoes = tuple(ext.lower() for ext in extensoes)
+        self.funcao = funcao
+        self.descricao = descricao
+        self.dependencias = dependencias
+        self.com_progresso = com_progresso
+
+    @property
+    def disponivel(self) -> bool:
+        """True se as dependencias opcionais do formato estao instaladas."""
+        return not self.dependencias or any(map(_disponivel, self.dependencias))
+
+    def __repr__(self) -> str:
+        return f"Leitor({self.formato!r}, {self.extensoes!r})"
+
+
+_LEITORES: Dict[str, Leitor] = {}
+
+
+def _disponivel(modulo: str) -> bool:
+    """True se o modulo pode ser importado."""
+    return importlib.util.find_spec(modulo) is not None
+
+
+def registrar_leitor(leitor: Leitor) -> None:
+    """Registra (ou substitui) o leitor para cada uma de suas extensoes."""
+    for extensao in leitor.extensoes:
+        _LEITORES[extensao] = leitor
+
+
+def leitores_registrados() -> List[Leitor]:
+    """Leitores registrados, sem repeticao, na ordem de registro."""
+    return list(dict.fromkeys(_LEITORES.values()))
+
+
+def leitor_para(caminho: str) -> Leitor:
+    """
+    Leitor correspondente a extensao do arquivo.
+
+    Raises:
+        ArquivoInvalidoException: extensao sem leitor registrado.
+    """
+    extensao = os.path.splitext(str(caminho))[1].lower()
+    if extensao not in _LEITORES:
+        suportadas = ', '.join(sorted(_LEITORES))
+        raise ArquivoInvalidoException(
+            f"Formato nao suportado: {caminho} (extensoes aceitas: {suportadas})"
+        )
+    return _LEITORES[extensao]
+
+
+def ler_tabela(caminho: str, progresso: Optional[Progresso] = None) -> pd.DataFrame:
+    """
+    Le um arquivo de entrada com o leitor registrado para sua extensao.
+
+    Args:
+        caminho (str): Arquivo de entrada.
+        progresso (Progresso, optional): Repassado aos leitores com
+            com_progresso; para os demais, chamado apenas no inicio e no fim.
+
+    Raises:
+        ArquivoInvalidoException: formato nao suportado ou dependencia
+            opcional do formato nao instalada.
+        OperacaoCancelada: levantada pelo callback de progresso.
+    """
+    leitor = leitor_para(caminho)
+    if not leitor.disponivel:
+        raise ArquivoInvalidoException(
+            f"Leitura de arquivos {leitor.formato} requer "
+            f"{' ou '.join(leitor.dependencias)} (pip install {leitor.dependencias[0]})"
+        )
+    if progresso is None:
+        return leitor.funcao(caminho)
+    if leitor.com_progresso:
+        return leitor.funcao(caminho, progresso=progresso)
+
+    etapa = f"Lendo {leitor.descricao}"
+    notificar(progresso, 0.0, etapa)
+    tabela = leitor.funcao(caminho)
+    notificar(progresso, 1.0, etapa)
+    return tabela
+
+
+def filtro_dialogo() -> str:
+    """Filtro de QFileDialog com todos os formatos disponiveis."""
+    disponiveis = [leitor for leitor in leitores_registrados() if leitor.disponivel]
+    padroes = ' '.join(f"*{ext}" for leitor in disponiveis for ext in leitor.extensoes)
+    filtros = [f"Arquivos de dados ({padroes})"]
+    filtros += [
+        f"{leitor.descricao} ({' '.join('*' + ext for ext in leitor.extensoes)})"
+        for leitor in disponiveis
+    ]
+    return ';;'.join(filtros)
+
+
+registrar_leitor(Leitor('excel', ('.xlsx', '.xls'), ler_excel, 'Arquivos Excel',
+                        com_progresso=True))
+registrar_leitor(Leitor('csv', ('.csv',), ler_csv, 'Arquivos CSV', com_progresso=True))
+registrar_leitor(Leitor('parquet', ('.parquet', '.pq'), ler_parquet, 'Arquivos Parquet',
+                        dependencias=('pyarrow', 'fastparquet')))
+registrar_leitor(Leitor('feather', ('.feather', '.arrow'), ler_feather, 'Arquivos Feather',
+                        dependencias=('pyarrow',)))
+registrar_leitor(Leitor('npz', ('.npz',), ler_npz, 'Arquivos NumPy'))
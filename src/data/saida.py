@@ -0,0 +1,187 @@
+"""
+Modulo de Saida
+
+Serializa os resultados de uma analise (estatisticas por ponto e parametros
+de regressao) em formatos legiveis por maquina, para o modo CLI sem grafico
+(`scalc.py --cli --output json|csv|ndjson`).
+
+Formatos:
+    json   : um objeto {"arquivo", "estatisticas": [...], "regressoes": [...]}
+    ndjson : um objeto por linha, com o campo "tipo" ('ponto' ou 'regressao')
+    csv    : uma tabela com a coluna "tipo" e a uniao das colunas dos dois
+             tipos de registro (celulas vazias onde nao se aplicam)
+
+Regressoes ponderadas (--ponderada) acrescentam as colunas
+COLUNAS_PONDERADA aos registros de regressao.
+
+Os ajustes locais opcionais (--janela, --segmentos; src.core.segmentos)
+entram como as chaves "janelas"/"segmentos" do JSON e como registros dos
+tipos 'janela'/'segmento' no NDJSON e no CSV.
+
+Valores ausentes (NaN) viram null em JSON/NDJSON e celulas vazias em CSV.
+"""
+
+import io
+import json
+import math
+import sys
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from src.data.colunas import COLUNAS_JANELA, COLUNAS_SEGMENTO
+from src.data.config import Config
+
+FORMATOS_SAIDA = ('json', 'csv', 'ndjson')
+
+COLUNAS_ESTATISTICAS = ['Dados', 'Media', 'S_err', 'T_err']
+COLUNAS_REGRESSAO = ['X', 'Y', 'slope', 'intercept', 'r_squared', 'n', 'qualidade']
+COLUNAS_PONDERADA = ['metodo', 'erro_slope', 'erro_intercept', 'chi2_reduzido']
+
+
+def _nativo(valor: Any) -> Any:
+    """Converte escalares numpy/pandas em tipos do Python (NaN -> None)."""
+    if hasattr(valor, 'item'):
+        valor = valor.item()
+    if valor is None or valor is pd.NA:
+        return None
+    if isinstance(valor, float) and math.isnan(valor):
+        return None
+    return valor
+
+
+def _registros(tabela: pd.DataFrame, colunas: List[str]) -> List[Dict[str, Any]]:
+    return [
+        {coluna: _nativo(valor) for coluna, valor in zip(colunas, linha)}
+        for linha in tabela[colunas].itertuples(index=False, name=None)
+    ]
+
+
+def tabela_regressoes(regressoes: pd.DataFrame) -> pd.DataFrame:
+    """
+    Completa uma tabela de regressoes com a coluna 'qualidade'.
+
+    Args:
+        regressoes (pd.DataFrame): Colunas X, Y, slope, intercept,
+            r_squared, n (formato de regressao_todos_pares) e, se
+            ponderadas, COLUNAS_PONDERADA.
+
+    Returns:
+        pd.DataFrame: Colunas COLUNAS_REGRESSAO (mais COLUNAS_PONDERADA,
+            se presentes); 'qualidade' e a classificacao de
+            Config.validar_r2 (None quando R2 e NaN).
+    """
+    tabela = regressoes.copy()
+    tabela['qualidade'] = [
+        None if pd.isna(r2) else Config.validar_r2(r2) for r2 in tabela['r_squared']
+    ]
+    return tabela[_colunas_regressao(tabela)]
+
+
+def _colunas_regressao(regressoes: pd.DataFrame) -> List[str]:
+    if set(COLUNAS_PONDERADA) <= set(regressoes.columns):
+        return COLUNAS_REGRESSAO + COLUNAS_PONDERADA
+    return COLUNAS_REGRESSAO
+
+
+def formatar_resultados(
+    estatisticas: pd.DataFrame,
+    regressoes: pd.DataFrame,
+    formato: str,
+    arquivo: Optional[str] = None,
+    janelas: Optional[pd.DataFrame] = None,
+    segmentos: Optional[pd.DataFrame] = None,
+) -> str:
+    """
+    Serializa estatisticas e regressoes no formato pedido.
+
+    Args:
+        estatisticas (pd.DataFrame): Colunas Dados, Media, S_err, T_err.
+        regressoes (pd.DataFrame): Colunas X, Y, slope, intercept,
+            r_squared, n ('qualidade' e calculada se ausente) e,
+            opcionalmente, COLUNAS_PONDERADA.
+        formato (str): 'json', 'csv' ou 'ndjson'.
+        arquivo (str, optional): Arquivo de entrada (apenas no JSON).
+        janelas (pd.DataFrame, optional): Colunas COLUNAS_JANELA
+            (regressao_janela).
+        segmentos (pd.DataFrame, optional): Colunas COLUNAS_SEGMENTO
+            (regressao_segmentada).
+
+    Returns:
+        str: Texto serializado, terminado em nova linha.
+
+    Raises:
+        ValueError: formato desconhecido.
+    """
+    if formato not in FORMATOS_SAIDA:
+        raise ValueError(
+            f"Formato de saida desconhecido: '{formato}' "
+            f"(disponiveis: {', '.join(FORMATOS_SAIDA)})"
+        )
+    if 'qualidade' not in regressoes.columns:
+        regressoes = tabela_regressoes(regressoes)
+
+    pontos = _registros(estatisticas, COLUNAS_ESTATISTICAS)
+    colunas_regressao = _colunas_regressao(regressoes)
+    ajustes = _registros(regressoes, colunas_regressao)
+    locais = {}
+    colunas_locais = []
+    for chave, tipo, tabela, colunas in (
+        ('janelas', 'janela', janelas, COLUNAS_JANELA),
+        ('segmentos', 'segmento', segmentos, COLUNAS_SEGMENTO),
+    ):
+        if tabela is not None:
+            locais[chave] = (tipo, _registros(tabela, colunas))
+            colunas_locais += [c for c in colunas if c not in colunas_regressao
+                               and c not in colunas_locais]
+
+    if formato == 'json':
+        documento = {'arquivo': arquivo, 'estatisticas': pontos, 'regressoes': ajustes}
+        documento.update({chave: registros for chave, (_, registros) in locais.items()})
+        return json.dumps(documento, ensure_ascii=False, indent=2, allow_nan=False) + '\n'
+
+    linhas = ([{'tipo': 'ponto', **p} for p in pontos]
+              + [{'tipo': 'regressao', **a} for a in ajustes])
+    for tipo, registros in locais.values():
+        linhas += [{'tipo': tipo, **r} for r in registros]
+    if formato == 'ndjson':
+        return ''.join(
+            json.dumps(linha, ensure_ascii=False, allow_nan=False) + '\n' for linha in linhas
+        )
+
+    tabela = pd.DataFrame(
+        linhas, columns=['tipo'] + COLUNAS_ESTATISTICAS + colunas_regressao + colunas_locais
+    )
+    tabela['n'] = tabela['n'].astype('Int64')     # sem '8.0' nas linhas de regressao
+    if 'segmento' in tabela:
+        tabela['segmento'] = tabela['segmento'].astype('Int64')
+    texto = io.StringIO()
+    tabela.to_csv(texto, index=False, lineterminator='\n')
+    return texto.getvalue()
+
+
+def escrever_resultados(
+    estatisticas: pd.DataFrame,
+    regressoes: pd.DataFrame,
+    formato: str,
+    destino: Optional[str] = None,
+    arquivo: Optional[str] = None,
+    janelas: Optional[pd.DataFrame] = None,
+    segmentos: Optional[pd.DataFrame] = None,
+) -> None:
+    """
+    Escreve os resultados em um arquivo ou na saida padrao.
+
+    Args:
+        destino (str, optional): Caminho de saida; None ou '-' escreve em
+            sys.stdout (os logs vao para stderr, sem misturar).
+        Demais argumentos: ver formatar_resultados().
+    """
+    texto = formatar_resultados(estatisticas, regressoes, formato, arquivo=arquivo,
+                                janelas=janelas, segmentos=segmentos)
+    if destino is None or destino == '-':
+        sys.stdout.write(texto)
+        sys.stdout.flush()
+    else:
+        with open(destino, 'w', encoding='utf-8', newline='') as saida:
+            saida.write(texto)
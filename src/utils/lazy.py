@@ -0,0 +1,45 @@
+"""
+Modulo de Exportacoes Preguicosas
+
+Implementa, para os `__init__` dos pacotes, as exportacoes carregadas sob
+demanda (PEP 562): o atributo so e importado do submodulo que o define no
+primeiro acesso e fica guardado no namespace do pacote.
+
+Examples:
+    >>> # src/core/__init__.py
+    >>> _EXPORTACOES = {'RegLin': '.regression'}
+    >>> __all__ = list(_EXPORTACOES)
+    >>> __getattr__, __dir__ = exportar_preguicoso(__name__, _EXPORTACOES)
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple
+
+
+def exportar_preguicoso(
+    nome_modulo: str,
+    tabela: Dict[str, str],
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Funcoes `__getattr__` e `__dir__` de modulo para uma tabela de exportacoes.
+
+    Args:
+        nome_modulo (str): `__name__` do pacote (ja em sys.modules).
+        tabela (Dict[str, str]): nome exportado -> modulo que o define,
+            absoluto ('src.core') ou relativo ao pacote ('.plots').
+
+    Returns:
+        Tuple: (__getattr__, __dir__) a atribuir no namespace do pacote.
+    """
+    def __getattr__(nome: str):
+        if nome in tabela:
+            valor = getattr(importlib.import_module(tabela[nome], nome_modulo), nome)
+            setattr(sys.modules[nome_modulo], nome, valor)
+            return valor
+        raise AttributeError(f"module {nome_modulo!r} has no attribute {nome!r}")
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[nome_modulo])) | set(tabela))
+
+    return __getattr__, __dir__
@@ -0,0 +1,33 @@
+"""
+Modulo de Progresso
+
+Contrato dos callbacks de progresso das etapas longas (leitura de arquivos
+e particionamento). Um callback recebe a fracao concluida (0.0 a 1.0) e o
+nome da etapa. O cancelamento e cooperativo: o callback pode levantar
+OperacaoCancelada, que interrompe a etapa no proximo ponto de notificacao e
+se propaga ao chamador.
+"""
+
+from typing import Callable, Optional
+
+# progresso(fracao, etapa)
+Progresso = Callable[[float, str], None]
+
+
+def notificar(progresso: Optional[Progresso], fracao: float, etapa: str) -> None:
+    """Chama o callback (se houver) com a fracao limitada a [0, 1]."""
+    if progresso is not None:
+        progresso(min(max(float(fracao), 0.0), 1.0), etapa)
+
+
+def subfaixa(progresso: Optional[Progresso], inicio: float, fim: float) -> Optional[Progresso]:
+    """
+    Callback que mapeia [0, 1] de uma sub-etapa em [inicio, fim] do total.
+
+    Examples:
+        >>> ler = subfaixa(progresso, 0.0, 0.8)     # leitura: 0 a 80 %
+        >>> ler(0.5, 'Lendo')                       # progresso(0.4, 'Lendo')
+    """
+    if progresso is None:
+        return None
+    return lambda fracao, etapa: progresso(inicio + (fim - inicio) * fracao, etapa)
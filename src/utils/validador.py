@@ -81,6 +81,47 @@ class ValidadorDados:
         logger.info(f"Arquivo '{caminho}' validado ({tamanho_mb:.2f}MB)")
         return True
     
+    @staticmethod
+    def validar_arquivo_entrada(caminho: str) -> bool:
+        """
+        Valida arquivo de entrada de qualquer formato registrado em leitores
+        
+        Args:
+            caminho: Caminho do arquivo
+            
+        Returns:
+            bool: True se valido
+            
+        Raises:
+            ArquivoInvalidoException: Se o arquivo nao existir, o formato nao
+                for suportado (ou sua dependencia nao estiver instalada) ou
+                exceder Config.Leitura.MAX_TAMANHO_MB do formato
+        """
+        import os
+        from src.data.leitores import leitor_para
+        
+        if not os.path.exists(caminho):
+            raise ArquivoInvalidoException(f"Arquivo nao encontrado: {caminho}")
+        
+        leitor = leitor_para(caminho)
+        if not leitor.disponivel:
+            raise ArquivoInvalidoException(
+                f"Leitura de arquivos {leitor.formato} requer "
+                f"{' ou '.join(leitor.dependencias)}"
+            )
+        
+        limite_mb = Config.Leitura.MAX_TAMANHO_MB.get(
+            leitor.formato, Config.Validacao.MAX_TAMANHO_ARQUIVO_MB
+        )
+        tamanho_mb = os.path.getsize(caminho) / (1024 * 1024)
+        if tamanho_mb > limite_mb:
+            raise ArquivoInvalidoException(
+                f"Arquivo {leitor.formato} excede tamanho maximo de {limite_mb}MB"
+            )
+        
+        logger.info(f"Arquivo '{caminho}' validado ({leitor.formato}, {tamanho_mb:.2f}MB)")
+        return True
+    
     @staticmethod
     def validar_dados_numericos(
         serie: pd.Series,
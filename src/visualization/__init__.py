@@ -2,8 +2,18 @@
 Modulo de Visualizacao
 
 Contem funcoes para plotagem de graficos e interface grafica
+
+PlotarGrafico e carregado sob demanda (PEP 562), para que importar o pacote
+nao importe o matplotlib.
 """
 
-from .plots import PlotarGrafico
+from src.utils.lazy import exportar_preguicoso
+
+# nome exportado -> submodulo que o define
+_EXPORTACOES = {
+    'PlotarGrafico': '.plots',
+}
+
+__all__ = list(_EXPORTACOES)
 
-__all__ = ['PlotarGrafico']
+__getattr__, __dir__ = exportar_preguicoso(__name__, _EXPORTACOES)
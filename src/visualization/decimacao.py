@@ -0,0 +1,202 @@
+"""
+Modulo de Decimacao (nivel de detalhe)
+
+Reduz series muito grandes ao que cabe na tela antes de desenhar as barras
+de erro: os pontos visiveis sao agrupados por coluna de pixel e cada coluna
+e representada pelos pontos de menor e de maior Y, com barras de erro que
+cobrem o envelope de todas as barras da coluna. O resultado e visualmente
+igual ao desenho completo (as barras de uma coluna de pixel se sobrepoem),
+com no maximo 2 pontos por pixel.
+
+BarrasErroLOD aplica a decimacao a um errorbar do matplotlib e a refaz a
+cada mudanca do limite X (zoom/pan da barra de navegacao), atualizando os
+artistas no lugar.
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.data.config import Config
+
+# (x, y, erros_x, erros_y); erros com forma (2, n): [inferior, superior]
+Serie = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def _erros_assimetricos(erros, n: int) -> np.ndarray:
+    """Escalar, (n,) ou (2, n) -> array (2, n) [inferior, superior]."""
+    erros = np.asarray(erros, dtype=float)
+    if erros.ndim == 2:
+        return erros
+    return np.broadcast_to(erros, (2, n))
+
+
+def decimar(
+    x: Sequence[float],
+    y: Sequence[float],
+    erros_x,
+    erros_y,
+    xlim: Optional[Tuple[float, float]] = None,
+    largura_px: int = 800,
+    limiar: Optional[int] = None,
+) -> Serie:
+    """
+    Decimacao por coluna de pixel com envelope min/max dos erros.
+
+    Args:
+        x, y: Pontos (qualquer ordem).
+        erros_x, erros_y: Erros simetricos (escalar ou (n,)) ou
+            assimetricos ((2, n): inferior, superior).
+        xlim: Faixa visivel (padrao: faixa dos dados). Pontos cujas barras
+            nao alcancam a faixa sao descartados.
+        largura_px: Largura da area de desenho em pixels.
+        limiar: Abaixo desse numero de pontos visiveis, nada e decimado
+            (padrao: Config.Plot.LOD_LIMIAR).
+
+    Returns:
+        Serie: (x, y, erros_x, erros_y) com erros (2, m). Sem decimacao,
+            os pontos visiveis sao devolvidos na ordem original.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    ex = _erros_assimetricos(erros_x, x.size)
+    ey = _erros_assimetricos(erros_y, y.size)
+    if limiar is None:
+        limiar = Config.Plot.LOD_LIMIAR
+
+    x_inf, x_sup = x - ex[0], x + ex[1]
+    if xlim is not None:
+        inicio, fim = min(xlim), max(xlim)
+        visiveis = (x_sup >= inicio) & (x_inf <= fim)
+        if not visiveis.all():
+            x, y, ex, ey = x[visiveis], y[visiveis], ex[:, visiveis], ey[:, visiveis]
+            x_inf, x_sup = x_inf[visiveis], x_sup[visiveis]
+    if x.size <= max(limiar, 2 * largura_px):
+        return x, y, ex, ey
+
+    inicio, fim = (x.min(), x.max()) if xlim is None else (min(xlim), max(xlim))
+    escala = largura_px / (fim - inicio) if fim > inicio else 0.0
+    colunas = np.clip(((x - inicio) * escala).astype(np.int64), 0, largura_px - 1)
+
+    # Ordena por coluna e, dentro da coluna, por y: o primeiro e o ultimo de
+    # cada grupo sao os pontos de menor e maior Y
+    ordem = np.lexsort((y, colunas))
+    colunas = colunas[ordem]
+    limites = np.flatnonzero(np.diff(colunas)) + 1
+    primeiros = np.concatenate(([0], limites))
+    ultimos = np.concatenate((limites, [colunas.size])) - 1
+    i_min, i_max = ordem[primeiros], ordem[ultimos]
+
+    def envelope(valores: np.ndarray, reducao) -> np.ndarray:
+        return reducao.reduceat(valores[ordem], primeiros)
+
+    y_inf = envelope(y - ey[0], np.minimum)
+    y_sup = envelope(y + ey[1], np.maximum)
+    env_x_inf = envelope(x_inf, np.minimum)
+    env_x_sup = envelope(x_sup, np.maximum)
+
+    # Dois representantes por coluna (um so quando coincidem)
+    unico = i_min == i_max
+    indices = np.concatenate((i_min, i_max[~unico]))
+    grupo = np.concatenate((np.arange(i_min.size), np.flatnonzero(~unico)))
+    xd, yd = x[indices], y[indices]
+    erros_xd = np.vstack((xd - env_x_inf[grupo], env_x_sup[grupo] - xd))
+    erros_yd = np.vstack((yd - y_inf[grupo], y_sup[grupo] - yd))
+    return xd, yd, erros_xd, erros_yd
+
+
+def _segmentos(x0, y0, x1, y1) -> np.ndarray:
+    """
+    Segmentos (x0, y0)-(x1, y1) como um unico caminho separado por NaN.
+
+    Um LineCollection com um so caminho e desenhado de uma vez; com um
+    caminho por segmento, o matplotlib cria um Path para cada barra, o que
+    domina o tempo de atualizacao a partir de algumas centenas de pontos.
+    """
+    vertices = np.full((len(x0), 3, 2), np.nan)
+    vertices[:, 0, 0], vertices[:, 0, 1] = x0, y0
+    vertices[:, 1, 0], vertices[:, 1, 1] = x1, y1
+    return vertices.reshape(-1, 2)
+
+
+class BarrasErroLOD:
+    """
+    Errorbar com nivel de detalhe: desenha apenas a serie decimada.
+
+    Os artistas (pontos, capas e barras) sao criados uma unica vez e
+    atualizados no lugar. A serie completa fica guardada; a decimacao e
+    refeita quando o limite X muda (zoom ou pan) e em atualizar().
+
+    O matplotlib guarda o callback de xlim por referencia fraca: mantenha
+    o objeto referenciado (ex.: atributo da janela) enquanto o grafico
+    estiver na tela.
+
+    Args:
+        ax: Eixos do matplotlib.
+        **estilo: Argumentos de ax.errorbar (fmt, color, ecolor, capsize...).
+
+    Examples:
+        >>> barras = BarrasErroLOD(ax, fmt='o', capsize=5)
+        >>> barras.definir_dados(x, y, ex, ey)    # 1e6 pontos
+        >>> barras.n_desenhados                    # <= 2 * largura em pixels
+    """
+
+    def __init__(self, ax, **estilo):
+        self.ax = ax
+        # Um ponto inicial: com dados vazios o errorbar nao cria as capas
+        self.barras = ax.errorbar([0.0], [0.0], xerr=[0.0], yerr=[0.0], **estilo)
+        self._serie: Optional[Serie] = None
+        self.n_desenhados = 0
+        self._conexao = ax.callbacks.connect('xlim_changed', self._ao_mudar_limite)
+
+    def definir_dados(self, x, y, erros_x, erros_y, desenhar: bool = True) -> None:
+        """
+        Guarda a serie completa e desenha a decimacao da faixa atual.
+
+        Com desenhar=False, apenas guarda a serie: util quando os limites
+        serao definidos em seguida (set_xlim(..., emit=False) + atualizar()),
+        evitando decimar duas vezes.
+        """
+        x = np.asarray(x, dtype=float)
+        self._serie = (x, np.asarray(y, dtype=float),
+                       _erros_assimetricos(erros_x, x.size),
+                       _erros_assimetricos(erros_y, x.size))
+        if desenhar:
+            self.atualizar()
+
+    def atualizar(self) -> None:
+        """Refaz a decimacao para o limite X e a largura atuais."""
+        if self._serie is None:
+            return
+        largura = max(1, int(self.ax.get_window_extent().width))
+        x, y, ex, ey = decimar(*self._serie, xlim=self.ax.get_xlim(), largura_px=largura)
+        self._desenhar(x, y, ex, ey)
+
+    def envelope(self) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+        """
+        Extremos da serie completa, incluindo as barras de erro.
+
+        Returns:
+            ((x_min, x_max), (y_min, y_max)); o ponto inicial do errorbar
+            nao entra (use-o no lugar do autoscale do matplotlib).
+        """
+        x, y, ex, ey = self._serie
+        return ((float(np.nanmin(x - ex[0])), float(np.nanmax(x + ex[1]))),
+                (float(np.nanmin(y - ey[0])), float(np.nanmax(y + ey[1]))))
+
+    def desconectar(self) -> None:
+        """Remove o callback de xlim (antes de descartar os artistas)."""
+        self.ax.callbacks.disconnect(self._conexao)
+
+    def _ao_mudar_limite(self, _ax) -> None:
+        self.atualizar()
+
+    def _desenhar(self, x, y, ex, ey) -> None:
+        pontos, capas, (linhas_x, linhas_y) = self.barras.lines
+        pontos.set_data(x, y)
+        x_esq, x_dir, y_inf, y_sup = x - ex[0], x + ex[1], y - ey[0], y + ey[1]
+        linhas_x.set_segments([_segmentos(x_esq, y, x_dir, y)])
+        linhas_y.set_segments([_segmentos(x, y_inf, x, y_sup)])
+        for capa, (cx, cy) in zip(capas, ((x_esq, y), (x_dir, y), (x, y_inf), (x, y_sup))):
+            capa.set_data(cx, cy)
+        self.n_desenhados = x.size
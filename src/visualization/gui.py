@@ -4,49 +4,329 @@ Modulo de Interface Grafica (GUI)
 Contem a interface grafica principal do SCalc usando PySide6.
 """
 
+import logging
 import sys
+import time
+from typing import NamedTuple
+
 import numpy as np
-import pandas as pd
 from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QLineEdit, QTextEdit, QFileDialog,
-    QTableWidget, QTableWidgetItem, QGroupBox, QComboBox,
-    QTabWidget, QMessageBox, QSplitter
+    QTableView, QGroupBox, QComboBox, QCheckBox,
+    QTabWidget, QMessageBox, QSplitter, QProgressBar
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThreadPool, QTimer, Signal
 from PySide6.QtGui import QFont
 
-from src.core import calcular_estatisticas, RegLin
-from src.core.statistics import particionar
+from src.core import Analise
+from src.core.exceptions import RegressaoException, ScalcException
+from src.core.regression import IndiceRegressao, RegLin
+from src.data.config import Config
+from src.data.entrada import carregar_tabela
+from src.data.leitores import filtro_dialogo
+from src.utils.progresso import Progresso, notificar
+from src.visualization.decimacao import BarrasErroLOD
+from src.visualization.plots import limites_eixo
+from src.visualization.tabela import ModeloTabela
+from src.visualization.tarefas import Tarefa
+
+logger = logging.getLogger(__name__)
+
+
+def _carregar_analise(caminho: str, usar_cache: bool | None = None,
+                      progresso: Progresso | None = None) -> Analise:
+    """Le o arquivo (entrada.carregar_tabela) e devolve a Analise da tabela."""
+    return Analise(carregar_tabela(caminho, usar_cache=usar_cache, progresso=progresso))
+
+
+def _cabe(minimo: float, maximo: float, atual: tuple,
+          folga: float = 2 * Config.Plot.MARGEM_EIXOS) -> bool:
+    """
+    Os dados [minimo, maximo] cabem nos limites `atual`, e os limites que
+    limites_eixo() daria a eles ocupam ao menos (1 - folga) da faixa atual.
+    """
+    inferior, superior = limites_eixo(minimo, maximo)
+    return (atual[0] <= minimo and maximo <= atual[1]
+            and superior - inferior >= (1 - folga) * (atual[1] - atual[0]))
+
+
+class _EstadoGrafico(NamedTuple):
+    """O que, alem dos limites, decide se o fundo do ultimo draw() serve."""
+    titulo: str
+    rotulo_x: str
+    rotulo_y: str
+    cor_ponto: str
+    cor_erro: str
+    tem_reta: bool
+
+    def textos(self) -> tuple:
+        return self.titulo, self.rotulo_x, self.rotulo_y
 
 
 class MplCanvas(FigureCanvas):
-    """Canvas do Matplotlib integrado ao Qt"""
+    """
+    Canvas do Matplotlib integrado ao Qt, com artistas persistentes.
+
+    Pontos/barras de erro (BarrasErroLOD), reta e texto da equacao sao
+    criados uma unica vez e marcados como animados: mostrar() apenas troca
+    seus dados. Quando limites, textos, cores e legenda nao mudam, o
+    redesenho e feito por blitting (fundo em cache + draw_artist dos
+    artistas animados); caso contrario, um draw() completo, que recaptura
+    o fundo no draw_event. Os limites atuais sao mantidos enquanto os novos
+    dados couberem neles sem sobrar muito espaco (ver _cabe), para que novos
+    ajustes e dados na mesma faixa nao forcem o draw completo. A latencia de
+    cada redesenho fica em latencia_ms e modo_redesenho ('blit' ou
+    'completo').
+
+    Com uma reta desenhada, arrastar o botao esquerdo sobre o grafico
+    seleciona uma faixa de x (destacada) e o zoom/pan da barra de
+    navegacao altera a faixa visivel; ambos emitem faixa_selecionada, para
+    que a janela reajuste a reta so nessa faixa (atualizar_reta). Um
+    clique sem arrastar emite (x, x): volta ao ajuste completo.
+
+    Signals:
+        faixa_selecionada(float, float): x_min, x_max da faixa de ajuste.
+    """
+
+    faixa_selecionada = Signal(float, float)
+
     def __init__(self, parent=None, width=8, height=6, dpi=100):
         self.fig = Figure(figsize=(width, height), dpi=dpi)
         self.axes = self.fig.add_subplot(111)
         super().__init__(self.fig)
         self.setParent(parent)
 
+        self.axes.grid(True, alpha=0.3, linestyle='--')
+        self.eixo_h = self.axes.axhline(y=0, color='k', linewidth=0.5)
+        self.eixo_v = self.axes.axvline(x=0, color='k', linewidth=0.5)
+        self.lod = BarrasErroLOD(
+            self.axes, fmt='o', capsize=5, markersize=8,
+            label='Dados experimentais', zorder=5
+        )
+        self.reta, = self.axes.plot([], [], color='blue', linewidth=2,
+                                    label='Melhor reta', zorder=3)
+        self.faixa = self.axes.axvspan(0.0, 1.0, facecolor='tab:orange', alpha=0.15,
+                                       zorder=1, visible=False)
+        self.equacao = self.axes.text(
+            0.02, 0.97, '', transform=self.axes.transAxes, va='top', fontsize=10,
+            bbox=dict(boxstyle='round', facecolor='white', alpha=0.8), zorder=6
+        )
+        pontos, capas, barras = self.lod.barras.lines
+        self._animados = [self.faixa, *barras, *capas, pontos, self.reta, self.equacao]
+        for artista in self._animados:
+            artista.set_animated(True)
+
+        self._fundo = None
+        self._estado: _EstadoGrafico | None = None
+        self._limites = None
+        self.latencia_ms = None
+        self.modo_redesenho = None
+        self._inicio_faixa = None           # x do botao pressionado (arraste)
+        self._draw_pendente = False         # a barra de navegacao vai redesenhar
+        self.mpl_connect('draw_event', self._ao_desenhar)
+        self.mpl_connect('button_press_event', self._ao_pressionar)
+        self.mpl_connect('motion_notify_event', self._ao_arrastar)
+        self.mpl_connect('button_release_event', self._ao_soltar)
+        # mostrar() e limpar() usam emit=False: so zoom/pan chegam aqui
+        self.axes.callbacks.connect('xlim_changed', self._ao_mudar_xlim)
+
+    def _ao_desenhar(self, _evento) -> None:
+        """Apos um draw() completo: guarda o fundo e desenha os animados."""
+        self._draw_pendente = False
+        self._fundo = self.copy_from_bbox(self.fig.bbox)
+        self._desenhar_animados()
+
+    # -- Selecao de faixa ------------------------------------------------ #
+
+    def _selecao_ativa(self, evento) -> bool:
+        """Ha uma reta para reajustar e a barra de navegacao nao esta em zoom/pan."""
+        return (self._estado is not None and self._estado.tem_reta
+                and evento.inaxes is self.axes and not self.widgetlock.locked())
+
+    def _ao_pressionar(self, evento) -> None:
+        if evento.button == 1 and self._selecao_ativa(evento):
+            self._inicio_faixa = evento.xdata
+
+    def _ao_arrastar(self, evento) -> None:
+        if self._inicio_faixa is not None and evento.inaxes is self.axes:
+            x_min, x_max = sorted((self._inicio_faixa, evento.xdata))
+            self.faixa_selecionada.emit(x_min, x_max)
+
+    def _ao_soltar(self, evento) -> None:
+        if self._inicio_faixa is None:
+            return
+        x = evento.xdata if evento.inaxes is self.axes else self._inicio_faixa
+        x_min, x_max = sorted((self._inicio_faixa, x))
+        self._inicio_faixa = None
+        self.faixa_selecionada.emit(x_min, x_max)
+
+    def _ao_mudar_xlim(self, _ax) -> None:
+        if self._estado is not None and self._estado.tem_reta:
+            self._draw_pendente = True      # a barra chama draw_idle() em seguida
+            self.faixa_selecionada.emit(*self.axes.get_xlim())
+
+    def _mostrar_faixa(self, faixa: tuple | None) -> None:
+        if faixa is not None:
+            self.faixa.set_x(faixa[0])
+            self.faixa.set_width(faixa[1] - faixa[0])
+        self.faixa.set_visible(faixa is not None)
+
+    def _definir_reta(self, reta: tuple | None, x_reta: tuple) -> None:
+        if reta is not None:
+            slope, intercept, r_squared = reta
+            x_fit = np.array(x_reta)
+            self.reta.set_data(x_fit, slope * x_fit + intercept)
+            self.equacao.set_text(f'y = {slope:.3f}x + {intercept:.3f}\nR² = {r_squared:.4f}')
+        self.reta.set_visible(reta is not None)
+        self.equacao.set_visible(reta is not None)
+
+    def atualizar_reta(self, reta: tuple | None, faixa: tuple | None = None) -> float:
+        """
+        Troca a reta (e a faixa destacada) sem redesenhar o fundo.
+
+        Usado no reajuste por faixa: pontos, limites e textos nao mudam, de
+        modo que basta o blit. Durante zoom/pan, apenas atualiza os
+        artistas - o draw da barra de navegacao os desenha.
+
+        Args:
+            reta: (slope, intercept, r_squared), ou None para esconde-la
+                (faixa sem pontos suficientes).
+            faixa: (x_min, x_max) destacada e coberta pela reta; None usa
+                toda a faixa visivel, sem destaque.
+
+        Returns:
+            float: Latencia em ms (tambem em latencia_ms).
+        """
+        inicio = time.perf_counter()
+        self._definir_reta(reta, faixa if faixa is not None else self.axes.get_xlim())
+        self._mostrar_faixa(faixa)
+        if self._draw_pendente or self._fundo is None:
+            self.draw_idle()
+            self.modo_redesenho = 'completo'
+        else:
+            self.restore_region(self._fundo)
+            self._desenhar_animados()
+            self.blit(self.axes.bbox)
+            self.modo_redesenho = 'blit'
+        self.latencia_ms = 1000 * (time.perf_counter() - inicio)
+        return self.latencia_ms
+
+    def _desenhar_animados(self) -> None:
+        for artista in self._animados:
+            if artista.get_visible():
+                self.axes.draw_artist(artista)
+
+    def _cores(self, cor_ponto: str, cor_erro: str) -> None:
+        pontos, capas, barras = self.lod.barras.lines
+        pontos.set_color(cor_ponto)
+        for artista in (*capas, *barras):
+            artista.set_color(cor_erro)
+
+    def mostrar(self, x, y, x_err, y_err, titulo: str, rotulo_x: str, rotulo_y: str,
+                reta: tuple | None = None, cor_ponto: str = 'blue',
+                cor_erro: str = 'darkblue', faixa: tuple | None = None) -> float:
+        """
+        Atualiza o grafico no lugar e redesenha (blit quando possivel).
+
+        Args:
+            x, y, x_err, y_err: Pontos e erros totais.
+            titulo, rotulo_x, rotulo_y: Textos do grafico.
+            reta: (slope, intercept, r_squared) ou None (apenas pontos).
+            cor_ponto, cor_erro: Cores dos pontos e das barras de erro.
+            faixa: (x_min, x_max) do ajuste por faixa (destacada), ou None.
+
+        Returns:
+            float: Latencia do redesenho em ms (tambem em latencia_ms).
+        """
+        inicio = time.perf_counter()
+        self.lod.definir_dados(x, y, x_err, y_err, desenhar=False)
+        (x_min, x_max), (y_min, y_max) = self.lod.envelope()
+        xlim = limites_eixo(x_min, x_max)
+
+        # Fundo reaproveitavel: mesmos textos/cores/legenda e nenhum zoom ou
+        # pan da barra de navegacao desde o ultimo draw deste metodo
+        estado = _EstadoGrafico(titulo, rotulo_x, rotulo_y, cor_ponto, cor_erro,
+                                tem_reta=reta is not None)
+        atuais = (self.axes.get_xlim(), self.axes.get_ylim())
+        pode_blit = (estado == self._estado and atuais == self._limites
+                     and self._fundo is not None and self.supports_blit)
+        if pode_blit and _cabe(x_min, x_max, atuais[0]):
+            xlim = atuais[0]
+
+        self._definir_reta(reta, faixa if faixa is not None else xlim)
+        if reta is not None:
+            y_fit = self.reta.get_ydata()
+            y_min, y_max = min(y_min, y_fit.min()), max(y_max, y_fit.max())
+        self._mostrar_faixa(faixa)
+        ylim = limites_eixo(y_min, y_max)
+        self._cores(cor_ponto, cor_erro)
+
+        if pode_blit and xlim == atuais[0] and _cabe(y_min, y_max, atuais[1]):
+            self.lod.atualizar()
+            self.restore_region(self._fundo)
+            self._desenhar_animados()
+            self.blit(self.axes.bbox)   # so a area dos eixos e repintada
+            self.modo_redesenho = 'blit'
+        else:
+            textos_mudaram = self._estado is None or estado.textos() != self._estado.textos()
+            self.eixo_h.set_visible(False)
+            self.eixo_v.set_visible(False)
+            self.axes.set_xlim(xlim, emit=False)
+            self.axes.set_ylim(ylim)
+            self.axes.set_title(titulo, fontsize=14, fontweight='bold')
+            self.axes.set_xlabel(rotulo_x, fontsize=12)
+            self.axes.set_ylabel(rotulo_y, fontsize=12)
+            handles = [self.lod.barras] + ([self.reta] if reta is not None else [])
+            self.axes.legend(handles=handles, loc='best', fontsize=10)
+            if textos_mudaram:
+                self.fig.tight_layout()
+            self.lod.atualizar()        # largura em pixels apos o layout
+            self.draw()
+            self._limites = (self.axes.get_xlim(), self.axes.get_ylim())
+            self.modo_redesenho = 'completo'
+        self._estado = estado
+
+        self.latencia_ms = 1000 * (time.perf_counter() - inicio)
+        logger.debug(f"Redesenho {self.modo_redesenho}: {self.latencia_ms:.1f} ms")
+        return self.latencia_ms
+
+    def limpar(self) -> None:
+        """Grid vazio inicial ('Aguardando dados...')."""
+        self.lod.definir_dados([], [], 0.0, 0.0)
+        self._definir_reta(None, (0.0, 0.0))
+        self._mostrar_faixa(None)
+        self.eixo_h.set_visible(True)
+        self.eixo_v.set_visible(True)
+        legenda = self.axes.get_legend()
+        if legenda is not None:
+            legenda.remove()
+        self.axes.set_xlim(-1, 1, emit=False)
+        self.axes.set_ylim(-1, 1)
+        self.axes.set_xlabel('x', fontsize=12)
+        self.axes.set_ylabel('y', fontsize=12)
+        self.axes.set_title('Aguardando dados...', fontsize=14)
+        self.fig.tight_layout()
+        self._estado = None
+        self.draw()
+
 
 class InterfaceRegressaoLinear(QMainWindow):
     """Interface grafica principal para analise de regressao linear"""
 
-    def __init__(self):
+    def __init__(self, usar_cache: bool | None = None):
         super().__init__()
         self.setWindowTitle("SCalc - Sistema de Calculo e Analise de Regressao Linear")
         self.setGeometry(50, 50, 1400, 900)
 
         # Variaveis de dados
+        self.usar_cache     = usar_cache
         self.dados_excel    = None
-        self.dados_brutos   = {}
-        self.medias         = {}
-        self.err_est        = {}
-        self.err_total      = {}
-        self.err_instr      = {}
+        self.analise        = None
+        self.arrays         = {}        # prefixo -> (medias, erros totais)
         self.data_x         = None
         self.data_y         = None
         self.data_x_err     = None
@@ -54,7 +334,16 @@ class InterfaceRegressaoLinear(QMainWindow):
         self.slope          = None
         self.intercept      = None
         self.r_squared      = None
+        self.faixa_ajuste   = None      # (x_min, x_max) do ajuste por faixa
+        self.ajuste_completo = None     # ajuste do par com todos os pontos
+        self.indice_par     = None      # IndiceRegressao do par (ajuste por faixa)
         self.caminho_arquivo = None
+        self.tarefa         = None      # Tarefa em segundo plano (uma por vez)
+        self._botoes_antes  = {}
+        self.tarefas_auto   = set()     # recalculos do modo ao vivo em andamento
+        self.recalculo_pendente = False # recalculo adiado por uma tarefa em andamento
+        self.geracao        = 0         # muda a cada troca de X/Y; resultados de
+                                        # uma geracao anterior sao descartados
 
         self.setup_ui()
 
@@ -88,9 +377,9 @@ class InterfaceRegressaoLinear(QMainWindow):
         self.label_arquivo = QLabel("Nenhum arquivo carregado")
         self.label_arquivo.setWordWrap(True)
         layout_arquivo.addWidget(self.label_arquivo)
-        btn_carregar = QPushButton("📁 Selecionar Arquivo Excel")
-        btn_carregar.clicked.connect(self.carregar_arquivo)
-        layout_arquivo.addWidget(btn_carregar)
+        self.btn_carregar = QPushButton("📁 Selecionar Arquivo de Dados")
+        self.btn_carregar.clicked.connect(self.carregar_arquivo)
+        layout_arquivo.addWidget(self.btn_carregar)
         grupo_arquivo.setLayout(layout_arquivo)
         layout_esquerdo.addWidget(grupo_arquivo)
 
@@ -109,6 +398,16 @@ class InterfaceRegressaoLinear(QMainWindow):
         # sinais: auto-fill de labels + reset de regressao
         self.combo_var_x.currentTextChanged.connect(self._on_var_x_changed)
         self.combo_var_y.currentTextChanged.connect(self._on_var_y_changed)
+        # Modo ao vivo: cada troca reinicia o timer (debounce); ao disparar,
+        # regressao e grafico sao refeitos em segundo plano
+        self.check_ao_vivo = QCheckBox("Atualizar regressão e gráfico ao trocar")
+        self.check_ao_vivo.setChecked(Config.UI.RECALCULO_AUTOMATICO)
+        self.check_ao_vivo.toggled.connect(self._on_ao_vivo_toggled)
+        layout_variaveis.addWidget(self.check_ao_vivo)
+        self.timer_recalculo = QTimer(self)
+        self.timer_recalculo.setSingleShot(True)
+        self.timer_recalculo.setInterval(Config.UI.ATRASO_RECALCULO_MS)
+        self.timer_recalculo.timeout.connect(self.recalcular_ao_vivo)
         grupo_variaveis.setLayout(layout_variaveis)
         layout_esquerdo.addWidget(grupo_variaveis)
 
@@ -149,19 +448,31 @@ class InterfaceRegressaoLinear(QMainWindow):
         self.btn_plotar.setEnabled(False)
         layout_acoes.addWidget(self.btn_plotar)
 
-        btn_limpar = QPushButton("🗑️ Limpar Tudo")
-        btn_limpar.clicked.connect(self.limpar_tudo)
-        layout_acoes.addWidget(btn_limpar)
+        self.btn_limpar = QPushButton("🗑️ Limpar Tudo")
+        self.btn_limpar.clicked.connect(self.limpar_tudo)
+        layout_acoes.addWidget(self.btn_limpar)
 
         grupo_acoes.setLayout(layout_acoes)
         layout_esquerdo.addWidget(grupo_acoes)
 
         # Label de status (substitui mensagens dentro de QTextEdit)
-        self.status_label = QLabel("Carregue um arquivo Excel para começar.")
+        self.status_label = QLabel("Carregue um arquivo de dados para começar.")
         self.status_label.setWordWrap(True)
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout_esquerdo.addWidget(self.status_label)
-        self._set_status("Carregue um arquivo Excel para começar.", "info")
+        self._set_status("Carregue um arquivo de dados para começar.", "info")
+
+        # Progresso das tarefas em segundo plano (visivel so durante elas)
+        layout_progresso = QHBoxLayout()
+        self.barra_progresso = QProgressBar()
+        self.barra_progresso.setRange(0, 1000)
+        self.barra_progresso.setVisible(False)
+        layout_progresso.addWidget(self.barra_progresso)
+        self.btn_cancelar = QPushButton("✖ Cancelar")
+        self.btn_cancelar.clicked.connect(self.cancelar_tarefa)
+        self.btn_cancelar.setVisible(False)
+        layout_progresso.addWidget(self.btn_cancelar)
+        layout_esquerdo.addLayout(layout_progresso)
 
         # Area de Resultados (apenas resultados numericos: regressao)
         grupo_resultados = QGroupBox("📋 Resultados")
@@ -185,6 +496,7 @@ class InterfaceRegressaoLinear(QMainWindow):
         tab_grafico = QWidget()
         layout_tab_grafico = QVBoxLayout(tab_grafico)
         self.canvas = MplCanvas(self, width=10, height=8, dpi=100)
+        self.canvas.faixa_selecionada.connect(self._ajustar_faixa)
         self.toolbar = NavigationToolbar(self.canvas, self)
         layout_tab_grafico.addWidget(self.toolbar)
         layout_tab_grafico.addWidget(self.canvas)
@@ -193,7 +505,13 @@ class InterfaceRegressaoLinear(QMainWindow):
         # Tab Dados
         tab_dados = QWidget()
         layout_tab_dados = QVBoxLayout(tab_dados)
-        self.tabela_dados = QTableWidget()
+        # Modelo sobre o DataFrame: so as celulas visiveis sao formatadas
+        self.modelo_dados = ModeloTabela(parent=self)
+        self.tabela_dados = QTableView()
+        self.tabela_dados.setModel(self.modelo_dados)
+        self.tabela_dados.horizontalHeader().setResizeContentsPrecision(
+            Config.UI.LINHAS_AJUSTE_COLUNAS
+        )
         layout_tab_dados.addWidget(self.tabela_dados)
         self.tabs.addTab(tab_dados, "📄 Dados")
 
@@ -239,11 +557,85 @@ class InterfaceRegressaoLinear(QMainWindow):
         self.status_label.setStyleSheet(base + estilos.get(nivel, estilos["info"]))
         self.status_label.setText(mensagem)
 
+    def _iniciar_tarefa(self, funcao, *args, ao_concluir, ao_falhar, **kwargs) -> bool:
+        """Roda funcao(*args, progresso=..., **kwargs) no QThreadPool.
+
+        Os botoes e seletores ficam desabilitados ate o fim da tarefa; a
+        barra de progresso e o botao Cancelar aparecem durante ela. O
+        resultado chega a `ao_concluir` (ou a excecao a `ao_falhar`) na
+        thread principal, pelos sinais da Tarefa.
+
+        Returns:
+            bool: False se ja ha uma tarefa em andamento.
+        """
+        if self.tarefa is not None:
+            return False
+        tarefa = Tarefa(funcao, *args, **kwargs)
+        sinais = tarefa.sinais
+        # _encerrar_tarefa primeiro: restaura os botoes antes dos handlers
+        for sinal in (sinais.concluida, sinais.falhou, sinais.cancelada):
+            sinal.connect(self._encerrar_tarefa)
+        sinais.progresso.connect(self._ao_progredir)
+        sinais.concluida.connect(ao_concluir)
+        sinais.falhou.connect(ao_falhar)
+        sinais.cancelada.connect(self._ao_cancelar)
+
+        controles = (self.btn_carregar, self.btn_calcular, self.btn_regressao,
+                     self.btn_plotar, self.btn_limpar, self.combo_var_x, self.combo_var_y)
+        self._botoes_antes = {controle: controle.isEnabled() for controle in controles}
+        for controle in controles:
+            controle.setEnabled(False)
+        self.barra_progresso.setValue(0)
+        self.barra_progresso.setFormat("%p%")
+        self.barra_progresso.setVisible(True)
+        self.btn_cancelar.setEnabled(True)
+        self.btn_cancelar.setVisible(True)
+
+        self.tarefa = tarefa
+        QThreadPool.globalInstance().start(tarefa)
+        return True
+
+    def _encerrar_tarefa(self, *_):
+        """Restaura a interface ao fim de uma tarefa (qualquer desfecho)."""
+        self.tarefa = None
+        for controle, habilitado in self._botoes_antes.items():
+            controle.setEnabled(habilitado)
+        self._botoes_antes = {}
+        self.barra_progresso.setVisible(False)
+        self.btn_cancelar.setVisible(False)
+        if self.recalculo_pendente:
+            # Debounce vencido durante a tarefa: reagenda para a selecao atual
+            self.recalculo_pendente = False
+            self._agendar_recalculo()
+
+    def _ao_progredir(self, fracao: float, etapa: str):
+        self.barra_progresso.setValue(int(fracao * 1000))
+        self.barra_progresso.setFormat(f"{etapa}: %p%")
+
+    def _ao_cancelar(self):
+        self._set_status("Operação cancelada.", "warn")
+
+    def cancelar_tarefa(self):
+        """Pede o cancelamento da tarefa em andamento (cooperativo)."""
+        if self.tarefa is not None:
+            self.tarefa.cancelar()
+            self.btn_cancelar.setEnabled(False)
+            self._set_status("Cancelando...", "warn")
+
+    def closeEvent(self, evento):
+        """Cancela as tarefas em andamento e espera as threads terminarem."""
+        self._descartar_recalculos()
+        if self.tarefa is not None:
+            self.tarefa.cancelar()
+        QThreadPool.globalInstance().waitForDone()
+        super().closeEvent(evento)
+
     def _extrair_dados_xy(self, prefixo_x: str, prefixo_y: str) -> tuple:
-        """Extrai e valida arrays X e Y a partir dos dados brutos.
+        """Extrai e valida arrays X e Y do cache por prefixo.
 
         Centraliza a logica que antes estava duplicada em plotar_pontos()
-        e calcular_regressao().
+        e calcular_regressao(). Apenas consulta `self.arrays`, montado uma
+        vez por arquivo em calcular_estatisticas().
 
         Returns:
             tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
@@ -256,20 +648,11 @@ class InterfaceRegressaoLinear(QMainWindow):
             raise ValueError("Selecione as variáveis X e Y.")
         if prefixo_x == prefixo_y:
             raise ValueError("As variáveis X e Y devem ser diferentes.")
-        if prefixo_x not in self.dados_brutos or prefixo_y not in self.dados_brutos:
+        if prefixo_x not in self.arrays or prefixo_y not in self.arrays:
             raise ValueError("Uma ou ambas as variáveis não foram encontradas nos dados.")
 
-        def _processar(prefixo):
-            vals, errs = [], []
-            for chave in sorted(self.dados_brutos[prefixo].keys()):
-                valores = self.dados_brutos[prefixo][chave]
-                if valores:
-                    vals.append(sum(valores) / len(valores))
-                    errs.append(self.err_total.get(chave, 0.0))
-            return vals, errs
-
-        x_vals, x_errs = _processar(prefixo_x)
-        y_vals, y_errs = _processar(prefixo_y)
+        x_vals, x_errs = self.arrays[prefixo_x]
+        y_vals, y_errs = self.arrays[prefixo_y]
 
         if len(x_vals) < 2 or len(y_vals) < 2:
             raise ValueError("Dados insuficientes (minimo 2 iteracoes por variavel).")
@@ -278,10 +661,7 @@ class InterfaceRegressaoLinear(QMainWindow):
                 f"Variaveis com tamanhos diferentes: X={len(x_vals)}, Y={len(y_vals)}"
             )
 
-        return (
-            np.array(x_vals), np.array(y_vals),
-            np.array(x_errs), np.array(y_errs),
-        )
+        return x_vals, y_vals, x_errs, y_errs
 
     def _resetar_estado_regressao(self):
         """Invalida resultados de regressao quando variaveis mudam.
@@ -292,27 +672,110 @@ class InterfaceRegressaoLinear(QMainWindow):
         self.slope     = None
         self.intercept = None
         self.r_squared = None
+        self.faixa_ajuste = None
+        self.ajuste_completo = None
+        self.indice_par = None
         self.data_x    = None
         self.data_y    = None
         self.data_x_err = None
         self.data_y_err = None
         self.texto_resultados.clear()
+        self._descartar_recalculos()
         # btn_regressao fica habilitado se ha estatisticas; btn_plotar idem
-        tem_stats = bool(self.medias)
+        tem_stats = bool(self.arrays)
         self.btn_regressao.setEnabled(tem_stats)
         self.btn_plotar.setEnabled(tem_stats)
 
+    def _limpar_seletores(self):
+        """Esvazia e desabilita os dropdowns X/Y sem disparar os sinais."""
+        for combo in (self.combo_var_x, self.combo_var_y):
+            combo.blockSignals(True)
+            combo.clear()
+            combo.setEnabled(False)
+            combo.blockSignals(False)
+
     def _on_var_x_changed(self, texto: str):
-        """Auto-preenche label do eixo X e reseta regressao."""
+        """Auto-preenche label do eixo X, reseta regressao e agenda o recalculo."""
         if texto:
             self.entrada_x.setText(texto)
         self._resetar_estado_regressao()
+        self._agendar_recalculo()
 
     def _on_var_y_changed(self, texto: str):
-        """Auto-preenche label do eixo Y e reseta regressao."""
+        """Auto-preenche label do eixo Y, reseta regressao e agenda o recalculo."""
         if texto:
             self.entrada_y.setText(texto)
         self._resetar_estado_regressao()
+        self._agendar_recalculo()
+
+    def _on_ao_vivo_toggled(self, ativo: bool):
+        if ativo:
+            self._agendar_recalculo()
+        else:
+            self._descartar_recalculos()
+
+    # ------------------------------------------------------------------ #
+    #  Modo ao vivo (recalculo com debounce)                              #
+    # ------------------------------------------------------------------ #
+
+    def _agendar_recalculo(self):
+        """(Re)inicia o debounce do modo ao vivo para a selecao atual."""
+        if self.check_ao_vivo.isChecked() and self.arrays:
+            self.timer_recalculo.start()
+
+    def _descartar_recalculos(self):
+        """Invalida recalculos pendentes: a selecao (ou o arquivo) mudou."""
+        self.geracao += 1
+        self.timer_recalculo.stop()
+        self.recalculo_pendente = False
+        for tarefa in self.tarefas_auto:
+            tarefa.cancelar()
+
+    def recalcular_ao_vivo(self):
+        """Refaz regressao e grafico do par selecionado em segundo plano.
+
+        Ao contrario de calcular_regressao(), nao bloqueia os controles
+        nem mostra a barra de progresso: o usuario continua trocando X/Y.
+        O resultado so e aplicado se a selecao nao mudou desde o disparo
+        (mesma `geracao`); os demais sao descartados. Com uma tarefa em
+        andamento, o recalculo fica pendente e e reagendado ao fim dela.
+        """
+        if self.tarefa is not None:
+            self.recalculo_pendente = True
+            return
+        if not self.arrays or self.analise is None:
+            return
+        prefixo_x = self.combo_var_x.currentText()
+        prefixo_y = self.combo_var_y.currentText()
+        geracao = self.geracao
+
+        tarefa = Tarefa(self._regressao_par, prefixo_x, prefixo_y)
+        sinais = tarefa.sinais
+        sinais.concluida.connect(lambda resultado: self._ao_recalcular(
+            geracao, prefixo_x, prefixo_y, *resultado))
+        sinais.falhou.connect(lambda erro: self._ao_falhar_recalculo(geracao, erro))
+        # Por ultimo: solta a referencia depois dos demais handlers
+        for sinal in (sinais.concluida, sinais.falhou, sinais.cancelada):
+            sinal.connect(lambda *_, t=tarefa: self.tarefas_auto.discard(t))
+
+        self.tarefas_auto.add(tarefa)
+        QThreadPool.globalInstance().start(tarefa)
+
+    def _ao_recalcular(self, geracao: int, prefixo_x: str, prefixo_y: str,
+                       dados: tuple, ajuste: tuple, indice: IndiceRegressao):
+        if geracao != self.geracao:
+            logger.debug(f"Recalculo obsoleto descartado ({prefixo_x} x {prefixo_y})")
+            return
+        self._ao_calcular_regressao(prefixo_x, prefixo_y, dados, ajuste, indice)
+        try:
+            self._set_status(self._desenhar_grafico(), "ok")
+        except Exception as e:
+            self._set_status(f"Gráfico não atualizado: {e}", "erro")
+
+    def _ao_falhar_recalculo(self, geracao: int, erro: Exception):
+        """Erro do modo ao vivo: so o status (sem dialogos a cada troca)."""
+        if geracao == self.geracao:
+            self._set_status(str(erro), "warn")
 
     # ------------------------------------------------------------------ #
     #  Acoes principais                                                   #
@@ -320,51 +783,63 @@ class InterfaceRegressaoLinear(QMainWindow):
 
     def plotar_grid_inicial(self):
         """Plota um grid vazio inicial"""
-        self.canvas.axes.clear()
-        self.canvas.axes.set_xlabel('x', fontsize=12)
-        self.canvas.axes.set_ylabel('y', fontsize=12)
-        self.canvas.axes.set_title('Aguardando dados...', fontsize=14)
-        self.canvas.axes.grid(True, alpha=0.3, linestyle='--')
-        self.canvas.axes.axhline(y=0, color='k', linewidth=0.5)
-        self.canvas.axes.axvline(x=0, color='k', linewidth=0.5)
-        self.canvas.draw()
+        self.canvas.limpar()
 
     def carregar_arquivo(self):
-        """Carrega arquivo Excel"""
+        """Carrega arquivo de dados (formato pela extensao)"""
         caminho, _ = QFileDialog.getOpenFileName(
-            self, "Selecionar Arquivo Excel", "",
-            "Arquivos Excel (*.xlsx *.xls)"
+            self, "Selecionar Arquivo de Dados", "",
+            filtro_dialogo()
         )
         if not caminho:
             return
 
-        try:
-            self.caminho_arquivo = caminho
-            self.dados_excel = pd.read_excel(caminho)
-            # Pega apenas o nome do arquivo (compativel com / e \)
-            nome = caminho.replace('\\', '/').split('/')[-1]
-            self.label_arquivo.setText(f"✓ {nome}")
-            self.mostrar_dados_tabela()
-            self.btn_calcular.setEnabled(True)
-            self._set_status("Arquivo carregado. Clique em 'Calcular Estatísticas'.", "warn")
-        except Exception as e:
-            QMessageBox.critical(self, "Erro", f"Erro ao carregar arquivo:\n{str(e)}")
-            self._set_status("Erro ao carregar arquivo.", "erro")
+        # Leitura em segundo plano: a janela continua respondendo
+        self._set_status("Carregando arquivo...", "info")
+        self._iniciar_tarefa(
+            _carregar_analise, caminho, usar_cache=self.usar_cache,
+            ao_concluir=lambda analise: self._ao_carregar(caminho, analise),
+            ao_falhar=lambda e: self._ao_falhar("carregar arquivo", e),
+        )
+
+    def _ao_carregar(self, caminho: str, analise: Analise):
+        """Exibe o arquivo carregado pela tarefa de leitura."""
+        self.caminho_arquivo = caminho
+        self.analise = analise
+        self.dados_excel = analise.tabela
+        # Novo arquivo: descarta o cache por prefixo e o que dependia dele
+        self.arrays = {}
+        self._limpar_seletores()
+        self._resetar_estado_regressao()
+        self.texto_estatisticas.clear()
+        # Pega apenas o nome do arquivo (compativel com / e \)
+        nome = caminho.replace('\\', '/').split('/')[-1]
+        self.label_arquivo.setText(f"✓ {nome}")
+        self.mostrar_dados_tabela()
+        self.btn_calcular.setEnabled(True)
+        self._set_status("Arquivo carregado. Clique em 'Calcular Estatísticas'.", "warn")
+
+    def _ao_falhar(self, acao: str, erro: Exception):
+        """Erro de uma tarefa: ValueError vira aviso; o resto, erro critico."""
+        if isinstance(erro, ValueError):
+            QMessageBox.warning(self, "Aviso", str(erro))
+            self._set_status(str(erro), "erro")
+        else:
+            QMessageBox.critical(self, "Erro", f"Erro ao {acao}:\n{str(erro)}")
+            self._set_status(f"Erro ao {acao}.", "erro")
 
     def mostrar_dados_tabela(self):
         """Mostra os dados carregados na tab Dados"""
         if self.dados_excel is None:
             return
-        df = self.dados_excel
-        self.tabela_dados.setRowCount(len(df))
-        self.tabela_dados.setColumnCount(len(df.columns))
-        self.tabela_dados.setHorizontalHeaderLabels([str(c) for c in df.columns])
-        for i in range(len(df)):
-            for j in range(len(df.columns)):
-                valor = df.iloc[i, j]
-                if pd.notna(valor):
-                    self.tabela_dados.setItem(i, j, QTableWidgetItem(str(valor)))
-        self.tabela_dados.resizeColumnsToContents()
+        self.modelo_dados.definir_dados(self.dados_excel)
+        # Ajusta so as colunas que cabem na tela: o custo nao depende do
+        # tamanho da planilha (as demais mantem a largura padrao)
+        largura = self.tabela_dados.viewport().width()
+        for coluna in range(self.modelo_dados.columnCount()):
+            if self.tabela_dados.columnViewportPosition(coluna) > largura:
+                break
+            self.tabela_dados.resizeColumnToContents(coluna)
 
     def calcular_estatisticas(self):
         """Calcula medias e erros estatisticos"""
@@ -372,15 +847,23 @@ class InterfaceRegressaoLinear(QMainWindow):
             QMessageBox.warning(self, "Aviso", "Carregue um arquivo primeiro!")
             return
 
-        try:
-            self.dados_brutos, self.err_instr, _ = particionar(self.dados_excel)
-            resultado_stats = calcular_estatisticas(self.dados_excel)
+        # As etapas sao calculadas em segundo plano, com o progresso do
+        # particionamento, e memoizadas na Analise so na thread principal
+        self._set_status("Calculando estatísticas...", "info")
+        self._iniciar_tarefa(
+            self.analise.calcular_etapas,
+            ao_concluir=self._ao_calcular_estatisticas,
+            ao_falhar=lambda e: self._ao_falhar("calcular estatísticas", e),
+        )
 
-            self.medias    = dict(zip(resultado_stats['Dados'], resultado_stats['Media']))
-            self.err_est   = dict(zip(resultado_stats['Dados'], resultado_stats['S_err']))
-            self.err_total = dict(zip(resultado_stats['Dados'], resultado_stats['T_err']))
+    def _ao_calcular_estatisticas(self, etapas: tuple):
+        """Guarda as etapas calculadas pela tarefa e preenche seletores e estatisticas."""
+        try:
+            # (medicoes, estatisticas, arrays) de Analise.calcular_etapas()
+            self.analise.guardar_etapas(*etapas)
+            self.arrays = self.analise.arrays_por_prefixo()
 
-            prefixos = sorted(self.dados_brutos.keys())
+            prefixos = self.analise.prefixos
 
             # Bloquear sinais para nao disparar reset durante preenchimento
             self.combo_var_x.blockSignals(True)
@@ -408,85 +891,149 @@ class InterfaceRegressaoLinear(QMainWindow):
             self._set_status(
                 f"Estatísticas calculadas. Variáveis: {', '.join(prefixos)}.", "ok"
             )
+            self._agendar_recalculo()       # modo ao vivo: primeiro par
 
         except Exception as e:
-            QMessageBox.critical(self, "Erro", f"Erro ao calcular estatísticas:\n{str(e)}")
-            self._set_status("Erro ao calcular estatísticas.", "erro")
+            self._ao_falhar("calcular estatísticas", e)
 
     def mostrar_estatisticas_detalhadas(self):
         """Mostra estatisticas detalhadas na tab Estatisticas"""
-        if not self.medias or not self.dados_brutos:
+        if not self.arrays or self.analise is None:
             return
 
-        texto = "=" * 60 + "\n"
-        texto += "ESTATÍSTICAS DETALHADAS\n"
-        texto += "=" * 60 + "\n\n"
-
-        for prefixo in sorted(self.dados_brutos.keys()):
-            texto += f"Variável: {prefixo}\n"
-            texto += "-" * 40 + "\n"
-            for chave in sorted(self.dados_brutos[prefixo].keys()):
-                valores = self.dados_brutos[prefixo][chave]
-                if valores:
-                    media = sum(valores) / len(valores)
-                    erro_total = self.err_total.get(chave, 0.0)
-                    texto += (
-                        f"  {chave}: média = {media:.6f}, "
-                        f"erro total = {erro_total:.6f}, "
-                        f"n = {len(valores)}\n"
-                    )
-            texto += "\n"
-
-        self.texto_estatisticas.setText(texto)
+        medicoes = self.analise.medicoes
+        contagens = medicoes.contagens
+        linhas = ["=" * 60, "ESTATÍSTICAS DETALHADAS", "=" * 60, ""]
+
+        # Medias e erros vem do cache por prefixo (nada e recalculado)
+        for prefixo in self.analise.prefixos:
+            faixa = medicoes.faixa_prefixo(prefixo)
+            medias, erros = self.arrays[prefixo]
+            linhas += [f"Variável: {prefixo}", "-" * 40]
+            linhas += [
+                f"  {chave}: média = {media:.6f}, erro total = {erro:.6f}, n = {n}"
+                for chave, media, erro, n in zip(
+                    medicoes.chaves[faixa], medias.tolist(), erros.tolist(),
+                    contagens[faixa].tolist(),
+                )
+            ]
+            linhas.append("")
+
+        self.texto_estatisticas.setText("\n".join(linhas) + "\n")
 
     def calcular_regressao(self):
         """Calcula a regressao linear"""
-        if not self.medias or not self.dados_brutos:
+        if not self.arrays or self.analise is None:
             QMessageBox.warning(self, "Aviso", "Calcule as estatísticas primeiro!")
             return
 
-        try:
-            prefixo_x = self.combo_var_x.currentText()
-            prefixo_y = self.combo_var_y.currentText()
+        prefixo_x = self.combo_var_x.currentText()
+        prefixo_y = self.combo_var_y.currentText()
 
-            self.data_x, self.data_y, self.data_x_err, self.data_y_err = \
-                self._extrair_dados_xy(prefixo_x, prefixo_y)
+        self._iniciar_tarefa(
+            self._regressao_par, prefixo_x, prefixo_y,
+            ao_concluir=lambda resultado: self._ao_calcular_regressao(
+                prefixo_x, prefixo_y, *resultado),
+            ao_falhar=lambda e: self._ao_falhar("calcular regressão", e),
+        )
+
+    def _regressao_par(self, prefixo_x: str, prefixo_y: str, progresso=None) -> tuple:
+        """Dados, ajuste e IndiceRegressao de um par (executado nas tarefas de regressao).
 
-            self.slope, self.intercept, self.r_squared = \
-                RegLin(self.data_x.tolist(), self.data_y.tolist())
-
-            resultado  = "=" * 50 + "\n"
-            resultado += "REGRESSÃO LINEAR\n"
-            resultado += "=" * 50 + "\n\n"
-            resultado += f"X: {prefixo_x}   |   Y: {prefixo_y}\n"
-            resultado += f"Iterações: {len(self.data_x)}\n\n"
-            resultado += f"y = {self.slope:.6f}·x + {self.intercept:.6f}\n\n"
-            resultado += f"  m (coef. angular): {self.slope:.6f}\n"
-            resultado += f"  b (coef. linear):  {self.intercept:.6f}\n"
-            resultado += f"  R²:                {self.r_squared:.6f}\n\n"
-
-            if self.r_squared > 0.95:
-                resultado += "✓ Excelente ajuste (R² > 0,95)\n"
-                nivel = "ok"
-            elif self.r_squared > 0.85:
-                resultado += "✓ Bom ajuste (R² > 0,85)\n"
-                nivel = "ok"
-            elif self.r_squared > 0.70:
-                resultado += "⚠ Ajuste moderado (R² > 0,70)\n"
-                nivel = "warn"
-            else:
-                resultado += "⚠ Ajuste fraco (R² < 0,70)\n"
-                nivel = "warn"
-
-            self.texto_resultados.setText(resultado)
+        Roda em uma thread do QThreadPool: so le `self.arrays` e devolve
+        objetos novos, sem escrever na memoizacao de `self.analise` (que a
+        thread principal consulta). O resultado e guardado por
+        _ao_calcular_regressao(), na thread principal.
+        """
+        notificar(progresso, 0.0, "Regressão")
+        dados = self._extrair_dados_xy(prefixo_x, prefixo_y)
+        x, y = dados[0], dados[1]
+        try:
+            ajuste = RegLin(x, y)
+        except Exception as e:
+            raise RegressaoException(f"Erro na regressao linear: {e}") from e
+        indice = IndiceRegressao(x, y)                          # para o ajuste por faixa
+        notificar(progresso, 1.0, "Regressão")
+        return dados, ajuste, indice
+
+    def _ao_calcular_regressao(self, prefixo_x: str, prefixo_y: str,
+                               dados: tuple, ajuste: tuple, indice: IndiceRegressao):
+        """Guarda e mostra o resultado da tarefa de regressao."""
+        try:
+            self.data_x, self.data_y, self.data_x_err, self.data_y_err = dados
+            self.slope, self.intercept, self.r_squared = ajuste
+            self.ajuste_completo = ajuste
+            self.indice_par = indice
+            self.faixa_ajuste = None
+            nivel = self._mostrar_resultado(prefixo_x, prefixo_y, len(self.data_x))
             self._set_status("Regressão calculada. Clique em 'Plotar Gráfico'.", nivel)
 
-        except ValueError as e:
-            QMessageBox.warning(self, "Aviso", str(e))
-            self._set_status(str(e), "erro")
         except Exception as e:
-            QMessageBox.critical(self, "Erro", f"Erro ao calcular regressão:\n{str(e)}")
-            self._set_status("Erro ao calcular regressão.", "erro")
+            self._ao_falhar("calcular regressão", e)
+
+    def _mostrar_resultado(self, prefixo_x: str, prefixo_y: str, n_pontos: int) -> str:
+        """Escreve o ajuste atual no painel de resultados; devolve o nivel do status."""
+        resultado  = "=" * 50 + "\n"
+        resultado += "REGRESSÃO LINEAR\n"
+        resultado += "=" * 50 + "\n\n"
+        resultado += f"X: {prefixo_x}   |   Y: {prefixo_y}\n"
+        resultado += f"Iterações: {n_pontos}\n"
+        if self.faixa_ajuste is not None:
+            x_min, x_max = self.faixa_ajuste
+            resultado += f"Faixa de x: [{x_min:.6g}, {x_max:.6g}]\n"
+        resultado += "\n"
+        resultado += f"y = {self.slope:.6f}·x + {self.intercept:.6f}\n\n"
+        resultado += f"  m (coef. angular): {self.slope:.6f}\n"
+        resultado += f"  b (coef. linear):  {self.intercept:.6f}\n"
+        resultado += f"  R²:                {self.r_squared:.6f}\n\n"
+
+        if self.r_squared > 0.95:
+            resultado += "✓ Excelente ajuste (R² > 0,95)\n"
+            nivel = "ok"
+        elif self.r_squared > 0.85:
+            resultado += "✓ Bom ajuste (R² > 0,85)\n"
+            nivel = "ok"
+        elif self.r_squared > 0.70:
+            resultado += "⚠ Ajuste moderado (R² > 0,70)\n"
+            nivel = "warn"
+        else:
+            resultado += "⚠ Ajuste fraco (R² < 0,70)\n"
+            nivel = "warn"
+
+        self.texto_resultados.setText(resultado)
+        return nivel
+
+    def _ajustar_faixa(self, x_min: float, x_max: float):
+        """Reajusta a reta aos pontos com x em [x_min, x_max] (selecao ou zoom).
+
+        Usa o IndiceRegressao do par (somas acumuladas, O(log n) por ajuste),
+        de modo que o reajuste acompanha o arraste na thread principal. Uma
+        faixa vazia (clique) ou que cobre todos os pontos volta ao ajuste
+        completo.
+        """
+        if self.slope is None or self.indice_par is None:
+            return
+        prefixo_x = self.combo_var_x.currentText()
+        prefixo_y = self.combo_var_y.currentText()
+        indice = self.indice_par
+        try:
+            inicio, fim = indice.faixa(x_min, x_max)
+            faixa = None if x_max <= x_min or fim - inicio == len(indice) else (x_min, x_max)
+            ajuste = indice.ajuste(*faixa) if faixa else self.ajuste_completo
+        except ScalcException as e:
+            self.canvas.atualizar_reta(None, (x_min, x_max))
+            self._set_status(f"Faixa sem ajuste: {e}", "warn")
+            return
+
+        self.slope, self.intercept, self.r_squared = ajuste
+        self.faixa_ajuste = faixa
+        nivel = self._mostrar_resultado(prefixo_x, prefixo_y,
+                                        fim - inicio if faixa else len(indice))
+        latencia = self.canvas.atualizar_reta(ajuste, faixa)
+        descricao = (f"x em [{x_min:.4g}, {x_max:.4g}]: {fim - inicio} pontos"
+                     if faixa else "todos os pontos")
+        self._set_status(f"Reta ajustada a {descricao} "
+                         f"({self.canvas.modo_redesenho}: {latencia:.1f} ms).", nivel)
 
     def plotar_grafico(self):
         """Plota pontos com barras de erro.
@@ -497,67 +1044,12 @@ class InterfaceRegressaoLinear(QMainWindow):
         O botao 'Plotar Grafico' cobre os dois casos, eliminando a necessidade
         de botoes separados 'Plotar Pontos' e 'Plotar Regressao'.
         """
-        if not self.medias or not self.dados_brutos:
+        if not self.arrays or self.analise is None:
             QMessageBox.warning(self, "Aviso", "Calcule as estatísticas primeiro!")
             return
 
         try:
-            prefixo_x = self.combo_var_x.currentText()
-            prefixo_y = self.combo_var_y.currentText()
-
-            # Usa dados ja extraidos (se regressao calculada) ou extrai agora
-            if self.data_x is not None:
-                data_x, data_y = self.data_x, self.data_y
-                data_x_err, data_y_err = self.data_x_err, self.data_y_err
-            else:
-                data_x, data_y, data_x_err, data_y_err = \
-                    self._extrair_dados_xy(prefixo_x, prefixo_y)
-
-            self.canvas.axes.clear()
-
-            tem_regressao = self.slope is not None
-            cor_ponto = 'red'   if tem_regressao else 'blue'
-            cor_erro  = 'darkred' if tem_regressao else 'darkblue'
-
-            self.canvas.axes.errorbar(
-                data_x, data_y,
-                xerr=data_x_err, yerr=data_y_err,
-                fmt='o', color=cor_ponto, ecolor=cor_erro,
-                capsize=5, markersize=8,
-                label='Dados experimentais', zorder=5
-            )
-
-            if tem_regressao:
-                x_fit = np.linspace(
-                    data_x.min() - 0.05 * abs(data_x.min()),
-                    data_x.max() + 0.05 * abs(data_x.max()),
-                    500
-                )
-                y_fit = self.slope * x_fit + self.intercept
-                self.canvas.axes.plot(
-                    x_fit, y_fit,
-                    color='blue', linewidth=2,
-                    label=(
-                        f'y = {self.slope:.3f}x + {self.intercept:.3f}'
-                        f'\nR² = {self.r_squared:.4f}'
-                    ),
-                    zorder=3
-                )
-                titulo_plot   = self.entrada_titulo.text()
-                status_msg    = "Gráfico com regressão plotado com sucesso."
-            else:
-                titulo_plot = f"Pontos: {prefixo_x} vs {prefixo_y}"
-                status_msg  = "Pontos plotados (regressão não calculada)."
-
-            self.canvas.axes.set_xlabel(self.entrada_x.text(), fontsize=12)
-            self.canvas.axes.set_ylabel(self.entrada_y.text(), fontsize=12)
-            self.canvas.axes.set_title(titulo_plot, fontsize=14, fontweight='bold')
-            self.canvas.axes.legend(loc='best', fontsize=10)
-            self.canvas.axes.grid(True, alpha=0.3, linestyle='--')
-            self.canvas.fig.tight_layout()
-            self.canvas.draw()
-
-            self._set_status(status_msg, "ok")
+            self._set_status(self._desenhar_grafico(), "ok")
             self.tabs.setCurrentIndex(0)
 
         except ValueError as e:
@@ -567,6 +1059,47 @@ class InterfaceRegressaoLinear(QMainWindow):
             QMessageBox.critical(self, "Erro", f"Erro ao plotar:\n{str(e)}")
             self._set_status("Erro ao plotar.", "erro")
 
+    def _desenhar_grafico(self) -> str:
+        """Atualiza o canvas com o par selecionado; devolve a mensagem de status.
+
+        Raises:
+            ValueError: dados invalidos ou insuficientes.
+        """
+        prefixo_x = self.combo_var_x.currentText()
+        prefixo_y = self.combo_var_y.currentText()
+
+        # Usa dados ja extraidos (se regressao calculada) ou extrai agora
+        if self.data_x is not None:
+            data_x, data_y = self.data_x, self.data_y
+            data_x_err, data_y_err = self.data_x_err, self.data_y_err
+        else:
+            data_x, data_y, data_x_err, data_y_err = \
+                self._extrair_dados_xy(prefixo_x, prefixo_y)
+
+        tem_regressao = self.slope is not None
+        if tem_regressao:
+            titulo_plot = self.entrada_titulo.text()
+            status_msg  = "Gráfico com regressão plotado com sucesso"
+        else:
+            titulo_plot = f"Pontos: {prefixo_x} vs {prefixo_y}"
+            status_msg  = "Pontos plotados (regressão não calculada)"
+
+        # Artistas persistentes do canvas: apenas os dados mudam, e o
+        # redesenho usa blitting quando eixos e textos se mantem
+        latencia = self.canvas.mostrar(
+            data_x, data_y, data_x_err, data_y_err,
+            titulo=titulo_plot,
+            rotulo_x=self.entrada_x.text(),
+            rotulo_y=self.entrada_y.text(),
+            reta=(self.slope, self.intercept, self.r_squared) if tem_regressao else None,
+            cor_ponto='red' if tem_regressao else 'blue',
+            cor_erro='darkred' if tem_regressao else 'darkblue',
+            faixa=self.faixa_ajuste,
+        )
+        status_msg += f" ({self.canvas.modo_redesenho}: {latencia:.1f} ms)."
+
+        return status_msg
+
     def limpar_tudo(self):
         """Limpa todos os dados e reinicia a interface"""
         resposta = QMessageBox.question(
@@ -577,12 +1110,10 @@ class InterfaceRegressaoLinear(QMainWindow):
             return
 
         # Resetar estado
+        self._descartar_recalculos()
         self.dados_excel     = None
-        self.dados_brutos    = {}
-        self.medias          = {}
-        self.err_est         = {}
-        self.err_total       = {}
-        self.err_instr       = {}
+        self.analise         = None
+        self.arrays          = {}
         self.data_x          = None
         self.data_y          = None
         self.data_x_err      = None
@@ -590,6 +1121,9 @@ class InterfaceRegressaoLinear(QMainWindow):
         self.slope           = None
         self.intercept       = None
         self.r_squared       = None
+        self.faixa_ajuste    = None
+        self.ajuste_completo = None
+        self.indice_par      = None
         self.caminho_arquivo = None
 
         # Limpar widgets
@@ -597,18 +1131,9 @@ class InterfaceRegressaoLinear(QMainWindow):
         self.texto_resultados.clear()
         self.texto_estatisticas.clear()
 
-        self.combo_var_x.blockSignals(True)
-        self.combo_var_y.blockSignals(True)
-        self.combo_var_x.clear()
-        self.combo_var_y.clear()
-        self.combo_var_x.setEnabled(False)
-        self.combo_var_y.setEnabled(False)
-        self.combo_var_x.blockSignals(False)
-        self.combo_var_y.blockSignals(False)
+        self._limpar_seletores()
 
-        self.tabela_dados.clear()
-        self.tabela_dados.setRowCount(0)
-        self.tabela_dados.setColumnCount(0)
+        self.modelo_dados.definir_dados(None)
 
         self.btn_calcular.setEnabled(False)
         self.btn_regressao.setEnabled(False)
@@ -627,11 +1152,11 @@ class InterfaceRegressaoLinear(QMainWindow):
 #  Ponto de entrada                                                   #
 # ------------------------------------------------------------------ #
 
-def iniciar_interface():
+def iniciar_interface(usar_cache: bool | None = None):
     """Funcao para iniciar a aplicacao"""
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
-    janela = InterfaceRegressaoLinear()
+    janela = InterfaceRegressaoLinear(usar_cache=usar_cache)
     janela.show()
     sys.exit(app.exec())
 
@@ -2,12 +2,149 @@
 Modulo de Plotagem de Graficos
 
 Contem funcoes para visualizacao de dados e regressao linear.
+
+PlotarGrafico abre uma janela (pyplot); exportar_grafico e
+exportar_graficos renderizam fora da tela pelo backend Agg, sem importar
+pyplot, e servem para servidores sem display e para o modo lote.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import matplotlib.style
 import numpy as np
-import matplotlib.pyplot as plt
-from typing import List, Tuple, Set
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.ticker import MaxNLocator
+
 from src.data.config import Config
+from src.visualization.decimacao import BarrasErroLOD
+
+
+def limites_eixo(minimo: float, maximo: float,
+                 margem: float = Config.Plot.MARGEM_EIXOS) -> Tuple[float, float]:
+    """
+    Limites de um eixo com margem proporcional a faixa dos dados.
+
+    A margem depende da largura da faixa, nao da magnitude dos valores:
+    dados em torno de 1e9 com faixa 1e-3 continuam visiveis, e valores
+    negativos nao invertem o eixo. Uma faixa nula (um unico valor) recebe
+    margem relativa ao proprio valor (ou 1, em zero).
+
+    Args:
+        minimo, maximo: Extremos dos dados (finitos).
+        margem: Fracao da faixa acrescentada de cada lado.
+
+    Returns:
+        Tuple[float, float]: (inferior, superior), com inferior < superior.
+    """
+    faixa = maximo - minimo
+    if not faixa > 0:
+        faixa = abs(maximo) or 1.0
+    return minimo - margem * faixa, maximo + margem * faixa
+
+
+def _localizador() -> MaxNLocator:
+    """Ticks 'redondos' (1, 2, 2.5, 5 x 10^k), no maximo Config.Plot.MAX_TICKS."""
+    return MaxNLocator(nbins=Config.Plot.MAX_TICKS, steps=[1, 2, 2.5, 5, 10])
+
+
+class ModeloFigura:
+    """
+    Figura de regressao reutilizavel: eixos, barras de erro, reta e legenda.
+
+    Os artistas sao criados uma unica vez; atualizar() apenas troca os
+    dados das barras de erro e da reta, os limites e os textos. Exportar
+    milhares de graficos nao repete a criacao da figura, dos eixos e da
+    legenda, e a memoria fica constante (uma figura por modelo). As barras
+    de erro passam por BarrasErroLOD: series enormes sao decimadas por
+    pixel, e o zoom interativo (PlotarGrafico) refaz a decimacao.
+
+    Args:
+        figura (Figure): Figura ja estilizada, sem eixos (de pyplot ou
+            criada diretamente, como em ModeloFigura.nova()).
+
+    Examples:
+        >>> modelo = ModeloFigura.nova()
+        >>> modelo.atualizar(x, y, ex, ey, 2.0, 1.0, 'x', 'y', 'Titulo')
+        >>> modelo.figura.savefig('grafico.png')
+    """
+
+    def __init__(self, figura: Figure):
+        self.figura = figura
+        self.ax = figura.add_subplot(111)
+        self.lod = BarrasErroLOD(
+            self.ax,
+            fmt='o',
+            color=Config.Plot.COLOR_PONTOS,
+            ecolor=Config.Plot.COLOR_ERRO,
+            capsize=Config.Plot.CAPSIZE_ERRO
+        )
+        self.barras = self.lod.barras
+        self.reta, = self.ax.plot([], [], color='blue', label='Melhor Reta')
+        self.ax.legend()
+        # Numero de ticks limitado, qualquer que seja a escala dos dados
+        self.ax.xaxis.set_major_locator(_localizador())
+        self.ax.yaxis.set_major_locator(_localizador())
+
+    @classmethod
+    def nova(cls, largura: float = Config.Plot.FIGURE_WIDTH,
+             altura: float = Config.Plot.FIGURE_HEIGHT,
+             dpi: float = Config.Plot.FIGURE_DPI) -> 'ModeloFigura':
+        """Cria o modelo em uma Figure com canvas Agg (sem pyplot)."""
+        with matplotlib.style.context(Config.Plot.STYLE):
+            figura = Figure(figsize=(largura, altura), dpi=dpi)
+            FigureCanvasAgg(figura)
+            return cls(figura)
+
+    def atualizar(self, x, y, erros_x, erros_y, slope: float, intercept: float,
+                  str_x: str, str_y: str, titulo: str) -> None:
+        """Troca pontos, barras de erro, reta, limites e textos."""
+        self.lod.definir_dados(x, y, erros_x, erros_y, desenhar=False)
+        (x_min, x_max), (y_min, y_max) = self.lod.envelope()
+
+        # Melhor reta: dois pontos bastam, de borda a borda do eixo X
+        xlim = limites_eixo(x_min, x_max)
+        x_fit = np.array(xlim)
+        y_fit = slope * x_fit + intercept
+        self.reta.set_data(x_fit, y_fit)
+        ylim = limites_eixo(np.nanmin(np.append(y_fit, y_min)),
+                            np.nanmax(np.append(y_fit, y_max)))
+
+        # Configuracoes do grafico (ticks: MaxNLocator definido no __init__)
+        self.ax.set_title(titulo)
+        self.ax.set_xlabel(str_x)
+        self.ax.set_ylabel(str_y)
+        self.ax.set_xlim(xlim, emit=False)     # decima uma vez so, abaixo
+        self.ax.set_ylim(ylim)
+        self.lod.atualizar()
+
+
+# (largura, altura, dpi) -> ModeloFigura; um cache por processo
+_MODELOS: Dict[Tuple[float, float, float], ModeloFigura] = {}
+
+
+def obter_modelo(largura: float = Config.Plot.FIGURE_WIDTH,
+                 altura: float = Config.Plot.FIGURE_HEIGHT,
+                 dpi: float = Config.Plot.FIGURE_DPI) -> ModeloFigura:
+    """
+    ModeloFigura reutilizado para um tamanho e DPI (criado no primeiro uso).
+
+    O cache nao e seguro entre threads: cada processo do lote tem o seu, e
+    a exportacao em paralelo usa processos (exportar_graficos).
+    """
+    chave = (largura, altura, dpi)
+    if chave not in _MODELOS:
+        _MODELOS[chave] = ModeloFigura.nova(largura, altura, dpi)
+    return _MODELOS[chave]
+
+
+def limpar_modelos() -> None:
+    """Descarta as figuras em cache (liberadas pelo coletor, sem pyplot)."""
+    for modelo in _MODELOS.values():
+        modelo.figura.clear()
+    _MODELOS.clear()
 
 
 def PlotarGrafico(
@@ -36,42 +173,181 @@ def PlotarGrafico(
     Returns:
         None (exibe o grafico)
     """
-    plt.style.use(Config.Plot.STYLE)
+    # pyplot so e importado aqui: exportar_grafico() nao depende de display
+    import matplotlib.pyplot as plt
 
     x, y = zip(*pontos)
 
-    # Criar o grafico e plotar barras de erro
-    fig, ax = plt.subplots(
-        figsize=(Config.Plot.FIGURE_WIDTH, Config.Plot.FIGURE_HEIGHT),
-        dpi=Config.Plot.FIGURE_DPI
-    )
-    ax.errorbar(
-        x, y, 
-        xerr=erros_x, 
-        yerr=erros_y, 
-        fmt='o',
-        color=Config.Plot.COLOR_PONTOS,
-        ecolor=Config.Plot.COLOR_ERRO,
-        capsize=Config.Plot.CAPSIZE_ERRO
-    )
+    # Estilo so durante este grafico (plt.style.use alteraria o rcParams
+    # global). show() fica dentro do contexto: os artistas que
+    # ModeloFigura/BarrasErroLOD recriam no zoom e os ticks desenhados na
+    # janela seguem o mesmo estilo da figura exportada (exportar_grafico)
+    with matplotlib.style.context(Config.Plot.STYLE):
+        fig = plt.figure(
+            figsize=(Config.Plot.FIGURE_WIDTH, Config.Plot.FIGURE_HEIGHT),
+            dpi=Config.Plot.FIGURE_DPI
+        )
+        # Referencia mantida ate o fim de show(): o zoom refaz a decimacao
+        modelo = ModeloFigura(fig)
+        modelo.atualizar(x, y, erros_x, erros_y, slope, intercept, str_x, str_y, titulo)
+        try:
+            plt.show()
+        finally:
+            plt.close(fig)
 
-    # Plotar a melhor reta
-    x_fit = np.linspace(min(x) - 0.05 * min(x), max(x) + 0.05 * max(x), 500)
-    y_fit = slope * x_fit + intercept
-    arx_fit = [round(num) for num in x_fit]
-    ary_fit = [round(num) for num in y_fit]
-    ax.plot(x_fit, y_fit, color='blue', label='Melhor Reta')
-    ax.legend()
-
-    # Configuracoes do grafico
-    ax.set_title(titulo)
-    ax.set_xlabel(str_x)
-    ax.set_ylabel(str_y)
-    ax.set(
-        xlim=(min(arx_fit) - 0.05 * min(arx_fit), max(arx_fit) + 0.05 * max(arx_fit)),
-        xticks=np.arange(min(arx_fit), max(arx_fit) + 1),
-        ylim=(min(ary_fit) - 0.05 * max(ary_fit), max(ary_fit) + 0.05 * max(ary_fit)),
-        yticks=np.arange(min(ary_fit), max(ary_fit) + 1),
+
+def validar_formatos(formatos: Sequence[str]) -> List[str]:
+    """
+    Normaliza e valida formatos de exportacao.
+
+    Args:
+        formatos: Extensoes, com ou sem ponto ('png', '.SVG').
+
+    Returns:
+        List[str]: Formatos em minusculas, sem repeticao, na ordem dada.
+
+    Raises:
+        ValueError: formato fora de Config.Plot.FORMATOS_EXPORTACAO.
+    """
+    normalizados = []
+    for formato in formatos:
+        formato = formato.strip().lstrip('.').lower()
+        if formato not in Config.Plot.FORMATOS_EXPORTACAO:
+            raise ValueError(
+                f"Formato de exportacao nao suportado: '{formato}' "
+                f"(suportados: {', '.join(Config.Plot.FORMATOS_EXPORTACAO)})"
+            )
+        if formato not in normalizados:
+            normalizados.append(formato)
+    if not normalizados:
+        raise ValueError("Nenhum formato de exportacao informado")
+    return normalizados
+
+
+def exportar_grafico(
+    x: Sequence[float],
+    y: Sequence[float],
+    erros_x: Sequence[float],
+    erros_y: Sequence[float],
+    slope: float,
+    intercept: float,
+    destino: str,
+    formatos: Sequence[str] = ('png',),
+    str_x: str = Config.Plot.DEFAULT_X_LABEL,
+    str_y: str = Config.Plot.DEFAULT_Y_LABEL,
+    titulo: str = Config.Plot.DEFAULT_TITULO,
+) -> List[str]:
+    """
+    Renderiza o grafico de PlotarGrafico fora da tela (Agg) e salva em disco.
+
+    Usa o ModeloFigura em cache do processo (obter_modelo): a figura e
+    criada uma unica vez, sem pyplot (sem backend interativo nem janela), e
+    cada chamada apenas troca os dados dos artistas antes de salvar.
+
+    Args:
+        x, y: Pontos (na mesma ordem dos erros).
+        erros_x, erros_y: Barras de erro de cada ponto.
+        slope, intercept: Reta de regressao.
+        destino: Caminho sem extensao; cada formato gera '<destino>.<formato>'
+            (a pasta e criada se necessario).
+        formatos: Extensoes de Config.Plot.FORMATOS_EXPORTACAO.
+        str_x, str_y, titulo: Rotulos do grafico.
+
+    Returns:
+        List[str]: Arquivos gravados, na ordem dos formatos.
+
+    Raises:
+        ValueError: formato nao suportado.
+    """
+    formatos = validar_formatos(formatos)
+    pasta = os.path.dirname(destino)
+    if pasta:
+        os.makedirs(pasta, exist_ok=True)
+
+    # A atualizacao pode recriar artistas (decimacao) e os rotulos dos
+    # ticks sao criados no desenho: o estilo vale nas duas etapas
+    arquivos = []
+    with matplotlib.style.context(Config.Plot.STYLE):
+        modelo = obter_modelo()
+        modelo.atualizar(x, y, erros_x, erros_y, slope, intercept, str_x, str_y, titulo)
+        for formato in formatos:
+            arquivo = f"{destino}.{formato}"
+            modelo.figura.savefig(arquivo, format=formato)
+            arquivos.append(arquivo)
+    return arquivos
+
+
+def exportar_par(
+    analise,
+    prefixo_x: str,
+    prefixo_y: str,
+    nome: str,
+    pasta: str = Config.Plot.PASTA_EXPORTACAO,
+    formatos: Sequence[str] = ('png',),
+    str_x: str = Config.Plot.DEFAULT_X_LABEL,
+    str_y: str = Config.Plot.DEFAULT_Y_LABEL,
+    titulo: str = Config.Plot.DEFAULT_TITULO,
+    ponderada: bool = False,
+) -> List[str]:
+    """
+    Exporta o grafico de um par (X, Y) de uma Analise.
+
+    Usado pelo modo CLI e, via functools.partial, como gancho `exportar` de
+    lote.processar_arquivo(), para que cada worker do lote renderize as
+    figuras dos arquivos que processa.
+
+    Args:
+        analise: src.core.Analise com o arquivo carregado.
+        prefixo_x, prefixo_y: Par regredido.
+        nome: Nome base dos arquivos (sem extensao).
+        pasta: Pasta de saida.
+        ponderada: Se True, desenha a reta de analise.regressao_ponderada.
+        Demais argumentos: ver exportar_grafico().
+
+    Returns:
+        List[str]: Arquivos gravados.
+    """
+    x, y, x_err, y_err = analise.dados_xy(prefixo_x, prefixo_y)
+    if ponderada:
+        slope, intercept = analise.regressao_ponderada(prefixo_x, prefixo_y)[:2]
+    else:
+        slope, intercept, _ = analise.regressao(prefixo_x, prefixo_y)
+    return exportar_grafico(
+        x, y, x_err, y_err, slope, intercept,
+        destino=os.path.join(pasta, nome), formatos=formatos,
+        str_x=str_x, str_y=str_y, titulo=titulo,
     )
 
-    plt.show()
+
+def _exportar_tarefa(tarefa: Dict[str, Any]) -> List[str]:
+    return exportar_grafico(**tarefa)
+
+
+def exportar_graficos(
+    tarefas: Sequence[Dict[str, Any]],
+    workers: Optional[int] = None,
+) -> List[List[str]]:
+    """
+    Exporta varios graficos em paralelo, em um pool de processos.
+
+    A renderizacao do matplotlib e sequencial dentro de um processo (e
+    segura o GIL), entao o paralelismo vem de processos separados.
+
+    Args:
+        tarefas: Argumentos nomeados de exportar_grafico(), um dict por
+            grafico.
+        workers: Numero de processos (padrao: Config.Lote.WORKERS ou
+            os.cpu_count()). Com 1 worker, roda no proprio processo.
+
+    Returns:
+        List[List[str]]: Arquivos gravados por tarefa, na ordem de entrada.
+    """
+    tarefas = list(tarefas)
+    if workers is None:
+        workers = Config.Lote.WORKERS or os.cpu_count() or 1
+    workers = max(1, min(workers, len(tarefas) or 1))
+
+    if workers == 1:
+        return [exportar_grafico(**tarefa) for tarefa in tarefas]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_exportar_tarefa, tarefas))
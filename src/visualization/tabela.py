@@ -0,0 +1,70 @@
+"""
+Modulo de Tabela (aba Dados da GUI)
+
+ModeloTabela expoe um DataFrame a um QTableView sem copiar celulas para
+widgets: o Qt pede apenas as celulas visiveis (data()) e cada uma e
+formatada sob demanda. Carregar uma planilha custa o mesmo que extrair
+suas colunas como arrays, independentemente do numero de celulas.
+"""
+
+from typing import Any, List, Optional
+
+import pandas as pd
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class ModeloTabela(QAbstractTableModel):
+    """
+    Modelo somente leitura sobre as colunas de um DataFrame.
+
+    As colunas sao guardadas como arrays (df[c].to_numpy()), de modo que
+    data() faz um acesso por indice em vez de df.iloc[i, j]. Celulas
+    ausentes (NaN/None) ficam vazias, como na tabela anterior.
+
+    Args:
+        df (pd.DataFrame, optional): Dados iniciais.
+
+    Examples:
+        >>> modelo = ModeloTabela()
+        >>> visao.setModel(modelo)
+        >>> modelo.definir_dados(analise.tabela)    # O(colunas), nao O(celulas)
+    """
+
+    def __init__(self, df: Optional[pd.DataFrame] = None, parent=None):
+        super().__init__(parent)
+        self._colunas: List[Any] = []
+        self._nomes: List[str] = []
+        self._linhas = 0
+        if df is not None:
+            self.definir_dados(df)
+
+    def definir_dados(self, df: Optional[pd.DataFrame]) -> None:
+        """Troca os dados exibidos (None esvazia a tabela)."""
+        self.beginResetModel()
+        if df is None:
+            self._colunas, self._nomes, self._linhas = [], [], 0
+        else:
+            self._colunas = [df.iloc[:, j].to_numpy() for j in range(df.shape[1])]
+            self._nomes = [str(c) for c in df.columns]
+            self._linhas = len(df)
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._linhas
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._colunas)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        valor = self._colunas[index.column()][index.row()]
+        return str(valor) if pd.notna(valor) else None
+
+    def headerData(self, secao: int, orientacao: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientacao == Qt.Orientation.Horizontal:
+            return self._nomes[secao]
+        return str(secao + 1)
@@ -0,0 +1,95 @@
+"""
+Modulo de Tarefas (execucao em segundo plano da GUI)
+
+Tarefa executa uma funcao em uma thread do QThreadPool e devolve o
+resultado a interface por sinais Qt, entregues na thread principal (fila
+de eventos). A funcao recebe um callback `progresso(fracao, etapa)` (ver
+src.utils.progresso) que emite o sinal de progresso e implementa o
+cancelamento cooperativo: depois de cancelar(), a proxima notificacao
+levanta OperacaoCancelada dentro da funcao.
+
+Examples:
+    >>> tarefa = Tarefa(carregar_tabela, caminho)      # progresso=... injetado
+    >>> tarefa.sinais.concluida.connect(self._ao_carregar)
+    >>> tarefa.sinais.progresso.connect(self._ao_progredir)
+    >>> QThreadPool.globalInstance().start(tarefa)
+    >>> tarefa.cancelar()                              # botao "Cancelar"
+"""
+
+import logging
+import threading
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from src.core.exceptions import OperacaoCancelada
+
+logger = logging.getLogger(__name__)
+
+
+class SinaisTarefa(QObject):
+    """
+    Sinais de uma Tarefa (QRunnable nao e QObject e nao emite sinais).
+
+    Signals:
+        progresso(float, str): fracao concluida (0 a 1) e etapa.
+        concluida(object): valor de retorno da funcao.
+        falhou(object): excecao levantada pela funcao.
+        cancelada(): a funcao foi interrompida por cancelar().
+    """
+
+    progresso = Signal(float, str)
+    concluida = Signal(object)
+    falhou = Signal(object)
+    cancelada = Signal()
+
+
+class Tarefa(QRunnable):
+    """
+    Executa `funcao(*args, progresso=..., **kwargs)` em segundo plano.
+
+    Exatamente um de concluida, falhou ou cancelada e emitido ao final.
+    Mantenha uma referencia a tarefa enquanto ela roda (autoDelete e
+    desligado): os sinais pertencem a ela.
+
+    Args:
+        funcao (Callable): Funcao a executar; deve aceitar o argumento
+            nomeado `progresso`.
+        *args, **kwargs: Demais argumentos da funcao.
+    """
+
+    def __init__(self, funcao: Callable[..., Any], *args, **kwargs):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.funcao = funcao
+        self.args = args
+        self.kwargs = kwargs
+        self.sinais = SinaisTarefa()
+        self._cancelar = threading.Event()
+
+    def cancelar(self) -> None:
+        """Pede o cancelamento; efetivo na proxima notificacao de progresso."""
+        self._cancelar.set()
+
+    @property
+    def cancelamento_pedido(self) -> bool:
+        return self._cancelar.is_set()
+
+    def _progresso(self, fracao: float, etapa: str) -> None:
+        if self._cancelar.is_set():
+            raise OperacaoCancelada(f"Operacao cancelada ({etapa})")
+        self.sinais.progresso.emit(fracao, etapa)
+
+    def run(self) -> None:
+        try:
+            resultado = self.funcao(*self.args, progresso=self._progresso, **self.kwargs)
+        except OperacaoCancelada:
+            logger.info(f"{getattr(self.funcao, '__name__', 'Tarefa')}: cancelada")
+            self.sinais.cancelada.emit()
+        except Exception as e:
+            self.sinais.falhou.emit(e)
+        else:
+            if self._cancelar.is_set():
+                self.sinais.cancelada.emit()    # terminou apos o pedido: descarta
+            else:
+                self.sinais.concluida.emit(resultado)
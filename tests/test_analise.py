@@ -0,0 +1,179 @@
+"""
+Testes para o pipeline memoizado Analise (analise.py).
+
+Analise(tabela)
+    medicoes        : particionamento (calculado uma unica vez)
+    estatisticas    : DataFrame Dados/Media/S_err/T_err
+    arrays_prefixo  : (medias, erros_totais) por prefixo
+    regressao       : (slope, intercept, r_squared) por par (X, Y)
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from src.core import Analise, calcular_estatisticas
+from src.core import analise as modulo_analise
+from src.core.exceptions import DadosInvalidosException, OperacaoCancelada
+
+
+def _df_padrao():
+    """Grupos a (X) e b = 2a (Y), tres repeticoes; grupo c com 2 pontos."""
+    return pd.DataFrame({
+        'Dados': ['a_1', 'a_2', 'a_3', 'b_1', 'b_2', 'b_3', 'c_1', 'c_2'],
+        'I_err': [0.10,  0.10,  0.10,  0.20,  0.20,  0.20,  0.05,  0.05],
+        '1':     [1.0,   2.0,   3.0,   2.0,   4.0,   6.0,   1.0,   2.0],
+        '2':     [1.1,   2.1,   3.1,   2.2,   4.2,   6.2,   1.0,   2.0],
+        '3':     [0.9,   1.9,   2.9,   1.8,   3.8,   5.8,   1.0,   2.0],
+    })
+
+
+class TestAnalise(unittest.TestCase):
+    """Testes para a classe Analise."""
+
+    def test_particiona_uma_unica_vez(self):
+        with mock.patch.object(
+            modulo_analise, 'particionar_medicoes',
+            wraps=modulo_analise.particionar_medicoes,
+        ) as particionar:
+            analise = Analise(_df_padrao())
+            analise.estatisticas
+            analise.arrays_prefixo('a')
+            analise.regressao('a', 'b')
+            analise.regressao('b', 'a')
+            self.assertEqual(particionar.call_count, 1)
+
+    def test_preparar_com_progresso(self):
+        analise = Analise(_df_padrao())
+        etapas = []
+        obtido = analise.preparar(progresso=lambda fracao, etapa: etapas.append((fracao, etapa)))
+        pd.testing.assert_frame_equal(obtido, calcular_estatisticas(_df_padrao()))
+        self.assertIs(obtido, analise.estatisticas)
+        fracoes = [fracao for fracao, _ in etapas]
+        self.assertEqual(fracoes, sorted(fracoes))
+        self.assertEqual(etapas[-1], (1.0, 'Calculando estatisticas'))
+        self.assertIn('Particionando', {etapa for _, etapa in etapas})
+
+    def test_preparar_cancelado_nao_memoiza(self):
+        analise = Analise(_df_padrao())
+
+        def cancelar(fracao, etapa):
+            if fracao > 0.3:
+                raise OperacaoCancelada(etapa)
+
+        with self.assertRaises(OperacaoCancelada):
+            analise.preparar(progresso=cancelar)
+        self.assertIsNone(analise._medicoes)
+        self.assertEqual(analise.prefixos, ['a', 'b', 'c'])
+
+    def test_preparar_cancelado_nas_estatisticas_nao_memoiza(self):
+        analise = Analise(_df_padrao())
+
+        def cancelar(fracao, etapa):
+            if fracao >= 0.9:
+                raise OperacaoCancelada(etapa)
+
+        with self.assertRaises(OperacaoCancelada):
+            analise.preparar(progresso=cancelar)
+        self.assertIsNone(analise._medicoes)
+        self.assertIsNone(analise._estatisticas)
+        self.assertEqual(analise._arrays, {})
+
+    def test_calcular_etapas_nao_memoiza(self):
+        analise = Analise(_df_padrao())
+        medicoes, estatisticas, arrays = analise.calcular_etapas()
+        self.assertIsNone(analise._medicoes)
+        self.assertEqual(analise._arrays, {})
+        analise.guardar_etapas(medicoes, estatisticas, arrays)
+        self.assertIs(analise.medicoes, medicoes)
+        self.assertIs(analise.estatisticas, estatisticas)
+        self.assertIs(analise.arrays_prefixo('a')[0], arrays['a'][0])
+
+    def test_estatisticas_iguais_a_calcular_estatisticas(self):
+        esperado = calcular_estatisticas(_df_padrao())
+        obtido = Analise(_df_padrao()).estatisticas
+        pd.testing.assert_frame_equal(esperado, obtido)
+
+    def test_prefixos_ordenados(self):
+        self.assertEqual(Analise(_df_padrao()).prefixos, ['a', 'b', 'c'])
+
+    def test_arrays_prefixo_memoizados(self):
+        analise = Analise(_df_padrao())
+        medias, erros = analise.arrays_prefixo('b')
+        self.assertEqual(len(medias), 3)
+        self.assertAlmostEqual(medias[1], 4.0, places=12)
+        self.assertIs(analise.arrays_prefixo('b')[0], medias)
+
+    def test_arrays_por_prefixo(self):
+        analise = Analise(_df_padrao())
+        analise.preparar()
+        arrays = analise.arrays_por_prefixo()
+        self.assertEqual(sorted(arrays), analise.prefixos)
+        for prefixo, (medias, erros) in arrays.items():
+            self.assertIs(analise.arrays_prefixo(prefixo)[0], medias)
+            self.assertFalse(medias.flags.writeable)
+            self.assertFalse(erros.flags.writeable)
+        np.testing.assert_allclose(
+            np.concatenate([arrays[p][0] for p in analise.medicoes.prefixos]),
+            analise.estatisticas['Media'],
+        )
+
+    def test_indice_regressao(self):
+        analise = Analise(_df_padrao())
+        indice = analise.indice_regressao('a', 'b')
+        self.assertIs(analise.indice_regressao('a', 'b'), indice)
+        np.testing.assert_allclose(indice.ajuste(), analise.regressao('a', 'b'))
+        with self.assertRaises(DadosInvalidosException):
+            analise.indice_regressao('a', 'c')
+
+    def test_janelas_e_segmentos(self):
+        analise = Analise(_df_padrao())
+        janelas = analise.janelas('a', 'b', 2)
+        np.testing.assert_allclose(janelas['slope'], [2.0, 2.0])
+        segmentos = analise.segmentos('a', 'b', min_pontos=2)
+        self.assertEqual(len(segmentos), 1)
+        self.assertAlmostEqual(segmentos['slope'][0], 2.0)
+
+    def test_regressao_ponderada(self):
+        analise = Analise(_df_padrao())
+        ponderada = analise.regressao_ponderada('a', 'b')
+        self.assertIs(analise.regressao_ponderada('a', 'b'), ponderada)
+        self.assertEqual(len(ponderada), 6)
+        self.assertAlmostEqual(ponderada[0], 2.0, places=6)     # b = 2a: York exato
+        with mock.patch('src.core.analise.RegLinPonderada', return_value=(0.0,) * 6) as ajuste:
+            Analise(_df_padrao()).regressao_ponderada('a', 'b')
+        x, y, x_err, y_err = analise.dados_xy('a', 'b')
+        np.testing.assert_array_equal(ajuste.call_args.args[2], y_err)
+        np.testing.assert_array_equal(ajuste.call_args.args[3], x_err)
+
+    def test_regressao(self):
+        slope, intercept, r_squared = Analise(_df_padrao()).regressao('a', 'b')
+        self.assertAlmostEqual(slope, 2.0, places=10)
+        self.assertAlmostEqual(intercept, 0.0, places=10)
+        self.assertAlmostEqual(r_squared, 1.0, places=10)
+
+    def test_grupos_de_tamanhos_diferentes(self):
+        with self.assertRaises(DadosInvalidosException):
+            Analise(_df_padrao()).regressao('a', 'c')
+
+    def test_prefixo_inexistente(self):
+        with self.assertRaises(DadosInvalidosException):
+            Analise(_df_padrao()).dados_xy('a', 'z')
+
+    def test_todos_pares(self):
+        analise = Analise(_df_padrao())
+        tabela = analise.todos_pares
+        # 'c' tem outro numero de pontos: apenas (a, b) e (b, a)
+        self.assertEqual(list(zip(tabela['X'], tabela['Y'])), [('a', 'b'), ('b', 'a')])
+        self.assertAlmostEqual(tabela['slope'][0], 2.0, places=10)
+        self.assertIs(analise.todos_pares, tabela)
+
+    def test_dataframe_vazio(self):
+        with self.assertRaises(DadosInvalidosException):
+            Analise(pd.DataFrame())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
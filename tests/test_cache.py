@@ -0,0 +1,180 @@
+"""
+Testes para o cache em disco de tabelas lidas (src/data/cache.py).
+
+CacheTabelas(diretorio, max_tamanho_mb)
+    ler(caminho)  -> pd.DataFrame   (le pelo cache; em falta, usa o leitor)
+    chave(caminho) -> str           (hash do conteudo + formato + versao)
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from src.data import cache as modulo_cache
+from src.data import leitores
+from src.data.cache import CacheTabelas
+from src.data.config import Config
+from src.data.entrada import carregar_tabela
+
+
+def _tabela_padrao():
+    return pd.DataFrame({
+        'Dados': ['a_1', 'a_2', None, 'b_1'],
+        'I_err': [0.1, 0.1, 0.1, 0.2],
+        '1':     [1.0, 2.0, np.nan, 2.0],
+        '2':     [1, 2, 3, 4],
+        'misto': [1.5, 'x', True, np.nan],
+    })
+
+
+class TestCacheTabelas(unittest.TestCase):
+    """Testes para a classe CacheTabelas."""
+
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+        self.cache = CacheTabelas(os.path.join(self.pasta, 'cache'))
+        self.caminho = self._salvar('dados.csv', _tabela_padrao())
+
+    def tearDown(self):
+        shutil.rmtree(self.pasta, ignore_errors=True)
+
+    def _salvar(self, nome, tabela):
+        caminho = os.path.join(self.pasta, nome)
+        tabela.to_csv(caminho, index=False)
+        return caminho
+
+    def test_ida_e_volta_preserva_tabela(self):
+        esperado = leitores.ler_tabela(self.caminho)
+        self.cache.ler(self.caminho)
+        obtido = self.cache.ler(self.caminho)
+        pd.testing.assert_frame_equal(obtido, esperado)
+
+    def test_colunas_mistas_preservam_tipos(self):
+        tabela = _tabela_padrao()
+        chave = 'misto'
+        self.assertTrue(self.cache.guardar(chave, tabela))
+        obtido = self.cache.obter(chave)
+        pd.testing.assert_frame_equal(obtido, tabela)
+        self.assertEqual([type(v) for v in obtido['misto'][:3]], [float, str, bool])
+
+    def test_acerto_nao_rele_o_arquivo(self):
+        with mock.patch.object(leitores, 'ler_tabela', wraps=leitores.ler_tabela) as ler:
+            self.cache.ler(self.caminho)
+            self.cache.ler(self.caminho)
+        self.assertEqual(ler.call_count, 1)
+
+    def test_chave_pelo_conteudo(self):
+        copia = os.path.join(self.pasta, 'copia.csv')
+        shutil.copy(self.caminho, copia)
+        self.assertEqual(self.cache.chave(copia), self.cache.chave(self.caminho))
+
+        alterado = _tabela_padrao()
+        alterado.loc[0, '1'] = 9.0
+        outro = self._salvar('outro.csv', alterado)
+        self.assertNotEqual(self.cache.chave(outro), self.cache.chave(self.caminho))
+
+    def test_versao_dos_leitores_invalida(self):
+        chave = self.cache.chave(self.caminho)
+        with mock.patch.object(leitores, 'VERSAO', leitores.VERSAO + 1):
+            self.assertNotEqual(self.cache.chave(self.caminho), chave)
+
+    def test_remove_menos_usados(self):
+        for i in range(3):
+            self.cache.guardar(f'e{i}', _tabela_padrao())
+            caminho = self.cache._caminho(f'e{i}')
+            os.utime(caminho, (time.time() - 100 + i, time.time() - 100 + i))
+        self.cache.obter('e0')      # e0 passa a ser a mais recente
+
+        tamanho = self.cache._caminho('e0').stat().st_size
+        self.cache.max_tamanho_mb = 2.5 * tamanho / (1024 * 1024)
+        self.assertEqual(self.cache.remover_excedente(), 1)
+        restantes = {p.name.split('.')[0] for p in self.cache.entradas()}
+        self.assertEqual(restantes, {'e0', 'e2'})
+
+    def test_entrada_corrompida_e_descartada(self):
+        chave = self.cache.chave(self.caminho)
+        self.cache.ler(self.caminho)
+        self.cache._caminho(chave).write_bytes(b'corrompido')
+        self.assertIsNone(self.cache.obter(chave))
+        self.assertFalse(self.cache._caminho(chave).exists())
+
+    def test_acerto_removido_antes_do_utime(self):
+        # Outro worker do lote remove a entrada entre a leitura e o utime
+        tabela = _tabela_padrao()
+        self.cache.guardar('e0', tabela)
+        with mock.patch.object(modulo_cache.os, 'utime', side_effect=FileNotFoundError):
+            obtido = self.cache.obter('e0')
+        pd.testing.assert_frame_equal(obtido, tabela)
+
+    def test_tabela_nao_serializavel_nao_e_gravada(self):
+        tabela = pd.DataFrame({'Dados': ['a_1'], 'quando': [pd.Timestamp('2024-01-01')]})
+        tabela['quando'] = tabela['quando'].astype(object)
+        self.assertFalse(self.cache.guardar('datas', tabela))
+        self.assertEqual(self.cache.entradas(), [])
+
+    def test_diretorio_pela_variavel_de_ambiente(self):
+        with mock.patch.dict(os.environ, {Config.Cache.VARIAVEL_DIRETORIO: self.pasta}):
+            self.assertEqual(str(CacheTabelas().diretorio), self.pasta)
+
+    def test_diretorio_padrao_do_usuario(self):
+        # Fora da arvore do pacote (somente leitura em builds instalados)
+        ambiente = {k: v for k, v in os.environ.items()
+                    if k not in (Config.Cache.VARIAVEL_DIRETORIO, 'XDG_CACHE_HOME')}
+        with mock.patch.dict(os.environ, ambiente, clear=True), \
+                mock.patch('sys.platform', 'linux'):
+            self.assertEqual(Config.Cache.diretorio(),
+                             Path.home() / '.cache' / 'scalc')
+            self.assertNotIn(Config.PROJECT_ROOT, Config.Cache.diretorio().parents)
+        with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': self.pasta}), \
+                mock.patch('sys.platform', 'linux'):
+            os.environ.pop(Config.Cache.VARIAVEL_DIRETORIO, None)
+            self.assertEqual(Config.Cache.diretorio(), Path(self.pasta) / 'scalc')
+        with mock.patch.dict(os.environ, {'LOCALAPPDATA': self.pasta}), \
+                mock.patch('sys.platform', 'win32'):
+            os.environ.pop(Config.Cache.VARIAVEL_DIRETORIO, None)
+            self.assertEqual(Config.Cache.diretorio(), Path(self.pasta) / 'scalc' / 'cache')
+
+
+class TestLerTabelaComCache(unittest.TestCase):
+    """Testes para cache.ler_tabela() e entrada.carregar_tabela(usar_cache=...)."""
+
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+        self.ambiente = mock.patch.dict(
+            os.environ, {Config.Cache.VARIAVEL_DIRETORIO: os.path.join(self.pasta, 'cache')}
+        )
+        self.ambiente.start()
+        self.caminho = os.path.join(self.pasta, 'dados.csv')
+        pd.DataFrame({
+            'Dados': ['a_1', 'a_2', 'b_1', 'b_2'],
+            'I_err': [0.1, 0.1, 0.2, 0.2],
+            '1':     [1.0, 2.0, 2.0, 4.0],
+        }).to_csv(self.caminho, index=False)
+
+    def tearDown(self):
+        self.ambiente.stop()
+        shutil.rmtree(self.pasta, ignore_errors=True)
+
+    def test_carregar_tabela_usa_cache(self):
+        carregar_tabela(self.caminho)
+        self.assertEqual(len(CacheTabelas().entradas()), 1)
+
+    def test_sem_cache(self):
+        carregar_tabela(self.caminho, usar_cache=False)
+        self.assertEqual(CacheTabelas().entradas(), [])
+
+    def test_desabilitado_na_configuracao(self):
+        with mock.patch.object(Config.Cache, 'HABILITADO', False):
+            modulo_cache.ler_tabela(self.caminho)
+        self.assertEqual(CacheTabelas().entradas(), [])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
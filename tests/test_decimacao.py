@@ -0,0 +1,117 @@
+"""
+Testes para a decimacao por pixel (decimacao.py).
+
+decimar(x, y, erros_x, erros_y, xlim, largura_px) -> (x, y, ex, ey), ex/ey (2, m)
+BarrasErroLOD(ax).definir_dados(...)             -> errorbar decimado, refeito no zoom
+"""
+
+import unittest
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from src.visualization.decimacao import BarrasErroLOD, decimar
+
+
+def _serie(n=100_000, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(0.0, 1000.0, n)
+    y = 2.0 * x + rng.normal(0.0, 30.0, n)
+    return x, y, rng.uniform(0.0, 0.5, n), rng.uniform(0.0, 5.0, n)
+
+
+class TestDecimar(unittest.TestCase):
+    """Testes para decimar()."""
+
+    def test_serie_pequena_intacta(self):
+        x, y = np.arange(10.0), np.arange(10.0) ** 2
+        xd, yd, ex, ey = decimar(x, y, 0.1, [0.2] * 10, largura_px=100)
+        np.testing.assert_array_equal(xd, x)
+        np.testing.assert_array_equal(yd, y)
+        self.assertEqual(ex.shape, (2, 10))
+        np.testing.assert_array_equal(ey, 0.2)
+
+    def test_no_maximo_dois_pontos_por_pixel(self):
+        xd, _, _, _ = decimar(*_serie(), largura_px=500, limiar=0)
+        self.assertLessEqual(xd.size, 2 * 500)
+        self.assertGreater(xd.size, 500)
+
+    def test_envelope_preservado(self):
+        x, y, ex, ey = _serie()
+        xd, yd, exd, eyd = decimar(x, y, ex, ey, largura_px=300, limiar=0)
+        self.assertAlmostEqual((yd - eyd[0]).min(), (y - ey).min())
+        self.assertAlmostEqual((yd + eyd[1]).max(), (y + ey).max())
+        self.assertAlmostEqual((xd - exd[0]).min(), (x - ex).min())
+        self.assertAlmostEqual((xd + exd[1]).max(), (x + ex).max())
+        self.assertTrue((exd >= 0).all() and (eyd >= 0).all())
+        # Extremos de Y sao pontos reais da serie
+        self.assertIn(yd.max(), y)
+        self.assertEqual(yd.max(), y.max())
+
+    def test_envelope_por_coluna(self):
+        x, y, ex, ey = _serie(20_000)
+        largura = 50
+        xd, yd, _, eyd = decimar(x, y, ex, ey, xlim=(0.0, 1000.0),
+                                 largura_px=largura, limiar=0)
+        coluna = np.clip((x * largura / 1000.0).astype(int), 0, largura - 1)
+        coluna_d = np.clip((xd * largura / 1000.0).astype(int), 0, largura - 1)
+        for c in (0, 17, largura - 1):
+            self.assertAlmostEqual((yd + eyd[1])[coluna_d == c].max(),
+                                   (y + ey)[coluna == c].max())
+            self.assertAlmostEqual((yd - eyd[0])[coluna_d == c].min(),
+                                   (y - ey)[coluna == c].min())
+
+    def test_fora_da_faixa_descartado(self):
+        x, y, ex, ey = _serie(10_000)
+        xd, _, exd, _ = decimar(x, y, ex, ey, xlim=(100.0, 200.0), largura_px=100)
+        self.assertTrue(((xd + exd[1] >= 100.0) & (xd - exd[0] <= 200.0)).all())
+        self.assertEqual(xd.size, ((x + ex >= 100.0) & (x - ex <= 200.0)).sum())
+
+
+class TestBarrasErroLOD(unittest.TestCase):
+    """Testes para BarrasErroLOD."""
+
+    def setUp(self):
+        self.figura = Figure(figsize=(4, 3), dpi=100)
+        FigureCanvasAgg(self.figura)
+        self.ax = self.figura.add_subplot(111)
+        self.barras = BarrasErroLOD(self.ax, fmt='o', capsize=3)
+
+    def test_zoom_refaz_decimacao(self):
+        x, y, ex, ey = _serie()
+        self.ax.set_xlim(0.0, 1000.0)
+        self.barras.definir_dados(x, y, ex, ey)
+        largura = self.ax.get_window_extent().width
+        self.assertLessEqual(self.barras.n_desenhados, 2 * largura)
+
+        self.ax.set_xlim(500.0, 501.0)          # ~100 pontos visiveis
+        visiveis = ((x + ex >= 500.0) & (x - ex <= 501.0)).sum()
+        self.assertEqual(self.barras.n_desenhados, visiveis)
+        pontos = self.barras.barras.lines[0]
+        self.assertEqual(len(pontos.get_xdata()), visiveis)
+        self.figura.canvas.draw()
+
+    def test_desenho_igual_ao_errorbar(self):
+        x, y, ex, ey = _serie(200)
+
+        def pixels(ax, figura):
+            ax.set_xlim(-10.0, 1010.0)
+            ax.set_ylim(-200.0, 2200.0)
+            figura.canvas.draw()
+            return np.asarray(figura.canvas.buffer_rgba()).copy()
+
+        referencia = Figure(figsize=(4, 3), dpi=100)
+        FigureCanvasAgg(referencia)
+        ax = referencia.add_subplot(111)
+        ax.errorbar(x, y, xerr=ex, yerr=ey, fmt='o', capsize=3)
+        self.barras.definir_dados(x, y, ex, ey)
+        np.testing.assert_array_equal(pixels(self.ax, self.figura), pixels(ax, referencia))
+
+    def test_envelope(self):
+        self.barras.definir_dados([1.0, 3.0], [2.0, 5.0], 0.5, [[1.0, 0.0], [0.0, 2.0]])
+        self.assertEqual(self.barras.envelope(), ((0.5, 3.5), (1.0, 7.0)))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,414 @@
+"""
+Testes para a interface (gui.py e tarefas.py).
+
+Rodam com Qt offscreen; sao ignorados se o PySide6 nao estiver instalado.
+
+MplCanvas.mostrar(x, y, ex, ey, titulo, rotulo_x, rotulo_y, reta=...) -> latencia (ms)
+MplCanvas.modo_redesenho -> 'completo' (draw) ou 'blit' (fundo em cache)
+Tarefa(funcao, ...)      -> QRunnable com sinais progresso/concluida/falhou/cancelada
+"""
+
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+from matplotlib.backend_bases import MouseEvent
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+try:
+    from PySide6.QtCore import QThreadPool, QTimer
+    from PySide6.QtWidgets import QApplication
+except ImportError:                         # pragma: no cover
+    QApplication = None
+
+
+def _esperar(app, condicao, limite_s=5.0) -> bool:
+    """Processa eventos ate `condicao()` ou ate o limite de tempo."""
+    fim = time.monotonic() + limite_s
+    while not condicao() and time.monotonic() < fim:
+        app.processEvents()
+        time.sleep(0.002)
+    app.processEvents()
+    return condicao()
+
+
+@unittest.skipIf(QApplication is None, "PySide6 nao instalado")
+class TestMplCanvas(unittest.TestCase):
+    """Artistas persistentes e redesenho por blitting."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        from src.visualization.gui import MplCanvas
+        self.canvas = MplCanvas(width=6, height=4)
+        self.canvas.show()
+        self.app.processEvents()
+        self.x = np.linspace(0.0, 10.0, 200)
+        self.y = 2.0 * self.x + 1.0
+
+    def tearDown(self):
+        self.canvas.close()
+
+    def _mostrar(self, y=None, titulo='t', reta=(2.0, 1.0, 0.99)):
+        return self.canvas.mostrar(self.x, self.y if y is None else y, 0.05, 0.2,
+                                   titulo, 'x', 'y', reta=reta)
+
+    def test_artistas_persistentes(self):
+        artistas = (self.canvas.lod.barras, self.canvas.reta, self.canvas.equacao)
+        self._mostrar()
+        self._mostrar(titulo='outro', reta=None)
+        self.assertEqual((self.canvas.lod.barras, self.canvas.reta, self.canvas.equacao),
+                         artistas)
+        self.assertEqual(len(self.canvas.axes.lines), 1 + 4 + 1 + 2)   # + eixos do grid vazio
+        self.assertFalse(self.canvas.reta.get_visible())
+
+    def test_blit_quando_nada_muda(self):
+        self._mostrar()
+        self.assertEqual(self.canvas.modo_redesenho, 'completo')
+        latencia = self._mostrar(y=self.y + 0.01, reta=(2.01, 1.0, 0.98))
+        self.assertEqual(self.canvas.modo_redesenho, 'blit')
+        self.assertEqual(self.canvas.latencia_ms, latencia)
+        self.assertIn('2.010', self.canvas.equacao.get_text())
+        np.testing.assert_allclose(self.canvas.lod.barras.lines[0].get_ydata(), self.y + 0.01)
+
+    def test_draw_completo_quando_o_fundo_muda(self):
+        self._mostrar()
+        self._mostrar(titulo='novo titulo')
+        self.assertEqual(self.canvas.modo_redesenho, 'completo')
+        self._mostrar(y=10 * self.y, titulo='novo titulo')     # nao cabe nos limites
+        self.assertEqual(self.canvas.modo_redesenho, 'completo')
+        self.assertGreater(self.canvas.axes.get_ylim()[1], 10 * self.y.max())
+
+    def test_zoom_da_barra_de_navegacao(self):
+        self._mostrar()
+        self.canvas.axes.set_xlim(2.0, 3.0)
+        self._mostrar()
+        self.assertEqual(self.canvas.modo_redesenho, 'completo')
+        self.assertLess(self.canvas.axes.get_xlim()[0], 0.0)
+
+    def test_limpar(self):
+        self._mostrar()
+        self.canvas.limpar()
+        self.assertEqual(self.canvas.lod.n_desenhados, 0)
+        self.assertIsNone(self.canvas.axes.get_legend())
+        self.assertEqual(self.canvas.axes.get_title(), 'Aguardando dados...')
+        self._mostrar()
+        self.assertEqual(self.canvas.modo_redesenho, 'completo')
+
+
+@unittest.skipIf(QApplication is None, "PySide6 nao instalado")
+class TestTarefa(unittest.TestCase):
+    """Execucao em segundo plano com sinais, progresso e cancelamento."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def _executar(self, funcao, cancelar_apos=None):
+        from src.visualization.tarefas import Tarefa
+        tarefa = Tarefa(funcao)
+        eventos = []
+        tarefa.sinais.progresso.connect(lambda f, e: eventos.append(('progresso', f)))
+        tarefa.sinais.concluida.connect(lambda r: eventos.append(('concluida', r)))
+        tarefa.sinais.falhou.connect(lambda e: eventos.append(('falhou', e)))
+        tarefa.sinais.cancelada.connect(lambda: eventos.append(('cancelada', None)))
+        if cancelar_apos is not None:
+            tarefa.sinais.progresso.connect(
+                lambda f, e: tarefa.cancelar() if f >= cancelar_apos else None)
+        QThreadPool.globalInstance().start(tarefa)
+        self.assertTrue(_esperar(self.app, lambda: eventos and eventos[-1][0] != 'progresso'))
+        QThreadPool.globalInstance().waitForDone()
+        return eventos
+
+    def test_concluida(self):
+        def funcao(progresso):
+            progresso(0.5, 'meio')
+            return 42
+        self.assertEqual(self._executar(funcao), [('progresso', 0.5), ('concluida', 42)])
+
+    def test_falhou(self):
+        def funcao(progresso):
+            raise ValueError('ruim')
+        (tipo, erro), = self._executar(funcao)
+        self.assertEqual(tipo, 'falhou')
+        self.assertIsInstance(erro, ValueError)
+
+    def test_cancelamento_cooperativo(self):
+        passos = []
+
+        def funcao(progresso):
+            for i in range(1000):
+                progresso(i / 1000, 'laco')
+                passos.append(i)
+                time.sleep(0.001)
+            return 'nao deveria terminar'
+
+        eventos = self._executar(funcao, cancelar_apos=0.01)
+        self.assertEqual(eventos[-1], ('cancelada', None))
+        self.assertLess(len(passos), 1000)
+        self.assertNotIn('concluida', [tipo for tipo, _ in eventos])
+
+
+@unittest.skipIf(QApplication is None, "PySide6 nao instalado")
+class TestJanelaEmSegundoPlano(unittest.TestCase):
+    """Carregamento lento: a janela continua processando eventos."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        from src.visualization import gui
+        self.gui = gui
+        self.janela = gui.InterfaceRegressaoLinear(usar_cache=False)
+        # Dialogos modais travariam o teste: apenas registra as mensagens
+        self.mensagens = []
+        for nome in ('warning', 'critical'):
+            dialogo = mock.patch.object(gui.QMessageBox, nome,
+                                        side_effect=lambda *a: self.mensagens.append(a[2]))
+            dialogo.start()
+            self.addCleanup(dialogo.stop)
+        self.tabela = pd.DataFrame({
+            'Dados': ['a_1', 'a_2', 'a_3', 'b_1', 'b_2', 'b_3', 'c_1', 'c_2', 'c_3'],
+            'I_err': [0.1] * 9,
+            '1': [1.0, 2.0, 3.0, 2.0, 4.0, 6.0, 3.0, 6.0, 9.0],
+        })
+
+    def tearDown(self):
+        self.janela.close()
+
+    def _carregar_lento(self, duracao_s=0.5):
+        """Substitui carregar_tabela por uma leitura lenta com progresso."""
+        tabela = self.tabela
+
+        def carregar_tabela(caminho, usar_cache=None, progresso=None):
+            passos = 50
+            for i in range(passos):
+                progresso(i / passos, 'Lendo')
+                time.sleep(duracao_s / passos)
+            return tabela
+
+        arquivo = mock.patch.object(self.gui.QFileDialog, 'getOpenFileName',
+                                    return_value=('/tmp/lento.csv', ''))
+        leitura = mock.patch.object(self.gui, 'carregar_tabela', side_effect=carregar_tabela)
+        return arquivo, leitura
+
+    def test_responde_durante_a_carga(self):
+        arquivo, leitura = self._carregar_lento()
+        ticks = []
+        relogio = QTimer()
+        relogio.timeout.connect(lambda: ticks.append(time.monotonic()))
+        relogio.start(10)
+        with arquivo, leitura:
+            self.janela.carregar_arquivo()
+            self.assertIsNotNone(self.janela.tarefa)
+            self.assertFalse(self.janela.btn_carregar.isEnabled())
+            self.assertTrue(_esperar(self.app, lambda: self.janela.tarefa is None))
+        relogio.stop()
+
+        self.assertGreater(len(ticks), 10)                      # o laco de eventos rodou
+        self.assertLess(max(np.diff(ticks)), 0.2)
+        self.assertIs(self.janela.dados_excel, self.janela.analise.tabela)
+        self.assertTrue(self.janela.btn_calcular.isEnabled())
+        self.assertTrue(self.janela.btn_carregar.isEnabled())
+        self.assertFalse(self.janela.barra_progresso.isVisible())
+
+        self.janela.calcular_estatisticas()
+        self.assertTrue(_esperar(self.app, lambda: self.janela.tarefa is None))
+        self.assertEqual(self.janela.combo_var_x.count(), 3)
+        self.janela.calcular_regressao()
+        self.assertTrue(_esperar(self.app, lambda: self.janela.tarefa is None))
+        self.assertAlmostEqual(self.janela.slope, 2.0)
+
+    def _preparar(self):
+        """Carrega a tabela e calcula as estatisticas (sem atraso)."""
+        arquivo, leitura = self._carregar_lento(duracao_s=0.0)
+        with arquivo, leitura:
+            self.janela.carregar_arquivo()
+            _esperar(self.app, lambda: self.janela.tarefa is None)
+        self.janela.calcular_estatisticas()
+        _esperar(self.app, lambda: self.janela.tarefa is None)
+
+    def _selecionar(self, x, y):
+        self.janela.combo_var_x.setCurrentText(x)
+        self.janela.combo_var_y.setCurrentText(y)
+        self.app.processEvents()
+
+    def _aguardar_recalculo(self):
+        return _esperar(self.app, lambda: (not self.janela.timer_recalculo.isActive()
+                                           and not self.janela.tarefas_auto))
+
+    def test_cache_por_prefixo(self):
+        self._preparar()
+        analise = self.janela.analise
+        self.assertEqual(sorted(self.janela.arrays), ['a', 'b', 'c'])
+        self.assertIn('a_2: média = 2.000000', self.janela.texto_estatisticas.toPlainText())
+
+        # Trocar o par, calcular e plotar apenas consulta o cache
+        with mock.patch.object(analise, '_fatiar', side_effect=AssertionError), \
+                mock.patch.object(type(analise.medicoes), 'iterar_prefixo', side_effect=AssertionError):
+            self.janela.combo_var_x.setCurrentText('b')
+            self.janela.combo_var_y.setCurrentText('a')
+            self.janela.calcular_regressao()
+            _esperar(self.app, lambda: self.janela.tarefa is None)
+            self.janela.plotar_grafico()
+        self.assertEqual(self.mensagens, [])
+        self.assertAlmostEqual(self.janela.slope, 0.5)
+        self.assertIs(self.janela.data_x, analise.arrays_prefixo('b')[0])
+
+        # Novo arquivo invalida o cache e o que dependia dele
+        arquivo, leitura = self._carregar_lento(duracao_s=0.0)
+        with arquivo, leitura:
+            self.janela.carregar_arquivo()
+            _esperar(self.app, lambda: self.janela.tarefa is None)
+        self.assertEqual(self.janela.arrays, {})
+        self.assertIsNone(self.janela.slope)
+        self.assertEqual(self.janela.combo_var_x.count(), 0)
+        self.assertFalse(self.janela.btn_regressao.isEnabled())
+
+    def test_ao_vivo_com_debounce(self):
+        self._preparar()
+        self.assertTrue(self._aguardar_recalculo())         # primeiro par, sem cliques
+        self.assertAlmostEqual(self.janela.slope, 2.0)
+        self.assertTrue(self.janela.canvas.reta.get_visible())
+
+        regressao = mock.patch.object(self.janela, '_regressao_par',
+                                      wraps=self.janela._regressao_par)
+        with regressao as chamadas:
+            for x, y in [('b', 'a'), ('c', 'a'), ('a', 'c')]:   # trocas em sequencia
+                self._selecionar(x, y)
+            self.assertTrue(self._aguardar_recalculo())
+        self.assertEqual([c.args for c in chamadas.call_args_list], [('a', 'c')])
+        self.assertAlmostEqual(self.janela.slope, 3.0)
+        self.assertIn('X: a   |   Y: c', self.janela.texto_resultados.toPlainText())
+        np.testing.assert_allclose(self.janela.canvas.lod.barras.lines[0].get_ydata(),
+                                   [3.0, 6.0, 9.0])
+        self.assertEqual(self.mensagens, [])
+
+    def test_resultado_obsoleto_descartado(self):
+        self._preparar()
+        self._aguardar_recalculo()
+        original = self.janela._extrair_dados_xy
+        liberar = threading.Event()
+
+        def extrair(prefixo_x, prefixo_y):
+            if (prefixo_x, prefixo_y) == ('b', 'a'):
+                liberar.wait(5.0)                           # ainda calculando...
+            return original(prefixo_x, prefixo_y)
+
+        aplicados = mock.patch.object(self.janela, '_ao_calcular_regressao',
+                                      wraps=self.janela._ao_calcular_regressao)
+        with mock.patch.object(self.janela, '_extrair_dados_xy', side_effect=extrair), \
+                aplicados as aplicados:
+            self._selecionar('b', 'a')
+            self.janela.recalcular_ao_vivo()                # dispara sem esperar o timer
+            self._selecionar('b', 'c')                      # ...e a selecao muda
+            liberar.set()
+            self.assertTrue(self._aguardar_recalculo())
+        self.assertEqual([c.args[:2] for c in aplicados.call_args_list], [('b', 'c')])
+        self.assertAlmostEqual(self.janela.slope, 1.5)
+
+    def test_regressao_nao_escreve_na_analise(self):
+        # A tarefa (outra thread) devolve ajuste e indice; a thread principal os guarda
+        self._preparar()
+        self.assertTrue(self._aguardar_recalculo())
+        analise = self.janela.analise
+        self.assertEqual(analise._regressoes, {})
+        self.assertEqual(analise._indices, {})
+        self.assertEqual(len(self.janela.indice_par), 3)
+        self.assertEqual(self.janela.ajuste_completo,
+                         (self.janela.slope, self.janela.intercept, self.janela.r_squared))
+
+    def test_recalculo_adiado_por_tarefa(self):
+        self._preparar()
+        self._aguardar_recalculo()
+        liberar = threading.Event()
+        self.janela._iniciar_tarefa(lambda progresso=None: liberar.wait(5.0),
+                                    ao_concluir=lambda _: None, ao_falhar=lambda _: None)
+        self._selecionar('b', 'a')
+        self.assertTrue(self._aguardar_recalculo())         # debounce vence durante a tarefa
+        self.assertTrue(self.janela.recalculo_pendente)
+        self.assertIsNone(self.janela.slope)
+
+        liberar.set()
+        self.assertTrue(_esperar(self.app, lambda: self.janela.tarefa is None))
+        self.assertTrue(self._aguardar_recalculo())
+        self.assertFalse(self.janela.recalculo_pendente)
+        self.assertAlmostEqual(self.janela.slope, 0.5)
+        self.assertIn('X: b   |   Y: a', self.janela.texto_resultados.toPlainText())
+
+    def test_ao_vivo_desligado(self):
+        self._preparar()
+        self._aguardar_recalculo()
+        self.janela.check_ao_vivo.setChecked(False)
+        self._selecionar('c', 'b')
+        self.assertFalse(self.janela.timer_recalculo.isActive())
+        self.assertIsNone(self.janela.slope)
+
+    def _mouse(self, nome, x_dado):
+        canvas = self.janela.canvas
+        x, y = canvas.axes.transData.transform((x_dado, np.mean(canvas.axes.get_ylim())))
+        MouseEvent(nome, canvas, x, y, button=1)._process()
+
+    def test_ajuste_por_faixa(self):
+        # Regime linear ate x = 9, patamar de inclinacao 0.5 depois
+        x = np.arange(20.0)
+        y = np.where(x < 10, 2.0 * x, 20.0 + 0.5 * (x - 10))
+        self.tabela = pd.DataFrame({
+            'Dados': [f'a_{i}' for i in range(20)] + [f'b_{i}' for i in range(20)],
+            'I_err': 0.1,
+            '1': np.concatenate([x, y]),
+        })
+        self._preparar()
+        self.assertTrue(self._aguardar_recalculo())
+        completo = self.janela.slope
+        canvas = self.janela.canvas
+
+        self._mouse('button_press_event', -0.5)                 # arraste sobre o regime linear
+        self._mouse('motion_notify_event', 5.0)
+        self._mouse('motion_notify_event', 9.5)
+        self._mouse('button_release_event', 9.5)
+        self.assertAlmostEqual(self.janela.slope, 2.0)
+        self.assertEqual(canvas.modo_redesenho, 'blit')
+        self.assertTrue(canvas.faixa.get_visible())
+        np.testing.assert_allclose(canvas.reta.get_xdata(), self.janela.faixa_ajuste)
+        self.assertIn('Faixa de x', self.janela.texto_resultados.toPlainText())
+
+        self._mouse('button_press_event', 3.0)                  # clique: ajuste completo
+        self._mouse('button_release_event', 3.0)
+        self.assertAlmostEqual(self.janela.slope, completo)
+        self.assertIsNone(self.janela.faixa_ajuste)
+        self.assertFalse(canvas.faixa.get_visible())
+
+        canvas.axes.set_xlim(9.5, 19.5)                         # zoom da barra de navegacao
+        self.assertAlmostEqual(self.janela.slope, 0.5)
+
+        self._mouse('button_press_event', 12.2)                 # nenhum ponto na faixa
+        self._mouse('button_release_event', 12.8)
+        self.assertFalse(canvas.reta.get_visible())
+        self.assertIn('Faixa sem ajuste', self.janela.status_label.text())
+        self.assertEqual(self.mensagens, [])
+
+    def test_cancelar_carga(self):
+        arquivo, leitura = self._carregar_lento(duracao_s=5.0)
+        with arquivo, leitura:
+            self.janela.carregar_arquivo()
+            _esperar(self.app, lambda: self.janela.barra_progresso.value() > 0)
+            inicio = time.monotonic()
+            self.janela.cancelar_tarefa()
+            self.assertTrue(_esperar(self.app, lambda: self.janela.tarefa is None))
+        self.assertLess(time.monotonic() - inicio, 1.0)
+        self.assertIsNone(self.janela.analise)
+        self.assertFalse(self.janela.btn_calcular.isEnabled())
+        self.assertIn('cancelada', self.janela.status_label.text())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
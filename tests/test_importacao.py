@@ -0,0 +1,68 @@
+"""
+Testes de importacao preguicosa (src/__init__.py, src/core, src/visualization
+e scalc.py).
+
+Cada teste roda um interpretador novo, ja que sys.modules do processo de
+testes ja contem pandas/matplotlib importados por outros testes.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _modulos_apos(codigo: str) -> set:
+    """Nomes de nivel mais alto em sys.modules apos executar `codigo`."""
+    saida = subprocess.run(
+        [sys.executable, '-c',
+         codigo + "\nimport sys; print(' '.join(sorted({m.split('.')[0] for m in sys.modules})))"],
+        capture_output=True, text=True, cwd=RAIZ, check=True,
+    )
+    return set(saida.stdout.split())
+
+
+class TestImportacaoPreguicosa(unittest.TestCase):
+    """Importar o pacote ou o scalc.py nao carrega dependencias pesadas."""
+
+    PESADOS = {'pandas', 'numpy', 'matplotlib', 'PySide6'}
+
+    def test_importar_scalc(self):
+        self.assertFalse(_modulos_apos('import scalc') & self.PESADOS)
+
+    def test_importar_pacote(self):
+        self.assertFalse(_modulos_apos('import src, src.core, src.visualization') & self.PESADOS)
+
+    def test_atributos_sob_demanda(self):
+        modulos = _modulos_apos(
+            'import src.core\n'
+            'assert src.core.Analise.__name__ == "Analise"\n'
+            'assert "Analise" in dir(src.core)'
+        )
+        self.assertIn('pandas', modulos)
+        self.assertNotIn('matplotlib', modulos)
+
+        modulos = _modulos_apos(
+            'import src\n'
+            'assert src.PlotarGrafico.__module__ == "src.visualization.plots"'
+        )
+        self.assertIn('matplotlib', modulos)
+        self.assertNotIn('PySide6', modulos)
+
+    def test_saida_nao_importa_core(self):
+        # A camada de dados so compartilha as colunas (src.data.colunas)
+        _modulos_apos(
+            'import sys, src.data.saida\n'
+            'assert not [m for m in sys.modules if m.startswith("src.core")], sys.modules'
+        )
+
+    def test_atributo_inexistente(self):
+        import src.core
+        with self.assertRaises(AttributeError):
+            src.core.NaoExiste
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,276 @@
+"""
+Testes para os leitores de arquivos de entrada (src/data/leitores.py).
+
+ler_excel(caminho, tamanho_bloco) -> pd.DataFrame
+    Deve produzir o mesmo DataFrame que pd.read_excel(caminho).
+ler_tabela(caminho) -> pd.DataFrame
+    Despacha pela extensao (Excel, CSV, Parquet, Feather, .npz).
+"""
+
+import os
+import re
+import shutil
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+from src.core import Analise
+from src.core.exceptions import ArquivoInvalidoException, OperacaoCancelada
+from src.data import leitores
+from src.data.config import Config
+from src.data.entrada import carregar_tabela
+from src.data.leitores import filtro_dialogo, leitor_para, ler_excel, ler_tabela
+from src.utils.validador import ValidadorDados
+
+
+class TestLerExcel(unittest.TestCase):
+    """Testes para a funcao ler_excel()."""
+
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.pasta, ignore_errors=True)
+
+    def _salvar(self, linhas, nome='dados.xlsx'):
+        livro = openpyxl.Workbook()
+        planilha = livro.active
+        for linha in linhas:
+            planilha.append(list(linha))
+        caminho = os.path.join(self.pasta, nome)
+        livro.save(caminho)
+        return caminho
+
+    def _comparar(self, caminho, tamanho_bloco=3):
+        esperado = pd.read_excel(caminho)
+        obtido = ler_excel(caminho, tamanho_bloco=tamanho_bloco)
+        pd.testing.assert_frame_equal(obtido, esperado)
+        return obtido
+
+    # ------------------------------------------------------------------ #
+    #  Equivalencia com pd.read_excel                                    #
+    # ------------------------------------------------------------------ #
+
+    def test_tabela_padrao(self):
+        rng = np.random.default_rng(0)
+        linhas = [['Dados', 'I_err', '1', '2', '3']]
+        for i in range(20):
+            linhas.append([f"{'ab'[i % 2]}_{i // 2 + 1}", 0.1, *rng.normal(5, 1, 3)])
+        self._comparar(self._salvar(linhas))
+
+    def test_independente_do_tamanho_do_bloco(self):
+        linhas = [['Dados', '1']] + [[f"a_{i}", i * 0.5] for i in range(17)]
+        caminho = self._salvar(linhas)
+        for bloco in (1, 2, 16, 17, 1000):
+            self._comparar(caminho, tamanho_bloco=bloco)
+
+    def test_progresso(self):
+        linhas = [['Dados', '1']] + [[f"a_{i}", i * 0.5] for i in range(20)]
+        caminho = self._salvar(linhas)
+        fracoes = []
+        obtido = ler_excel(caminho, tamanho_bloco=4,
+                           progresso=lambda fracao, etapa: fracoes.append(fracao))
+        pd.testing.assert_frame_equal(obtido, pd.read_excel(caminho))
+        self.assertEqual(fracoes[0], 0.0)
+        self.assertEqual(fracoes[-1], 1.0)
+        self.assertGreater(len(fracoes), 5)                     # um por bloco
+        self.assertEqual(fracoes, sorted(fracoes))
+
+    def test_cancelamento(self):
+        caminho = self._salvar([['Dados', '1']] + [[f"a_{i}", i] for i in range(20)])
+        chamadas = []
+
+        def progresso(fracao, etapa):
+            chamadas.append(fracao)
+            if len(chamadas) == 2:
+                raise OperacaoCancelada(etapa)
+
+        with self.assertRaises(OperacaoCancelada):
+            ler_excel(caminho, tamanho_bloco=4, progresso=progresso)
+        self.assertEqual(len(chamadas), 2)
+
+    def test_linhas_vazias_e_colunas_finais(self):
+        linhas = [
+            ['Dados', '1', None],
+            ['a_1', 1.5, None],
+            [None, None, None],          # linha vazia intermediaria: mantida
+            ['a_2', 2.5, None],
+            [None, None, None],          # linhas vazias finais: descartadas
+            [None, None, None],
+        ]
+        obtido = self._comparar(self._salvar(linhas))
+        self.assertEqual(len(obtido), 3)
+        self.assertEqual(list(obtido.columns), ['Dados', '1'])
+
+    def test_cabecalhos_duplicados_e_sem_nome(self):
+        linhas = [
+            ['Dados', 'a', None, 'a'],
+            ['a_1', 1.0, 2.0, 3.0],
+        ]
+        obtido = self._comparar(self._salvar(linhas))
+        self.assertEqual(list(obtido.columns), ['Dados', 'a', 'Unnamed: 2', 'a.1'])
+
+    def test_colunas_inteiras_e_mistas(self):
+        linhas = [
+            ['Dados', 'inteiros', 'mista'],
+            ['a_1', 1, 1.5],
+            ['a_2', 2, 'x'],
+        ]
+        obtido = self._comparar(self._salvar(linhas))
+        self.assertEqual(obtido['inteiros'].dtype, np.int64)
+        self.assertEqual(obtido['mista'].dtype, object)
+
+    def test_linhas_mais_largas_que_o_cabecalho(self):
+        linhas = [
+            ['Dados', 'I_err', '1'],
+            ['a_1', 0.1, 1.0],
+            ['a_2', 0.1, 2.0, 2.5, None, 'x'],   # celulas alem do cabecalho
+            ['a_3', 0.1, 3.0],
+        ]
+        caminho = self._salvar(linhas)
+        # Sem <dimension>, o openpyxl devolve as linhas com larguras diferentes
+        irregular = os.path.join(self.pasta, 'irregular.xlsx')
+        with zipfile.ZipFile(caminho) as origem, zipfile.ZipFile(irregular, 'w') as destino:
+            for item in origem.infolist():
+                conteudo = origem.read(item.filename)
+                if item.filename.startswith('xl/worksheets/'):
+                    conteudo = re.sub(rb'<dimension ref="[^"]*" ?/>', b'', conteudo)
+                destino.writestr(item, conteudo)
+
+        for bloco in (1, 2, 1000):
+            obtido = self._comparar(irregular, tamanho_bloco=bloco)
+        self.assertEqual(list(obtido.columns),
+                         ['Dados', 'I_err', '1', 'Unnamed: 3', 'Unnamed: 4', 'Unnamed: 5'])
+
+    def test_somente_cabecalho(self):
+        obtido = ler_excel(self._salvar([['Dados', '1']]))
+        self.assertTrue(obtido.empty)
+        self.assertEqual(list(obtido.columns), ['Dados', '1'])
+
+    # ------------------------------------------------------------------ #
+    #  Integracao com o pipeline                                          #
+    # ------------------------------------------------------------------ #
+
+    def test_analise_de_tabela_carregada(self):
+        linhas = [['Dados', 'I_err', '1', '2']]
+        linhas += [[f"a_{i}", 0.1, float(i), i + 0.2] for i in range(1, 4)]
+        linhas += [[f"b_{i}", 0.1, 2.0 * i, 2 * i + 0.4] for i in range(1, 4)]
+        caminho = self._salvar(linhas)
+
+        via_streaming = Analise(carregar_tabela(caminho, usar_cache=False)).estatisticas
+        via_pandas = Analise(pd.read_excel(caminho)).estatisticas
+        pd.testing.assert_frame_equal(via_streaming, via_pandas)
+
+
+def _tabela_padrao():
+    """Grupos a e b = 2a, duas repeticoes, no layout de particionar()."""
+    return pd.DataFrame({
+        'Dados': ['a_1', 'a_2', 'a_3', 'b_1', 'b_2', 'b_3'],
+        'I_err': [0.1, 0.1, 0.1, 0.2, 0.2, 0.2],
+        '1':     [1.0, 2.0, 3.0, 2.0, 4.0, 6.0],
+        '2':     [1.2, 2.2, 3.2, 2.4, 4.4, 6.4],
+    })
+
+
+class TestLerTabela(unittest.TestCase):
+    """Testes para o registro de leitores e ler_tabela()."""
+
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+        self.tabela = _tabela_padrao()
+
+    def tearDown(self):
+        shutil.rmtree(self.pasta, ignore_errors=True)
+
+    def _caminho(self, nome):
+        return os.path.join(self.pasta, nome)
+
+    def test_csv(self):
+        caminho = self._caminho('dados.csv')
+        self.tabela.to_csv(caminho, index=False)
+        pd.testing.assert_frame_equal(ler_tabela(caminho), self.tabela)
+
+    def test_csv_com_progresso(self):
+        caminho = self._caminho('dados.csv')
+        self.tabela.to_csv(caminho, index=False)
+        fracoes = []
+        with mock.patch.object(Config.Leitura, 'TAMANHO_BLOCO_CSV', 2):
+            obtido = ler_tabela(caminho, progresso=lambda f, e: fracoes.append(f))
+        pd.testing.assert_frame_equal(obtido, self.tabela)
+        self.assertEqual((fracoes[0], fracoes[-1]), (0.0, 1.0))
+        self.assertGreaterEqual(len(fracoes), 4)                # 3 blocos de 2 linhas
+
+    def test_progresso_em_leitor_sem_suporte(self):
+        caminho = self._caminho('dados.npz')
+        np.savez(caminho, Dados=np.array(['a_1', 'a_2']), valores=np.ones((2, 2)))
+        chamadas = []
+        ler_tabela(caminho, progresso=lambda fracao, etapa: chamadas.append((fracao, etapa)))
+        self.assertEqual(chamadas, [(0.0, 'Lendo Arquivos NumPy'), (1.0, 'Lendo Arquivos NumPy')])
+
+    def test_npz_com_matriz_de_valores(self):
+        caminho = self._caminho('dados.npz')
+        np.savez(
+            caminho,
+            Dados=self.tabela['Dados'].to_numpy(dtype=str),
+            I_err=self.tabela['I_err'].to_numpy(),
+            valores=self.tabela[['1', '2']].to_numpy(),
+        )
+        obtido = ler_tabela(caminho)
+        self.assertEqual(list(obtido.columns), ['Dados', 'I_err', '1', '2'])
+        pd.testing.assert_frame_equal(obtido, self.tabela, check_dtype=False)
+
+    def test_npz_com_tamanhos_diferentes(self):
+        caminho = self._caminho('dados.npz')
+        np.savez(caminho, Dados=np.array(['a_1', 'a_2']), valores=np.ones((3, 2)))
+        with self.assertRaises(ArquivoInvalidoException):
+            ler_tabela(caminho)
+
+    def test_mesmo_resultado_em_todos_os_formatos(self):
+        esperado = Analise(self.tabela).estatisticas
+        caminho_csv = self._caminho('dados.csv')
+        self.tabela.to_csv(caminho_csv, index=False)
+        caminho_xlsx = self._caminho('dados.xlsx')
+        self.tabela.to_excel(caminho_xlsx, index=False)
+        for caminho in (caminho_csv, caminho_xlsx):
+            obtido = Analise(carregar_tabela(caminho, usar_cache=False)).estatisticas
+            pd.testing.assert_frame_equal(obtido, esperado)
+
+    @unittest.skipUnless(leitores._disponivel('pyarrow'), "pyarrow nao instalado")
+    def test_parquet_e_feather(self):
+        for nome, escrever in (('dados.parquet', self.tabela.to_parquet),
+                               ('dados.feather', self.tabela.to_feather)):
+            caminho = self._caminho(nome)
+            escrever(caminho)
+            pd.testing.assert_frame_equal(ler_tabela(caminho), self.tabela)
+
+    def test_extensao_nao_suportada(self):
+        with self.assertRaises(ArquivoInvalidoException):
+            leitor_para('dados.txt')
+
+    def test_extensao_sem_diferenciar_maiusculas(self):
+        self.assertEqual(leitor_para('DADOS.CSV').formato, 'csv')
+
+    def test_dependencia_ausente(self):
+        with mock.patch.object(leitores, '_disponivel', return_value=False):
+            self.assertNotIn('*.parquet', filtro_dialogo())
+            self.assertIn('*.csv', filtro_dialogo())
+            with self.assertRaises(ArquivoInvalidoException):
+                ler_tabela(self._caminho('dados.parquet'))
+
+    def test_limite_de_tamanho_por_formato(self):
+        caminho = self._caminho('dados.csv')
+        self.tabela.to_csv(caminho, index=False)
+        limites = dict(Config.Leitura.MAX_TAMANHO_MB, csv=0)
+        with mock.patch.object(Config.Leitura, 'MAX_TAMANHO_MB', limites):
+            with self.assertRaises(ArquivoInvalidoException):
+                ValidadorDados.validar_arquivo_entrada(caminho)
+        self.assertTrue(ValidadorDados.validar_arquivo_entrada(caminho))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,101 @@
+"""
+Testes para o processamento em lote (lote.py).
+
+listar_arquivos(alvo)                 -> arquivos de entrada de um diretorio/glob
+processar_arquivo(caminho)            -> linha do resumo (nunca levanta excecao)
+processar_lote(arquivos, workers)     -> pd.DataFrame com uma linha por arquivo
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from functools import partial
+
+import pandas as pd
+
+from src.app.lote import (
+    COLUNAS_RESUMO,
+    listar_arquivos,
+    processar_arquivo,
+    processar_lote,
+)
+from src.visualization.plots import exportar_par
+
+
+def _tabela(fator):
+    """Grupos a (X) e b = fator * a (Y)."""
+    return pd.DataFrame({
+        'Dados': ['a_1', 'a_2', 'a_3', 'b_1', 'b_2', 'b_3'],
+        'I_err': [0.1] * 6,
+        '1':     [1.0, 2.0, 3.0, fator * 1.0, fator * 2.0, fator * 3.0],
+    })
+
+
+class TestLote(unittest.TestCase):
+    """Testes para o modulo lote."""
+
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+        self.arquivos = []
+        for i in range(4):
+            caminho = os.path.join(self.pasta, f'dados_{i}.csv')
+            _tabela(i + 1).to_csv(caminho, index=False)
+            self.arquivos.append(caminho)
+        self.ruim = os.path.join(self.pasta, 'ruim.csv')
+        pd.DataFrame({'x': ['a'], 'y': ['b']}).to_csv(self.ruim, index=False)
+        with open(os.path.join(self.pasta, 'notas.txt'), 'w') as arquivo:
+            arquivo.write('ignorado')
+
+    def tearDown(self):
+        shutil.rmtree(self.pasta, ignore_errors=True)
+
+    def test_listar_diretorio_ignora_extensoes_desconhecidas(self):
+        self.assertEqual(listar_arquivos(self.pasta), sorted(self.arquivos + [self.ruim]))
+
+    def test_listar_glob(self):
+        alvo = os.path.join(self.pasta, 'dados_*.csv')
+        self.assertEqual(listar_arquivos(alvo), self.arquivos)
+
+    def test_processar_arquivo(self):
+        linha = processar_arquivo(self.arquivos[1], usar_cache=False)
+        self.assertEqual(linha['status'], 'ok')
+        self.assertEqual((linha['prefixo_x'], linha['prefixo_y']), ('a', 'b'))
+        self.assertAlmostEqual(linha['slope'], 2.0, places=10)
+        self.assertEqual(linha['n_pontos'], 3)
+
+    def test_falha_isolada_por_arquivo(self):
+        linha = processar_arquivo(self.ruim, usar_cache=False)
+        self.assertEqual(linha['status'], 'erro')
+        self.assertIn('Exception', linha['erro'])
+
+    def test_exportar_no_worker(self):
+        pasta = os.path.join(self.pasta, 'figuras')
+        exportar = partial(exportar_par, pasta=pasta, formatos=['png', 'svg'])
+        resumo = processar_lote(self.arquivos[:2] + [self.ruim], workers=2,
+                                usar_cache=False, exportar=exportar)
+        self.assertEqual(list(resumo['status']), ['ok', 'ok', 'erro'])
+        self.assertEqual(
+            resumo['figuras'][0],
+            f"{os.path.join(pasta, 'dados_0.png')};{os.path.join(pasta, 'dados_0.svg')}",
+        )
+        self.assertEqual(sorted(os.listdir(pasta)),
+                         ['dados_0.png', 'dados_0.svg', 'dados_1.png', 'dados_1.svg'])
+
+    def test_pool_igual_ao_serial(self):
+        arquivos = self.arquivos + [self.ruim, os.path.join(self.pasta, 'inexistente.csv')]
+        serial = processar_lote(arquivos, workers=1, usar_cache=False)
+        paralelo = processar_lote(arquivos, workers=2, usar_cache=False)
+
+        self.assertEqual(list(paralelo.columns), COLUNAS_RESUMO)
+        self.assertEqual(list(paralelo['arquivo']), arquivos)
+        self.assertEqual(list(paralelo['status']), ['ok'] * 4 + ['erro'] * 2)
+        colunas = ['status', 'slope', 'intercept', 'r_squared', 'n_pontos']
+        pd.testing.assert_frame_equal(paralelo[colunas], serial[colunas])
+        self.assertEqual(
+            [round(s, 10) for s in paralelo['slope'][:4]], [1.0, 2.0, 3.0, 4.0]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,84 @@
+"""
+Testes para o container colunar TabelaMedicoes (medicoes.py).
+
+particionar_medicoes(tabela) -> TabelaMedicoes
+    valores  : float64 contiguo com todas as repeticoes
+    offsets  : inicio de cada chave em valores (formato CSR)
+    chaves   : agrupadas por prefixo, ordem alfabetica dentro do grupo
+"""
+
+import math
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.core import TabelaMedicoes, particionar, particionar_medicoes
+
+
+def _df_padrao():
+    """Dois grupos (a, b), tres repeticoes, linhas fora de ordem."""
+    return pd.DataFrame({
+        'Dados': ['a_2', 'a_1', 'b_1', 'b_2'],
+        'I_err': [0.10,  0.10,  0.20,  None],
+        '1':     [2.0,   1.0,   2.0,   4.0],
+        '2':     [2.1,   1.1,   2.1,   None],
+        '3':     [1.9,   0.9,   1.9,   3.9],
+    })
+
+
+class TestTabelaMedicoes(unittest.TestCase):
+    """Testes para TabelaMedicoes e particionar_medicoes()."""
+
+    def setUp(self):
+        self.medicoes = particionar_medicoes(_df_padrao())
+
+    def test_valores_contiguos_float64(self):
+        valores = self.medicoes.valores
+        self.assertEqual(valores.dtype, np.float64)
+        self.assertTrue(valores.flags['C_CONTIGUOUS'])
+        self.assertEqual(self.medicoes.n_medicoes, 11)
+
+    def test_chaves_ordenadas_por_prefixo(self):
+        self.assertEqual(self.medicoes.prefixos, ['a', 'b'])
+        self.assertEqual(list(self.medicoes.chaves), ['a_1', 'a_2', 'b_1', 'b_2'])
+
+    def test_offsets_csr(self):
+        self.assertEqual(self.medicoes.offsets.tolist(), [0, 3, 6, 9, 11])
+        self.assertEqual(self.medicoes.contagens.tolist(), [3, 3, 3, 2])
+
+    def test_valores_chave_e_view(self):
+        fatia = self.medicoes.valores_chave(3)
+        self.assertEqual(fatia.tolist(), [4.0, 3.9])
+        self.assertTrue(np.shares_memory(fatia, self.medicoes.valores))
+
+    def test_faixa_prefixo(self):
+        self.assertEqual(self.medicoes.faixa_prefixo('b'), slice(2, 4))
+        with self.assertRaises(KeyError):
+            self.medicoes.faixa_prefixo('z')
+
+    def test_erros_instrumentais(self):
+        erros = self.medicoes.erros_instrumentais
+        self.assertAlmostEqual(erros[0], 0.10, places=9)
+        self.assertTrue(math.isnan(erros[3]))
+
+    def test_oito_bytes_por_medicao(self):
+        self.assertEqual(self.medicoes.valores.nbytes, 8 * self.medicoes.n_medicoes)
+
+    def test_para_dicionarios_igual_a_particionar(self):
+        db, ei, keys = self.medicoes.para_dicionarios()
+        db_ref, ei_ref, keys_ref = particionar(_df_padrao())
+        self.assertEqual(db, db_ref)
+        self.assertEqual(keys, keys_ref)
+        self.assertEqual(ei['a'], ei_ref['a'])
+
+    def test_offsets_inconsistentes_levantam_erro(self):
+        with self.assertRaises(ValueError):
+            TabelaMedicoes(
+                valores=np.zeros(3), offsets=[0, 2], chaves=['a_1'],
+                codigos_prefixo=[0], prefixos=['a'], erros_instrumentais=[0.1],
+            )
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
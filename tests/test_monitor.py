@@ -0,0 +1,109 @@
+"""
+Testes para o monitoramento incremental de pasta (monitor.py).
+
+MonitorPasta(diretorio, resultados, arquivo_estado, espera_estavel)
+    ciclo() -> linhas de resultado dos arquivos novos ou alterados
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from src.app import monitor as modulo_monitor
+from src.app.monitor import MonitorPasta
+
+
+def _salvar(caminho, fator):
+    pd.DataFrame({
+        'Dados': ['a_1', 'a_2', 'a_3', 'b_1', 'b_2', 'b_3'],
+        'I_err': [0.1] * 6,
+        '1':     [1.0, 2.0, 3.0, fator * 1.0, fator * 2.0, fator * 3.0],
+    }).to_csv(caminho, index=False)
+
+
+class TestMonitorPasta(unittest.TestCase):
+    """Testes para a classe MonitorPasta."""
+
+    def setUp(self):
+        self.raiz = tempfile.mkdtemp()
+        self.pasta = os.path.join(self.raiz, 'entrada')
+        os.mkdir(self.pasta)
+        self.resultados = os.path.join(self.raiz, 'resultados.csv')
+        _salvar(os.path.join(self.pasta, 'um.csv'), 2.0)
+        _salvar(os.path.join(self.pasta, 'dois.csv'), 3.0)
+
+    def tearDown(self):
+        shutil.rmtree(self.raiz, ignore_errors=True)
+
+    def _monitor(self, **kwargs):
+        kwargs.setdefault('espera_estavel', 0.0)
+        return MonitorPasta(self.pasta, resultados=self.resultados,
+                            usar_cache=False, **kwargs)
+
+    def _tocar(self, nome):
+        caminho = os.path.join(self.pasta, nome)
+        passado = time.time() - 10
+        os.utime(caminho, (passado, passado))
+
+    def test_processa_novos_uma_unica_vez(self):
+        monitor = self._monitor()
+        novos = monitor.ciclo()
+        self.assertEqual(sorted(os.path.basename(l['arquivo']) for l in novos),
+                         ['dois.csv', 'um.csv'])
+        self.assertEqual(monitor.ciclo(), [])
+        self.assertEqual(len(pd.read_csv(self.resultados)), 2)
+
+    def test_ignora_ocultos_e_extensoes_desconhecidas(self):
+        with open(os.path.join(self.pasta, 'notas.txt'), 'w') as arquivo:
+            arquivo.write('x')
+        _salvar(os.path.join(self.pasta, '~$um.csv'), 2.0)
+        self.assertEqual(len(self._monitor().ciclo()), 2)
+
+    def test_arquivo_alterado_e_reprocessado(self):
+        monitor = self._monitor()
+        monitor.ciclo()
+        _salvar(os.path.join(self.pasta, 'um.csv'), 5.0)
+        self._tocar('um.csv')
+        novos = monitor.ciclo()
+        self.assertEqual(len(novos), 1)
+        self.assertAlmostEqual(novos[0]['slope'], 5.0, places=10)
+
+    def test_tocado_sem_alteracao_nao_e_reprocessado(self):
+        monitor = self._monitor()
+        monitor.ciclo()
+        self._tocar('um.csv')
+        with mock.patch.object(modulo_monitor, 'processar_arquivo') as processar:
+            self.assertEqual(monitor.ciclo(), [])
+        processar.assert_not_called()
+
+    def test_sem_stat_alterado_nao_le_conteudo(self):
+        monitor = self._monitor()
+        monitor.ciclo()
+        with mock.patch.object(modulo_monitor, 'hash_arquivo') as hash_arquivo:
+            monitor.ciclo()
+        hash_arquivo.assert_not_called()
+
+    def test_reinicio_nao_reprocessa(self):
+        self._monitor().ciclo()
+        self.assertEqual(self._monitor().ciclo(), [])
+
+    def test_arquivo_em_escrita_espera(self):
+        monitor = self._monitor(espera_estavel=60.0)
+        self.assertEqual(monitor.ciclo(), [])
+
+    def test_removido_sai_do_estado(self):
+        monitor = self._monitor()
+        monitor.ciclo()
+        os.remove(os.path.join(self.pasta, 'dois.csv'))
+        monitor.ciclo()
+        self.assertEqual(set(monitor.estado), {'um.csv'})
+        self.assertEqual(set(self._monitor().estado), {'um.csv'})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,191 @@
+"""
+Testes para a exportacao de graficos fora da tela (plots.py).
+
+exportar_grafico(x, y, erros_x, erros_y, slope, intercept, destino, formatos)
+    -> arquivos '<destino>.<formato>' renderizados pelo backend Agg
+exportar_graficos(tarefas, workers) -> arquivos por tarefa (pool de processos)
+ModeloFigura / obter_modelo()        -> figura reutilizada entre exportacoes
+limites_eixo(minimo, maximo)         -> limites com margem proporcional a faixa
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import matplotlib.image
+import numpy as np
+
+from src.data.config import Config
+from src.visualization import plots
+from src.visualization.plots import (
+    exportar_grafico,
+    exportar_graficos,
+    limites_eixo,
+    limpar_modelos,
+    obter_modelo,
+    validar_formatos,
+)
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _tarefa(destino, fator=2.0):
+    x = np.array([1.0, 2.0, 3.0, 4.0])
+    return dict(x=x, y=fator * x + 1.0, erros_x=[0.1] * 4, erros_y=[0.2] * 4,
+                slope=fator, intercept=1.0, destino=destino)
+
+
+class TestExportarGrafico(unittest.TestCase):
+    """Testes para exportar_grafico() e exportar_graficos()."""
+
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.pasta, ignore_errors=True)
+
+    def test_formatos(self):
+        destino = os.path.join(self.pasta, 'sub', 'grafico')
+        arquivos = exportar_grafico(**_tarefa(destino), formatos=['png', 'svg', 'pdf'])
+        self.assertEqual(arquivos, [destino + '.png', destino + '.svg', destino + '.pdf'])
+        with open(destino + '.png', 'rb') as arquivo:
+            self.assertEqual(arquivo.read(8), b'\x89PNG\r\n\x1a\n')
+        with open(destino + '.svg', encoding='utf-8') as arquivo:
+            self.assertIn('<svg', arquivo.read())
+        with open(destino + '.pdf', 'rb') as arquivo:
+            self.assertEqual(arquivo.read(4), b'%PDF')
+
+    def test_validar_formatos(self):
+        self.assertEqual(validar_formatos(['PNG', '.svg', 'png']), ['png', 'svg'])
+        with self.assertRaises(ValueError):
+            validar_formatos(['gif'])
+        with self.assertRaises(ValueError):
+            validar_formatos([])
+
+    def test_pool_na_ordem_de_entrada(self):
+        tarefas = [_tarefa(os.path.join(self.pasta, f'g{i}'), fator=i + 1) for i in range(3)]
+        for tarefa in tarefas:
+            tarefa['formatos'] = ['png']
+        arquivos = exportar_graficos(tarefas, workers=2)
+        self.assertEqual(arquivos, [[os.path.join(self.pasta, f'g{i}.png')] for i in range(3)])
+        self.assertTrue(all(os.path.getsize(a[0]) > 0 for a in arquivos))
+
+    def test_nao_importa_pyplot(self):
+        codigo = (
+            "import sys\n"
+            "from src.visualization.plots import exportar_grafico\n"
+            f"exportar_grafico([1, 2], [2, 4], [0, 0], [0, 0], 2.0, 0.0, "
+            f"{os.path.join(self.pasta, 'g')!r})\n"
+            "assert 'matplotlib.pyplot' not in sys.modules\n"
+            "assert 'PySide6' not in sys.modules"
+        )
+        saida = subprocess.run([sys.executable, '-c', codigo], cwd=RAIZ,
+                               capture_output=True, text=True)
+        self.assertEqual(saida.returncode, 0, saida.stderr)
+
+
+class TestModeloFigura(unittest.TestCase):
+    """O modelo em cache gera o mesmo grafico que uma figura nova."""
+
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+        limpar_modelos()
+
+    def tearDown(self):
+        limpar_modelos()
+        shutil.rmtree(self.pasta, ignore_errors=True)
+
+    def _png(self, nome, **tarefa):
+        destino = os.path.join(self.pasta, nome)
+        exportar_grafico(**_tarefa(destino, **tarefa))
+        return matplotlib.image.imread(destino + '.png')
+
+    def test_figura_reutilizada(self):
+        modelo = obter_modelo()
+        self._png('a')
+        self._png('b', fator=3.0)
+        self.assertIs(obter_modelo(), modelo)
+        self.assertEqual(len(modelo.ax.lines), 1 + 4 + 1)      # pontos, capas, reta
+        self.assertEqual(len(modelo.ax.collections), 2)        # barras x e y
+
+    def test_reuso_igual_a_figura_nova(self):
+        self._png('outro', fator=-1.0)                         # modelo ja usado
+        reutilizada = self._png('reutilizada')
+        limpar_modelos()
+        nova = self._png('nova')
+        np.testing.assert_array_equal(reutilizada, nova)
+
+    def test_barras_de_erro_atualizadas(self):
+        modelo = obter_modelo()
+        x = np.array([1.0, 2.0])
+        modelo.atualizar(x, [3.0, 4.0], [0.1, 0.2], 0.5, 1.0, 2.0, 'x', 'y', 't')
+        _, capas, (linhas_x, linhas_y) = modelo.barras.lines
+        # Um caminho por direcao (barras separadas por NaN, omitidos aqui)
+        barras_x = linhas_x.get_segments()[0].reshape(-1, 2, 2)
+        barras_y = linhas_y.get_segments()[0].reshape(-1, 2, 2)
+        np.testing.assert_allclose(barras_x[1], [[1.8, 4.0], [2.2, 4.0]])
+        np.testing.assert_allclose(barras_y[0], [[1.0, 2.5], [1.0, 3.5]])
+        np.testing.assert_allclose(capas[3].get_ydata(), [3.5, 4.5])
+        self.assertEqual(modelo.ax.get_title(), 't')
+
+    def test_plotar_grafico_fecha_a_figura(self):
+        import matplotlib.pyplot as plt
+        with mock.patch.object(plt, 'show') as mostrar:
+            plots.PlotarGrafico({(1.0, 2.0), (2.0, 4.0)}, [0.1, 0.1], [0.1, 0.1],
+                                'x', 'y', 2.0, 0.0, 'titulo')
+        mostrar.assert_called_once()
+        self.assertEqual(plt.get_fignums(), [])
+
+    def test_plotar_grafico_mostra_com_o_estilo(self):
+        # Artistas recriados durante show() (zoom, decimacao) usam o rcParams
+        # vigente: o estilo deve continuar ativo ate a janela fechar
+        import matplotlib
+        import matplotlib.pyplot as plt
+        estilo = matplotlib.style.library[Config.Plot.STYLE]
+        vigente = {}
+        with mock.patch.object(plt, 'show', side_effect=lambda: vigente.update(
+                {chave: matplotlib.rcParams[chave] for chave in estilo})):
+            plots.PlotarGrafico({(1.0, 2.0), (2.0, 4.0)}, [0.1, 0.1], [0.1, 0.1],
+                                'x', 'y', 2.0, 0.0, 'titulo')
+        self.assertEqual(vigente['axes.grid'], estilo['axes.grid'])
+        self.assertEqual(vigente['xtick.major.size'], estilo['xtick.major.size'])
+
+
+class TestEixos(unittest.TestCase):
+    """Limites e ticks independentes da escala dos dados."""
+
+    def test_limites_eixo(self):
+        self.assertEqual(limites_eixo(0.0, 10.0, margem=0.1), (-1.0, 11.0))
+        inferior, superior = limites_eixo(-20.0, -10.0)
+        self.assertLess(inferior, -20.0)
+        self.assertGreater(superior, -10.0)
+        self.assertEqual(limites_eixo(5.0, 5.0, margem=0.1), (4.5, 5.5))
+        self.assertEqual(limites_eixo(0.0, 0.0, margem=0.1), (-0.1, 0.1))
+
+    def test_ticks_limitados_em_qualquer_escala(self):
+        base = np.linspace(1.0, 10.0, 25)
+        modelo = obter_modelo()
+        for escala in (1e-6, 1.0, 1e6, 1e9):
+            x, y = base * escala, (2 * base + 1) * escala
+            modelo.atualizar(x, y, 0.01 * escala, 0.01 * escala, 2.0, escala,
+                             'x', 'y', 't')
+            for eixo, dados in ((modelo.ax.xaxis, x), (modelo.ax.yaxis, y)):
+                ticks = eixo.get_major_locator()()
+                self.assertLessEqual(len(ticks), Config.Plot.MAX_TICKS + 2)
+                inferior, superior = eixo.get_view_interval()
+                self.assertLess(inferior, dados.min())
+                self.assertGreater(superior, dados.max())
+
+    def test_reta_de_borda_a_borda(self):
+        modelo = obter_modelo()
+        modelo.atualizar([1.0, 2.0, 3.0], [2.0, 4.0, 6.0], 0.1, 0.1, 2.0, 0.0,
+                         'x', 'y', 't')
+        np.testing.assert_allclose(modelo.reta.get_xdata(), modelo.ax.get_xlim())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
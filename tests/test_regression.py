@@ -10,7 +10,11 @@ RegLin(x, y) -> (slope, intercept, r_squared)
 import unittest
 import math
 import numpy as np
-from src.core import RegLin
+import pandas as pd
+from scipy.optimize import curve_fit, minimize
+
+from src.core import IndiceRegressao, RegLin, RegLinPonderada, regressao_todos_pares
+from src.core.exceptions import RegressaoException
 
 
 class TestRegLin(unittest.TestCase):
@@ -124,6 +128,233 @@ class TestRegLin(unittest.TestCase):
         self.assertGreaterEqual(r_squared, 0.0)
         self.assertLessEqual(r_squared,    1.0)
 
+    # ------------------------------------------------------------------ #
+    #  Casos degenerados                                                   #
+    # ------------------------------------------------------------------ #
+
+    def test_x_constante_levanta_excecao(self):
+        with self.assertRaises(RegressaoException):
+            RegLin([1.0, 1.0, 1.0], [1.0, 2.0, 3.0])
+
+    def test_y_constante_r2_zero(self):
+        slope, intercept, r_squared = RegLin([1.0, 2.0, 3.0], [5.0, 5.0, 5.0])
+        self.assertAlmostEqual(slope, 0.0, places=12)
+        self.assertAlmostEqual(intercept, 5.0, places=12)
+        self.assertEqual(r_squared, 0.0)
+
+    def test_tamanhos_diferentes_levantam_excecao(self):
+        with self.assertRaises(RegressaoException):
+            RegLin([1.0, 2.0, 3.0], [1.0, 2.0])
+
+
+class TestRegLinLote(unittest.TestCase):
+    """Testes para RegLin com pilhas 2-D (uma serie por linha)."""
+
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.x = rng.uniform(0, 10, size=(50, 8))
+        self.y = 1.5 * self.x - 2.0 + rng.normal(0, 0.5, size=(50, 8))
+
+    def test_retorna_arrays_por_serie(self):
+        slope, intercept, r_squared = RegLin(self.x, self.y)
+        for arr in (slope, intercept, r_squared):
+            self.assertIsInstance(arr, np.ndarray)
+            self.assertEqual(arr.shape, (50,))
+
+    def test_lote_igual_a_series_individuais(self):
+        slope, intercept, r_squared = RegLin(self.x, self.y)
+        for i in range(len(self.x)):
+            s_i, b_i, r2_i = RegLin(self.x[i], self.y[i])
+            self.assertAlmostEqual(slope[i],     s_i,  places=12)
+            self.assertAlmostEqual(intercept[i], b_i,  places=12)
+            self.assertAlmostEqual(r_squared[i], r2_i, places=12)
+
+    def test_serie_com_x_constante_vira_nan(self):
+        x = self.x[:3].copy()
+        x[1] = 4.0
+        slope, _, r_squared = RegLin(x, self.y[:3])
+        self.assertTrue(math.isnan(slope[1]))
+        self.assertTrue(math.isnan(r_squared[1]))
+        self.assertFalse(math.isnan(slope[0]))
+
+
+class TestRegressaoTodosPares(unittest.TestCase):
+    """Testes para regressao_todos_pares()."""
+
+    def setUp(self):
+        rng = np.random.default_rng(11)
+        self.medias = {p: rng.uniform(0, 10, size=7) for p in 'abcde'}
+
+    def test_numero_de_pares(self):
+        tabela = regressao_todos_pares(self.medias)
+        self.assertEqual(len(tabela), 5 * 4)
+        self.assertEqual(
+            list(tabela.columns),
+            ['X', 'Y', 'slope', 'intercept', 'r_squared', 'n'],
+        )
+
+    def test_igual_a_reglin_par_a_par(self):
+        tabela = regressao_todos_pares(self.medias)
+        for linha in tabela.itertuples():
+            slope, intercept, r2 = RegLin(self.medias[linha.X], self.medias[linha.Y])
+            self.assertAlmostEqual(linha.slope,     slope,     places=10)
+            self.assertAlmostEqual(linha.intercept, intercept, places=10)
+            self.assertAlmostEqual(linha.r_squared, r2,        places=10)
+
+    def test_tamanhos_diferentes_nao_sao_pareados(self):
+        self.medias['z'] = np.arange(3.0)
+        tabela = regressao_todos_pares(self.medias)
+        self.assertNotIn('z', set(tabela['X']) | set(tabela['Y']))
+
+    def test_x_constante_vira_nan(self):
+        self.medias['k'] = np.full(7, 2.0)
+        tabela = regressao_todos_pares(self.medias)
+        linhas_k = tabela[tabela['X'] == 'k']
+        self.assertTrue(linhas_k['slope'].isna().all())
+        self.assertTrue((tabela[tabela['Y'] == 'k']['r_squared'] == 0.0).all())
+
+    def test_sem_pares(self):
+        tabela = regressao_todos_pares({'a': np.arange(4.0)})
+        self.assertIsInstance(tabela, pd.DataFrame)
+        self.assertTrue(tabela.empty)
+
+
+
+class TestRegLinPonderada(unittest.TestCase):
+    """Minimos quadrados ponderados (erros em y) e ajuste de York (x e y)."""
+
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.erros_y = rng.uniform(0.1, 0.5, 25)
+        self.erros_x = rng.uniform(0.05, 0.3, 25)
+        self.x = np.linspace(0.0, 10.0, 25) + rng.normal(0.0, self.erros_x)
+        self.y = 2.0 * np.linspace(0.0, 10.0, 25) + 1.0 + rng.normal(0.0, self.erros_y)
+
+    def test_wls_igual_a_curve_fit(self):
+        slope, intercept, _, erro_slope, erro_intercept, chi2 = RegLinPonderada(
+            self.x, self.y, self.erros_y
+        )
+        params, cov = curve_fit(lambda x, a, b: a * x + b, self.x, self.y,
+                                sigma=self.erros_y, absolute_sigma=True)
+        np.testing.assert_allclose((slope, intercept), params, rtol=1e-6)
+        np.testing.assert_allclose((erro_slope, erro_intercept),
+                                   np.sqrt(np.diag(cov)), rtol=1e-6)
+        residuos = (self.y - slope * self.x - intercept) / self.erros_y
+        self.assertAlmostEqual(chi2, np.sum(residuos ** 2) / 23)
+
+    def test_erros_iguais_reproduzem_reglin(self):
+        slope, intercept, r2, *_ = RegLinPonderada(self.x, self.y, 0.3)
+        np.testing.assert_allclose((slope, intercept, r2), RegLin(self.x, self.y), rtol=1e-10)
+
+    def test_york_minimiza_distancia_ponderada(self):
+        slope, intercept, _, erro_slope, _, chi2 = RegLinPonderada(
+            self.x, self.y, self.erros_y, self.erros_x
+        )
+
+        def objetivo(p):
+            # Soma das distancias ponderadas dos pontos a reta (York/ODR)
+            return np.sum((self.y - p[0] * self.x - p[1]) ** 2
+                          / (self.erros_y ** 2 + p[0] ** 2 * self.erros_x ** 2))
+
+        ref = minimize(objetivo, [1.0, 0.0], method='Nelder-Mead',
+                       options={'xatol': 1e-10, 'fatol': 1e-12, 'maxiter': 10_000})
+        np.testing.assert_allclose((slope, intercept), ref.x, rtol=1e-6)
+        self.assertAlmostEqual(chi2, objetivo([slope, intercept]) / 23)
+        self.assertGreater(erro_slope, RegLinPonderada(self.x, self.y, self.erros_y)[3])
+
+    def test_york_simetrico_em_x_e_y(self):
+        slope = RegLinPonderada(self.x, self.y, self.erros_y, self.erros_x)[0]
+        inverso = RegLinPonderada(self.y, self.x, self.erros_x, self.erros_y)[0]
+        self.assertAlmostEqual(slope * inverso, 1.0, places=10)
+
+    def test_york_sem_erros_em_x_e_wls(self):
+        np.testing.assert_allclose(RegLinPonderada(self.x, self.y, self.erros_y, 0.0),
+                                   RegLinPonderada(self.x, self.y, self.erros_y), rtol=1e-12)
+
+    def test_lote_2d_igual_serie_a_serie(self):
+        x = np.vstack([self.x, self.y, np.ones(25)])
+        y = np.vstack([self.y, self.x, self.y])
+        erros_y = np.vstack([self.erros_y, self.erros_x, self.erros_y])
+        erros_x = np.vstack([self.erros_x, self.erros_y, self.erros_x])
+        lote = RegLinPonderada(x, y, erros_y, erros_x)
+        for i in range(2):
+            np.testing.assert_allclose([v[i] for v in lote],
+                                       RegLinPonderada(x[i], y[i], erros_y[i], erros_x[i]),
+                                       rtol=1e-9)
+        self.assertTrue(all(np.isnan(v[2]) for v in lote))          # x constante
+
+    def test_erros_invalidos(self):
+        for erros_y in (0.0, np.r_[np.nan, np.ones(24)], -1.0):
+            with self.assertRaises(RegressaoException):
+                RegLinPonderada(self.x, self.y, erros_y)
+        with self.assertRaises(RegressaoException):
+            RegLinPonderada(self.x, self.y, np.ones(3))                 # shape
+        with self.assertRaises(RegressaoException):
+            RegLinPonderada(np.ones(5), np.arange(5.0), 1.0)            # x constante
+        slope = RegLinPonderada(np.vstack([self.x, self.x]), np.vstack([self.y, self.y]),
+                                np.vstack([self.erros_y, np.zeros(25)]))[0]
+        self.assertFalse(np.isnan(slope[0]))
+        self.assertTrue(np.isnan(slope[1]))
+
+    def test_dois_pontos(self):
+        slope, intercept, r2, _, _, chi2 = RegLinPonderada([0.0, 1.0], [1.0, 3.0], 0.1)
+        self.assertAlmostEqual(slope, 2.0)
+        self.assertAlmostEqual(intercept, 1.0)
+        self.assertTrue(math.isnan(chi2))
+
+
+class TestIndiceRegressao(unittest.TestCase):
+    """Regressoes por faixa de x a partir de somas acumuladas."""
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.x = rng.permutation(np.linspace(0.0, 50.0, 500))      # fora de ordem
+        self.y = 1.5 * self.x - 4.0 + rng.normal(0.0, 2.0, self.x.size)
+        self.indice = IndiceRegressao(self.x, self.y)
+
+    def test_faixa_igual_a_reglin(self):
+        for x_min, x_max in [(-np.inf, np.inf), (10.0, 20.0), (0.0, 0.3), (49.0, 60.0)]:
+            mascara = (self.x >= x_min) & (self.x <= x_max)
+            np.testing.assert_allclose(self.indice.ajuste(x_min, x_max),
+                                       RegLin(self.x[mascara], self.y[mascara]),
+                                       rtol=1e-9, atol=1e-9)
+
+    def test_faixa_inclusiva(self):
+        i, j = self.indice.faixa(10.0, 20.0)
+        self.assertEqual(j - i, np.count_nonzero((self.x >= 10.0) & (self.x <= 20.0)))
+        self.assertEqual(self.indice.faixa(), (0, 500))
+
+    def test_vetorizado(self):
+        inicios = np.arange(0, 450, 7)
+        slope, intercept, r2 = self.indice.ajuste_indices(inicios, inicios + 50)
+        ordem = np.argsort(self.x)
+        for k in (0, 10, len(inicios) - 1):
+            fatia = ordem[inicios[k]:inicios[k] + 50]
+            np.testing.assert_allclose((slope[k], intercept[k], r2[k]),
+                                       RegLin(self.x[fatia], self.y[fatia]), rtol=1e-9)
+
+    def test_faixas_invalidas(self):
+        with self.assertRaises(RegressaoException):
+            self.indice.ajuste(10.0, 10.05)                     # menos de 2 pontos
+        with self.assertRaises(RegressaoException):
+            IndiceRegressao([1.0, 1.0, 1.0], [1.0, 2.0, 3.0]).ajuste()
+        slope, _, r2 = self.indice.ajuste_indices(np.array([0, 5]), np.array([1, 9]))
+        self.assertTrue(np.isnan(slope[0]) and np.isnan(r2[0]))
+        self.assertFalse(np.isnan(slope[1]))
+
+    def test_deslocamento_grande(self):
+        # Somas brutas de x ~ 1e6 perderiam todos os digitos de Sxx
+        x = 1e6 + np.linspace(0.0, 1.0, 1000)
+        y = 2.0 * x + np.sin(x)
+        mascara = (x >= 1e6 + 0.4) & (x <= 1e6 + 0.5)
+        np.testing.assert_allclose(IndiceRegressao(x, y).ajuste(1e6 + 0.4, 1e6 + 0.5),
+                                   RegLin(x[mascara], y[mascara]), rtol=1e-6)
+
+    def test_ignora_nao_finitos(self):
+        indice = IndiceRegressao([1.0, np.nan, 2.0, 3.0], [2.0, 5.0, 4.0, np.inf])
+        self.assertEqual(len(indice), 2)
+        self.assertAlmostEqual(indice.ajuste()[0], 2.0)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -0,0 +1,206 @@
+"""
+Testes para a serializacao de resultados (src/data/saida.py) e para o modo
+CLI sem grafico (scalc.modo_cli com formato_saida/plotar).
+
+formatar_resultados(estatisticas, regressoes, formato, arquivo) -> str
+    formato: 'json' | 'csv' | 'ndjson'
+"""
+
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+import scalc
+from src.data.saida import (
+    COLUNAS_REGRESSAO,
+    escrever_resultados,
+    formatar_resultados,
+    tabela_regressoes,
+)
+
+
+def _estatisticas():
+    return pd.DataFrame({
+        'Dados': ['a_1', 'a_2', 'b_1', 'b_2'],
+        'Media': [1.0, 2.0, 3.0, 5.0],
+        'S_err': [0.1, 0.1, np.nan, 0.2],
+        'T_err': [0.2, 0.2, 0.3, 0.3],
+    })
+
+
+def _regressoes():
+    return pd.DataFrame({
+        'X': ['a', 'b'], 'Y': ['b', 'a'],
+        'slope': [2.0, np.nan], 'intercept': [1.0, np.nan],
+        'r_squared': [0.999, np.nan], 'n': np.array([2, 2], dtype=np.int64),
+    })
+
+
+class TestFormatarResultados(unittest.TestCase):
+    """Testes para formatar_resultados() e tabela_regressoes()."""
+
+    def test_json(self):
+        documento = json.loads(formatar_resultados(
+            _estatisticas(), _regressoes(), 'json', arquivo='dados.csv'
+        ))
+        self.assertEqual(documento['arquivo'], 'dados.csv')
+        self.assertEqual(len(documento['estatisticas']), 4)
+        self.assertEqual(documento['estatisticas'][0],
+                         {'Dados': 'a_1', 'Media': 1.0, 'S_err': 0.1, 'T_err': 0.2})
+        self.assertIsNone(documento['estatisticas'][2]['S_err'])      # NaN -> null
+        self.assertEqual(documento['regressoes'][0]['qualidade'], 'excelente')
+        self.assertEqual(documento['regressoes'][0]['n'], 2)
+        self.assertIsNone(documento['regressoes'][1]['slope'])
+        self.assertIsNone(documento['regressoes'][1]['qualidade'])
+
+    def test_ndjson(self):
+        linhas = formatar_resultados(_estatisticas(), _regressoes(), 'ndjson').splitlines()
+        registros = [json.loads(linha) for linha in linhas]
+        self.assertEqual([r['tipo'] for r in registros], ['ponto'] * 4 + ['regressao'] * 2)
+        self.assertEqual(registros[4]['X'], 'a')
+
+    def test_csv(self):
+        texto = formatar_resultados(_estatisticas(), _regressoes(), 'csv')
+        tabela = pd.read_csv(io.StringIO(texto))
+        self.assertEqual(len(tabela), 6)
+        pontos = tabela[tabela['tipo'] == 'ponto']
+        np.testing.assert_allclose(pontos['Media'], [1.0, 2.0, 3.0, 5.0])
+        self.assertIn('regressao,,,,,a,b,2.0,1.0,0.999,2,excelente', texto)
+
+    def test_janelas_e_segmentos(self):
+        janelas = pd.DataFrame({
+            'x_inicio': [1.0, 2.0], 'x_fim': [2.0, 3.0], 'slope': [2.0, np.nan],
+            'intercept': [0.0, np.nan], 'r_squared': [1.0, np.nan], 'n': [2, 2],
+        })
+        segmentos = pd.DataFrame({
+            'segmento': [1], 'x_inicio': [1.0], 'x_fim': [3.0], 'slope': [2.0],
+            'intercept': [0.0], 'r_squared': [1.0], 'n': [3], 'sse': [0.0],
+        })
+        documento = json.loads(formatar_resultados(
+            _estatisticas(), _regressoes(), 'json', janelas=janelas, segmentos=segmentos
+        ))
+        self.assertEqual(len(documento['janelas']), 2)
+        self.assertIsNone(documento['janelas'][1]['slope'])
+        self.assertEqual(documento['segmentos'][0]['sse'], 0.0)
+
+        tabela = pd.read_csv(io.StringIO(formatar_resultados(
+            _estatisticas(), _regressoes(), 'csv', segmentos=segmentos
+        )))
+        self.assertEqual(list(tabela.columns[-4:]), ['segmento', 'x_inicio', 'x_fim', 'sse'])
+        self.assertEqual(tabela['tipo'].tolist()[-1], 'segmento')
+
+    def test_regressao_ponderada(self):
+        regressoes = _regressoes().assign(metodo=['wls', 'york'], erro_slope=[0.1, 0.2],
+                                          erro_intercept=[0.3, 0.4], chi2_reduzido=[1.0, 2.0])
+        documento = json.loads(formatar_resultados(_estatisticas(), regressoes, 'json'))
+        self.assertEqual(documento['regressoes'][1]['metodo'], 'york')
+        self.assertEqual(documento['regressoes'][0]['chi2_reduzido'], 1.0)
+        texto = formatar_resultados(_estatisticas(), regressoes, 'csv')
+        self.assertIn('regressao,,,,,a,b,2.0,1.0,0.999,2,excelente,wls,0.1,0.3,1.0', texto)
+
+    def test_formato_desconhecido(self):
+        with self.assertRaises(ValueError):
+            formatar_resultados(_estatisticas(), _regressoes(), 'xml')
+
+    def test_tabela_regressoes(self):
+        tabela = tabela_regressoes(_regressoes())
+        self.assertEqual(list(tabela.columns), COLUNAS_REGRESSAO)
+
+    def test_escrever_em_stdout_e_arquivo(self):
+        saida = io.StringIO()
+        with redirect_stdout(saida):
+            escrever_resultados(_estatisticas(), _regressoes(), 'ndjson')
+        self.assertEqual(len(saida.getvalue().splitlines()), 6)
+
+        pasta = tempfile.mkdtemp()
+        try:
+            destino = os.path.join(pasta, 'r.json')
+            escrever_resultados(_estatisticas(), _regressoes(), 'json', destino=destino)
+            with open(destino, encoding='utf-8') as arquivo:
+                self.assertEqual(len(json.load(arquivo)['regressoes']), 2)
+        finally:
+            shutil.rmtree(pasta, ignore_errors=True)
+
+
+class TestModoCliSemGrafico(unittest.TestCase):
+    """scalc.modo_cli(..., formato_saida=..., plotar=False)."""
+
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+        self.caminho = os.path.join(self.pasta, 'dados.csv')
+        pd.DataFrame({
+            'Dados': ['a_1', 'a_2', 'a_3', 'b_1', 'b_2', 'b_3'],
+            'I_err': [0.1] * 6,
+            '1': [1.0, 2.0, 3.0, 2.0, 4.0, 6.0],
+            '2': [1.0, 2.0, 3.0, 2.0, 4.0, 6.0],
+        }).to_csv(self.caminho, index=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.pasta, ignore_errors=True)
+
+    def test_json_sem_grafico(self):
+        saida = io.StringIO()
+        with mock.patch('src.visualization.plots.PlotarGrafico') as plotar, \
+                redirect_stdout(saida):
+            scalc.modo_cli(self.caminho, usar_cache=False,
+                           formato_saida='json', plotar=False)
+        plotar.assert_not_called()
+        documento = json.loads(saida.getvalue())
+        self.assertEqual(len(documento['estatisticas']), 6)
+        regressao, = documento['regressoes']
+        self.assertEqual((regressao['X'], regressao['Y'], regressao['n']), ('a', 'b', 3))
+        self.assertAlmostEqual(regressao['slope'], 2.0)
+
+    def test_janelas_e_segmentos(self):
+        saida = io.StringIO()
+        with redirect_stdout(saida):
+            scalc.modo_cli(self.caminho, usar_cache=False, formato_saida='ndjson',
+                           plotar=False, janela=2, segmentos='auto')
+        tipos = [json.loads(linha)['tipo'] for linha in saida.getvalue().splitlines()]
+        self.assertEqual(tipos.count('janela'), 2)
+        self.assertEqual(tipos.count('segmento'), 1)
+
+    def test_ponderada(self):
+        saida = io.StringIO()
+        with redirect_stdout(saida):
+            scalc.modo_cli(self.caminho, usar_cache=False, formato_saida='json',
+                           plotar=False, ponderada=True)
+        regressao, = json.loads(saida.getvalue())['regressoes']
+        self.assertEqual(regressao['metodo'], 'york')           # I_err > 0 tambem em x
+        self.assertAlmostEqual(regressao['slope'], 2.0)
+        self.assertIn('erro_slope', regressao)
+
+    def test_todos_pares_em_arquivo(self):
+        destino = os.path.join(self.pasta, 'pares.csv')
+        scalc.modo_cli(self.caminho, todos_pares=True, usar_cache=False,
+                       formato_saida='csv', destino=destino)
+        tabela = pd.read_csv(destino)
+        self.assertEqual((tabela['tipo'] == 'regressao').sum(), 2)
+
+    def test_sem_grafico_nao_importa_matplotlib(self):
+        codigo = (
+            "import sys, scalc\n"
+            f"scalc.modo_cli({self.caminho!r}, usar_cache=False, "
+            "formato_saida='ndjson', plotar=False)\n"
+            "assert 'matplotlib' not in sys.modules"
+        )
+        saida = subprocess.run(
+            [sys.executable, '-c', codigo], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        )
+        self.assertEqual(saida.returncode, 0, saida.stderr)
+        self.assertEqual(len(saida.stdout.splitlines()), 7)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
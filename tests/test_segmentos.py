@@ -0,0 +1,115 @@
+"""
+Testes para a regressao por janelas e por partes (segmentos.py).
+
+regressao_janela(indice, janela, passo)   -> DataFrame, uma linha por janela
+regressao_segmentada(indice, segmentos)   -> DataFrame, uma linha por segmento
+"""
+
+import itertools
+import unittest
+
+import numpy as np
+
+from src.core import IndiceRegressao, RegLin, regressao_janela, regressao_segmentada
+from src.core.exceptions import RegressaoException
+from src.core.segmentos import COLUNAS_JANELA, COLUNAS_SEGMENTO
+
+
+def _tres_regimes(n, ruido=0.05, semente=0):
+    """y = x, depois inclinacao -2, depois 0.5 (quebras em x = 10 e 20)."""
+    rng = np.random.default_rng(semente)
+    x = np.linspace(0.0, 30.0, n)
+    y = np.where(x < 10, x, np.where(x < 20, 10 - 2 * (x - 10), -10 + 0.5 * (x - 20)))
+    return x, y + rng.normal(0.0, ruido, n)
+
+
+def _sse(x, y):
+    slope, intercept, _ = RegLin(x, y)
+    return float(np.sum((y - slope * x - intercept) ** 2))
+
+
+class TestRegressaoJanela(unittest.TestCase):
+    """Testes para regressao_janela()."""
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.x = rng.uniform(0.0, 10.0, 200)
+        self.y = 3.0 * self.x + rng.normal(0.0, 1.0, 200)
+        self.indice = IndiceRegressao(self.x, self.y)
+
+    def test_igual_a_reglin_por_janela(self):
+        tabela = regressao_janela(self.indice, 25, passo=7)
+        self.assertEqual(list(tabela.columns), COLUNAS_JANELA)
+        ordem = np.argsort(self.x, kind='stable')
+        for k, s in enumerate(range(0, 200 - 25 + 1, 7)):
+            janela = ordem[s:s + 25]
+            np.testing.assert_allclose(
+                tabela.loc[k, ['slope', 'intercept', 'r_squared']].to_numpy(float),
+                RegLin(self.x[janela], self.y[janela]), rtol=1e-8, atol=1e-10,
+            )
+        self.assertEqual(len(tabela), len(range(0, 176, 7)))
+        self.assertTrue((tabela['x_inicio'] <= tabela['x_fim']).all())
+
+    def test_janela_invalida(self):
+        for janela, passo in ((1, 1), (201, 1), (10, 0)):
+            with self.assertRaises(RegressaoException):
+                regressao_janela(self.indice, janela, passo)
+
+    def test_x_constante_vira_nan(self):
+        indice = IndiceRegressao([1.0, 1.0, 1.0, 2.0], [1.0, 2.0, 3.0, 4.0])
+        tabela = regressao_janela(indice, 2)
+        self.assertTrue(np.isnan(tabela['slope'][0]))
+        self.assertAlmostEqual(tabela['slope'][2], 1.0)
+
+
+class TestRegressaoSegmentada(unittest.TestCase):
+    """Testes para regressao_segmentada()."""
+
+    def test_otimo_igual_forca_bruta(self):
+        x, y = _tres_regimes(24, ruido=0.3)
+        tabela = regressao_segmentada(IndiceRegressao(x, y), segmentos=3, min_pontos=3)
+        self.assertEqual(list(tabela.columns), COLUNAS_SEGMENTO)
+
+        melhor = min(
+            _sse(x[:i], y[:i]) + _sse(x[i:j], y[i:j]) + _sse(x[j:], y[j:])
+            for i, j in itertools.combinations(range(3, 22), 2) if j - i >= 3
+        )
+        self.assertAlmostEqual(tabela['sse'].sum(), melhor, places=8)
+        self.assertEqual(tabela['n'].sum(), 24)
+
+    def test_escolhe_numero_de_segmentos(self):
+        x, y = _tres_regimes(300)
+        tabela = regressao_segmentada(IndiceRegressao(x, y))
+        self.assertEqual(len(tabela), 3)
+        np.testing.assert_allclose(tabela['slope'], [1.0, -2.0, 0.5], atol=0.02)
+        x, y = _tres_regimes(300)
+        tabela = regressao_segmentada(IndiceRegressao(x, 2.0 * x + 1.0))
+        self.assertEqual(len(tabela), 1)
+
+    def test_grade_com_refinamento(self):
+        x, y = _tres_regimes(2000)
+        indice = IndiceRegressao(x, y)
+        tabela = regressao_segmentada(indice, segmentos=3, max_candidatos=40)
+        np.testing.assert_allclose(tabela['x_fim'][:2], [10.0, 20.0], atol=0.05)
+        exata = regressao_segmentada(indice, segmentos=3, max_candidatos=2000)
+        self.assertAlmostEqual(tabela['sse'].sum(), exata['sse'].sum(), places=8)
+
+    def test_nao_separa_x_repetido(self):
+        x = np.repeat(np.arange(10.0), 3)
+        y = np.where(x < 5, x, 10 - x)
+        tabela = regressao_segmentada(IndiceRegressao(x, y), segmentos=2)
+        self.assertTrue((tabela['n'] % 3 == 0).all())
+        self.assertLess(tabela['x_fim'][0], tabela['x_inicio'][1])
+
+    def test_pontos_insuficientes(self):
+        indice = IndiceRegressao(np.arange(5.0), np.arange(5.0))
+        with self.assertRaises(RegressaoException):
+            regressao_segmentada(indice, segmentos=2, min_pontos=3)
+        with self.assertRaises(RegressaoException):
+            regressao_segmentada(indice, segmentos=0)
+        with self.assertRaises(RegressaoException):
+            regressao_segmentada(indice, min_pontos=6)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
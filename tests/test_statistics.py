@@ -17,9 +17,16 @@ calcular_estatisticas() retorna pd.DataFrame com colunas:
 import math
 import unittest
 
+import numpy as np
 import pandas as pd
 
-from src.core import calcular_estatisticas, particionar
+from src.core import (
+    calcular_estatisticas,
+    calcular_stats_medicoes,
+    calcular_stats_prefixo,
+    particionar,
+    particionar_medicoes,
+)
 from src.core.exceptions import DadosInvalidosException
 
 
@@ -130,6 +137,34 @@ class TestParticionar(unittest.TestCase):
         dados_brutos, _, _ = particionar(df)
         self.assertIn('a', dados_brutos)
 
+    def test_valores_em_ordem_das_repeticoes(self):
+        """As repeticoes de cada chave seguem a ordem das colunas."""
+        dados_brutos, _, _ = particionar(_df_padrao())
+        self.assertEqual(dados_brutos['b']['b_2'], [4.0, 4.1, 3.9])
+        self.assertIsInstance(dados_brutos['b']['b_2'][0], float)
+
+    def test_identificador_repetido_acumula_valores(self):
+        """Linhas com o mesmo identificador sao agrupadas na mesma chave."""
+        df = pd.DataFrame({
+            'Dados': ['a_1', 'a_1', 'b_1'],
+            'I_err': [0.05,  0.07,  0.10],
+            '1':     [1.0,   1.2,   2.0],
+            '2':     [1.1,   1.3,   2.1],
+        })
+        dados_brutos, erros_instr, dados_keys = particionar(df)
+        self.assertEqual(dados_brutos['a']['a_1'], [1.0, 1.2, 1.1, 1.3])
+        self.assertAlmostEqual(erros_instr['a']['a_1'], 0.05, places=9)
+        self.assertEqual(dados_keys['a'], 2)
+
+    def test_chave_sem_erro_instrumental_recebe_nan(self):
+        df = pd.DataFrame({
+            'Dados': ['a_1', 'a_2', 'b_1', 'b_2'],
+            'I_err': [0.05,  0.05,  0.10,  None],
+            '1':     [1.0,   2.0,   2.0,   4.0],
+        })
+        _, erros_instr, _ = particionar(df)
+        self.assertTrue(math.isnan(erros_instr['b']['b_2']))
+
     # -- bug corrigido: independencia de ordem das colunas ------------------ #
 
     def test_ordem_de_colunas_nao_afeta_resultado(self):
@@ -256,6 +291,58 @@ class TestCalcularEstatisticas(unittest.TestCase):
             )
 
 
+# --------------------------------------------------------------------------- #
+#  TestCalcularStatsMedicoes                                                   #
+# --------------------------------------------------------------------------- #
+
+class TestCalcularStatsMedicoes(unittest.TestCase):
+    """Testes para calcular_stats_medicoes()."""
+
+    def test_igual_a_calcular_stats_prefixo(self):
+        df = _df_padrao()
+        dados_brutos, erros_instr, _ = particionar(df)
+        medicoes = particionar_medicoes(df)
+        for prefixo in ('a', 'b'):
+            medias_ref, erros_ref = calcular_stats_prefixo(
+                dados_brutos[prefixo], erros_instr[prefixo]
+            )
+            medias, erros = calcular_stats_medicoes(medicoes, prefixo)
+            for m_ref, m in zip(medias_ref, medias):
+                self.assertAlmostEqual(m_ref, m, places=12)
+            for e_ref, e in zip(erros_ref, erros):
+                self.assertAlmostEqual(e_ref, e, places=12)
+
+    def test_kernel_igual_ao_calculo_direto(self):
+        """O kernel vetorizado reproduz a formula por chave a 1e-12."""
+        rng = np.random.default_rng(7)
+        dados = {
+            f'a_{i}': rng.normal(10.0 ** i, 1.0, size=i + 1).tolist()
+            for i in range(1, 8)
+        }
+        erros = {chave: 0.01 for chave in dados}
+        medias, erros_tot = calcular_stats_prefixo(dados, erros)
+        for chave, media, t_err in zip(sorted(dados), medias, erros_tot):
+            valores = dados[chave]
+            n = len(valores)
+            m = sum(valores) / n
+            s_err = math.sqrt(sum((v - m) ** 2 for v in valores) / (n - 1) / n)
+            self.assertAlmostEqual(media / m, 1.0, places=12)
+            self.assertAlmostEqual(
+                t_err / math.sqrt(s_err ** 2 + 0.01 ** 2), 1.0, places=12
+            )
+
+    def test_chaves_vazias_ignoradas(self):
+        medias, erros = calcular_stats_prefixo(
+            {'a_1': [1.0, 3.0], 'a_2': []}, {'a_1': float('nan')}
+        )
+        self.assertEqual(medias, [2.0])
+        self.assertAlmostEqual(erros[0], 1.0, places=12)
+
+    def test_prefixo_inexistente(self):
+        with self.assertRaises(KeyError):
+            calcular_stats_medicoes(particionar_medicoes(_df_padrao()), 'z')
+
+
 # --------------------------------------------------------------------------- #
 #  Ponto de entrada                                                            #
 # --------------------------------------------------------------------------- #
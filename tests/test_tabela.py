@@ -0,0 +1,84 @@
+"""
+Testes para o modelo da aba Dados (tabela.py).
+
+ModeloTabela(df) -> QAbstractTableModel somente leitura; celulas formatadas
+sob demanda em data(). Sao ignorados se o PySide6 nao estiver instalado.
+"""
+
+import os
+import unittest
+
+import numpy as np
+import pandas as pd
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+try:
+    from PySide6.QtCore import Qt, qInstallMessageHandler
+    from PySide6.QtTest import QAbstractItemModelTester
+    from PySide6.QtWidgets import QApplication
+except ImportError:                         # pragma: no cover
+    QApplication = None
+
+
+@unittest.skipIf(QApplication is None, "PySide6 nao instalado")
+class TestModeloTabela(unittest.TestCase):
+    """Testes para ModeloTabela."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        from src.visualization.tabela import ModeloTabela
+        self.df = pd.DataFrame({
+            'Dados': ['a_1', 'a_2', None],
+            'I_err': [0.1, np.nan, 0.3],
+            1: [1.0, 2.5, 3.0],
+        })
+        self.modelo = ModeloTabela(self.df)
+
+    def _celula(self, linha, coluna, role=Qt.ItemDataRole.DisplayRole):
+        return self.modelo.data(self.modelo.index(linha, coluna), role)
+
+    def test_dimensoes_e_cabecalhos(self):
+        self.assertEqual((self.modelo.rowCount(), self.modelo.columnCount()), (3, 3))
+        horizontal = Qt.Orientation.Horizontal
+        self.assertEqual([self.modelo.headerData(j, horizontal) for j in range(3)],
+                         ['Dados', 'I_err', '1'])
+        self.assertEqual(self.modelo.headerData(0, Qt.Orientation.Vertical), '1')
+
+    def test_celulas(self):
+        self.assertEqual(self._celula(1, 0), 'a_2')
+        self.assertEqual(self._celula(1, 2), '2.5')
+        self.assertEqual(self._celula(0, 1), str(self.df.iloc[0, 1]))
+        self.assertIsNone(self._celula(1, 1))                   # NaN
+        self.assertIsNone(self._celula(2, 0))                   # None
+        self.assertIsNone(self._celula(0, 0, Qt.ItemDataRole.EditRole))
+
+    def test_definir_dados(self):
+        self.modelo.definir_dados(None)
+        self.assertEqual((self.modelo.rowCount(), self.modelo.columnCount()), (0, 0))
+        self.modelo.definir_dados(pd.DataFrame(np.zeros((100_000, 50))))
+        self.assertEqual((self.modelo.rowCount(), self.modelo.columnCount()), (100_000, 50))
+        self.assertEqual(self._celula(99_999, 49), '0.0')
+
+    def test_contrato_do_modelo(self):
+        # O testador do Qt verifica as invariantes de QAbstractItemModel e
+        # reporta violacoes como mensagens de aviso
+        avisos = []
+        anterior = qInstallMessageHandler(lambda _tipo, _ctx, msg: avisos.append(msg))
+        try:
+            testador = QAbstractItemModelTester(
+                self.modelo, QAbstractItemModelTester.FailureReportingMode.Warning
+            )
+            self.modelo.definir_dados(self.df.iloc[:1])
+            self.modelo.definir_dados(None)
+        finally:
+            qInstallMessageHandler(anterior)
+        del testador
+        self.assertEqual(avisos, [])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)